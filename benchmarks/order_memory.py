@@ -0,0 +1,70 @@
+"""
+Measure the memory used per order by the different in-memory representations.
+
+Usage:
+    python -m benchmarks.order_memory [order_count]
+"""
+import sys
+import tracemalloc
+
+from src.constants import OrderType, OrderStatus, OrderPriority
+from src.entities.order import Order
+from src.entities.order_batch import OrderBatch
+
+
+class DictOrder:
+    """Order as it was before __slots__, with a per-instance __dict__."""
+
+    def __init__(self, id, type, amount, flag):
+        self.id = id
+        self.type = type
+        self.amount = amount
+        self.flag = flag
+        self.status = None
+        self.priority = OrderPriority.LOW.value
+
+
+ORDER_TYPES = [order_type.value for order_type in OrderType]
+STATUSES = [OrderStatus.EXPORTED.value, OrderStatus.PROCESSED.value, OrderStatus.COMPLETED.value]
+
+
+def iter_orders(order_class, count):
+    for i in range(count):
+        order = order_class(i, ORDER_TYPES[i % 3], float(i % 500), bool(i % 2))
+        order.status = STATUSES[i % 3]
+        yield order
+
+
+def build_orders(order_class, count):
+    return list(iter_orders(order_class, count))
+
+
+def build_batch(count):
+    # Fed from a generator so the temporary Order objects are not retained
+    return OrderBatch.from_orders(iter_orders(Order, count))
+
+
+def measure(builder, count):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    result = builder(count)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return (after - before) / count
+
+
+def main(count=100_000):
+    rows = [
+        ("Order with __dict__", measure(lambda n: build_orders(DictOrder, n), count)),
+        ("Order with __slots__", measure(lambda n: build_orders(Order, n), count)),
+        ("OrderBatch (columnar)", measure(build_batch, count)),
+    ]
+    print(f"Memory per order ({count} orders)")
+    for name, per_order in rows:
+        print(f"  {name:<24}{per_order:>8.1f} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,264 @@
+"""
+Measure throughput, peak RSS and API call counts of OrderProcessingService.
+
+Every size runs in a fresh process so peak RSS belongs to that size alone.
+
+Usage:
+    python -m benchmarks.order_pipeline [--sizes 1000 100000 1000000] [--latency SECONDS] [--repeat N]
+    python -m benchmarks.order_pipeline --save benchmarks/baseline.json
+    python -m benchmarks.order_pipeline --compare benchmarks/baseline.json [--threshold 0.2]
+
+Baselines are machine specific, record one with --save before comparing against it.
+    python -m benchmarks.order_pipeline --sqlite [--stream-page-size 10000]
+"""
+import argparse
+import bisect
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from src.constants import OrderType, APIResponseStatus
+from src.repositories.order import OrderRepository
+from src.repositories.sqlite_order import SQLiteOrderRepository
+from src.services.api_client import APIClient
+from src.services.order_processing import OrderProcessingService
+from src.utils.response import APIResponse
+from tests.factories.order import OrderFactory
+
+SIZES = (1_000, 100_000, 1_000_000)
+ORDER_TYPES = [order_type.value for order_type in OrderType]
+USER_ID = 1
+
+
+class InMemoryOrderRepository(OrderRepository):
+    """Repository holding the orders of every user in memory."""
+
+    def __init__(self, orders_by_user):
+        self.orders_by_user = orders_by_user
+        self.bulk_update_calls = 0
+        self.updated_orders = 0
+
+    def get_orders_by_user(self, user_id):
+        return list(self.orders_by_user.get(user_id, []))
+
+    def iter_orders_by_user(self, user_id, page_size):
+        return iter(self.orders_by_user.get(user_id, []))
+
+    def get_orders_by_user_page(self, user_id, after_id, page_size):
+        orders = self.orders_by_user.get(user_id, [])
+        start = 0 if after_id is None else bisect.bisect_right(orders, after_id, key=lambda order: order.id)
+        return orders[start:start + page_size]
+
+    def bulk_update_orders(self, orders):
+        self.bulk_update_calls += 1
+        self.updated_orders += len(orders)
+
+
+class CountingSQLiteOrderRepository(SQLiteOrderRepository):
+    """SQLite repository counting its bulk updates like InMemoryOrderRepository."""
+
+    def __init__(self, database):
+        super().__init__(database)
+        self.bulk_update_calls = 0
+        self.updated_orders = 0
+
+    def bulk_update_orders(self, orders):
+        self.bulk_update_calls += 1
+        self.updated_orders += len(orders)
+        return super().bulk_update_orders(orders)
+
+
+def build_repository(orders, sqlite, directory):
+    if not sqlite:
+        return InMemoryOrderRepository({USER_ID: orders})
+
+    repository = CountingSQLiteOrderRepository(os.path.join(directory, "orders.db"))
+    repository.insert_orders(USER_ID, orders)
+    return repository
+
+
+class LatencyAPIClient(APIClient):
+    """API client that sleeps for a fixed latency and counts its calls."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self.batch_calls = 0
+        self._lock = threading.Lock()
+
+    def call_api(self, order_id):
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return APIResponse(status=APIResponseStatus.SUCCESS.value, data=order_id % 100)
+
+    def call_api_batch(self, order_ids):
+        with self._lock:
+            self.batch_calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return {
+            order_id: APIResponse(status=APIResponseStatus.SUCCESS.value, data=order_id % 100)
+            for order_id in order_ids
+        }
+
+
+def generate_orders(count, seed=0):
+    """Mixed A/B/C orders, reproducible for a given seed."""
+    rng = random.Random(seed)
+    return [
+        OrderFactory.create_order(
+            id=i,
+            type=ORDER_TYPES[rng.randrange(3)],
+            amount=round(rng.uniform(1, 500), 2),
+            flag=rng.random() < 0.5
+        )
+        for i in range(count)
+    ]
+
+
+def peak_rss_bytes():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_scenario(count, latency, service_options, repeat, sqlite=False):
+    """Process count orders repeat times and keep the fastest run, the least disturbed by noise."""
+    best = None
+    for _ in range(repeat):
+        orders = generate_orders(count)
+        api_client = LatencyAPIClient(latency)
+
+        working_dir = os.getcwd()
+        with tempfile.TemporaryDirectory() as export_dir:
+            # Loading the SQLite database is not part of the measured run
+            repository = build_repository(orders, sqlite, export_dir)
+            service = OrderProcessingService(api_client, order_repository=repository, **service_options)
+            # Type A exports are written to the working directory
+            os.chdir(export_dir)
+            try:
+                started_at = time.perf_counter()
+                success = service.process_orders(USER_ID)
+                elapsed = time.perf_counter() - started_at
+            finally:
+                os.chdir(working_dir)
+                if sqlite:
+                    repository.close()
+
+        if best is None or elapsed < best["seconds"]:
+            best = {
+                "orders": count,
+                "success": success,
+                "seconds": elapsed,
+                "orders_per_sec": count / elapsed,
+                "api_calls": api_client.calls,
+                "api_batch_calls": api_client.batch_calls,
+                "bulk_update_calls": repository.bulk_update_calls,
+            }
+        del orders, repository, service
+
+    best["peak_rss_bytes"] = peak_rss_bytes()
+    return best
+
+
+def run(sizes, latency, service_options, repeat=3, sqlite=False):
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for count in sizes:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[str(count)] = executor.submit(
+                run_scenario, count, latency, service_options, repeat, sqlite
+            ).result()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return a description of every metric that regressed by more than threshold."""
+    regressions = []
+    for size, current in results.items():
+        reference = baseline.get(size)
+        if reference is None:
+            continue
+        if current["orders_per_sec"] < reference["orders_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{size} orders: {current['orders_per_sec']:.0f} orders/sec, "
+                f"baseline {reference['orders_per_sec']:.0f}"
+            )
+        if current["peak_rss_bytes"] > reference["peak_rss_bytes"] * (1 + threshold):
+            regressions.append(
+                f"{size} orders: peak RSS {current['peak_rss_bytes'] / 2**20:.1f} MiB, "
+                f"baseline {reference['peak_rss_bytes'] / 2**20:.1f} MiB"
+            )
+        for counter in ("api_calls", "api_batch_calls", "bulk_update_calls"):
+            if current[counter] > reference[counter]:
+                regressions.append(f"{size} orders: {current[counter]} {counter}, baseline {reference[counter]}")
+    return regressions
+
+
+def print_results(results):
+    print(f"{'orders':>10}{'orders/sec':>14}{'peak RSS MiB':>14}{'API calls':>11}{'batch calls':>13}")
+    for current in results.values():
+        print(
+            f"{current['orders']:>10}{current['orders_per_sec']:>14.0f}"
+            f"{current['peak_rss_bytes'] / 2**20:>14.1f}{current['api_calls']:>11}{current['api_batch_calls']:>13}"
+        )
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--latency", type=float, default=0.0, help="API latency in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size, the fastest is kept")
+    parser.add_argument("--api-batch-size", type=int)
+    parser.add_argument("--max-api-concurrency", type=int)
+    parser.add_argument("--stream-page-size", type=int)
+    parser.add_argument("--prefetch-pages", action="store_true", help="Fetch the next page while one is processed")
+    parser.add_argument("--sqlite", action="store_true", help="Read and store orders in a SQLite database file")
+    parser.add_argument("--save", metavar="PATH", help="Store the results as the new baseline")
+    parser.add_argument("--compare", metavar="PATH", help="Fail when results regress against this baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed regression ratio (default 0.2)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    service_options = {
+        "api_batch_size": args.api_batch_size,
+        "max_api_concurrency": args.max_api_concurrency,
+        "stream_page_size": args.stream_page_size,
+        "prefetch_pages": args.prefetch_pages,
+    }
+    results = run(args.sizes, args.latency, service_options, args.repeat, args.sqlite)
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+        print(f"Baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.threshold)
+        if regressions:
+            print(f"Regressions beyond {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
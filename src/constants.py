@@ -38,8 +38,34 @@ class Thresholds:
 class CSVHeaders:
     HEADERS = ["ID", "Type", "Amount", "Flag", "Status", "Priority"]
     HIGH_VALUE_NOTE = ["", "", "", "", "Note", "High value order"]
+    # Columnar exports keep the note in a column instead of a separate row
+    NOTE_COLUMN = "Note"
+
+# Type A export formats, valued by file extension
+class ExportFormat(Enum):
+    CSV = "csv"
+    CSV_GZIP = "csv.gz"
+    CSV_ZSTD = "csv.zst"
+    PARQUET = "parquet"
+
+# Subdirectory layout of Type A exports under the export directory
+class ExportSharding(Enum):
+    NONE = "none"
+    # Two levels of hex digits from a hash of the user ID, e.g. "3f/a2"
+    HASH = "hash"
+    # UTC date of the export, e.g. "2024/05/17"
+    DATE = "date"
 
 # API Response Status
 class APIResponseStatus(Enum):
     SUCCESS = "success"
     ERROR = "error"
+
+# Instrumentation stages
+class InstrumentationStages:
+    GET_ORDERS = "get_orders"
+    # Suffixed with the normalized order type, e.g. "handle_order.A"
+    HANDLE_ORDER = "handle_order"
+    EXPORT_FLUSH = "export_flush"
+    API_CALL = "api_call"
+    BULK_UPDATE = "bulk_update"
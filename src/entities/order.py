@@ -1,7 +1,13 @@
 from src.constants import OrderStatus, OrderPriority
 
+# Stored status / priority of an order that was never marked clean
+_NOT_STORED = object()
+
 
 class Order:
+	# Orders are kept in memory by the million, so skip the per-instance __dict__
+	__slots__ = ("id", "type", "amount", "flag", "status", "priority", "_stored_status", "_stored_priority")
+
 	def __init__(self, id: int, type: str, amount: float, flag: bool):
 		self.id = id
 		self.type = type
@@ -9,3 +15,17 @@ class Order:
 		self.flag = flag
 		self.status = None
 		self.priority = OrderPriority.LOW.value
+		self._stored_status = _NOT_STORED
+		self._stored_priority = _NOT_STORED
+
+	def mark_clean(self) -> None:
+		"""
+		Record the current status and priority as the stored ones. Repositories call
+		this after loading an order; until then the order always counts as dirty.
+		"""
+		self._stored_status = self.status
+		self._stored_priority = self.priority
+
+	@property
+	def is_dirty(self) -> bool:
+		return self.status != self._stored_status or self.priority != self._stored_priority
@@ -0,0 +1,110 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.constants import OrderType, OrderStatus, OrderPriority
+from src.entities.order import Order
+
+
+class _CodeTable:
+	"""
+	Map repeated string values to small integer codes.
+	Enum values get fixed codes; values outside the enum (e.g. raw order types
+	with whitespace) are appended on first use so they round-trip unchanged.
+	"""
+
+	MAX_CODES = 256
+
+	def __init__(self, values: Iterable[Optional[str]]):
+		self.values: List[Optional[str]] = []
+		self._codes: Dict[Optional[str], int] = {}
+		for value in values:
+			self.encode(value)
+
+	def encode(self, value: Optional[str]) -> int:
+		code = self._codes.get(value)
+		if code is None:
+			if len(self.values) >= self.MAX_CODES:
+				raise ValueError(f"Too many distinct values, cannot encode {value!r}")
+			code = len(self.values)
+			self.values.append(value)
+			self._codes[value] = code
+
+		return code
+
+	def decode(self, code: int) -> Optional[str]:
+		return self.values[code]
+
+
+class OrderBatch:
+	"""
+	Columnar storage for large numbers of orders.
+
+	Ids, amounts and flags live in array-backed columns; type, status and priority
+	are stored as one-byte codes that map back to the OrderType / OrderStatus /
+	OrderPriority values. Amounts must be numbers and flags are stored as booleans.
+	Order objects are only created on demand by order_at / iteration.
+	"""
+
+	def __init__(self):
+		self.ids = array("q")
+		self.amounts = array("d")
+		self.flags = array("b")
+		self.type_codes = array("B")
+		self.status_codes = array("B")
+		self.priority_codes = array("B")
+		self.types = _CodeTable(order_type.value for order_type in OrderType)
+		self.statuses = _CodeTable([None] + [status.value for status in OrderStatus])
+		self.priorities = _CodeTable(priority.value for priority in OrderPriority)
+
+	@classmethod
+	def from_orders(cls, orders: Iterable[Order]) -> "OrderBatch":
+		batch = cls()
+		for order in orders:
+			batch.append(order)
+
+		return batch
+
+	def append(self, order: Order) -> None:
+		self.ids.append(order.id)
+		self.amounts.append(order.amount)
+		self.flags.append(bool(order.flag))
+		self.type_codes.append(self.types.encode(order.type))
+		self.status_codes.append(self.statuses.encode(order.status))
+		self.priority_codes.append(self.priorities.encode(order.priority))
+
+	def order_at(self, index: int) -> Order:
+		"""
+		Build an Order from the values stored at index
+		Args:
+			index(int): Position in the batch
+
+		Returns:
+			Order: a new Order; changes to it are kept only after store()
+		"""
+		order = Order(
+			id=self.ids[index],
+			type=self.types.decode(self.type_codes[index]),
+			amount=self.amounts[index],
+			flag=bool(self.flags[index])
+		)
+		order.status = self.statuses.decode(self.status_codes[index])
+		order.priority = self.priorities.decode(self.priority_codes[index])
+
+		return order
+
+	def store(self, index: int, order: Order) -> None:
+		"""
+		Write the status and priority of a processed Order back into the batch
+		Args:
+			index(int): Position in the batch
+			order(Order): Order holding the new values
+		"""
+		self.status_codes[index] = self.statuses.encode(order.status)
+		self.priority_codes[index] = self.priorities.encode(order.priority)
+
+	def __len__(self) -> int:
+		return len(self.ids)
+
+	def __iter__(self) -> Iterator[Order]:
+		for index in range(len(self)):
+			yield self.order_at(index)
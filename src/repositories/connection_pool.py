@@ -0,0 +1,248 @@
+import threading
+import time
+
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from src.utils.exceptions import DatabaseException
+from src.utils.metrics import MetricsRegistry
+
+WAIT_TIME_BUCKETS = (0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+def _close_connection(connection: Any) -> None:
+	connection.close()
+
+
+class ConnectionPool:
+	"""
+	Thread-safe pool of database connections, independent of the database driver.
+
+	Connections are created by connect, at most max_size of them, and min_size
+	are kept open even when idle. An idle connection is health checked before it
+	is handed out and replaced when the check fails or raises. Connections idle
+	for longer than idle_timeout are closed, down to min_size, whenever the pool
+	is used. A caller finding all max_size connections in use waits up to
+	acquire_timeout for one to be released and gets a DatabaseException after that.
+	"""
+
+	def __init__(
+		self,
+		connect: Callable[[], Any],
+		min_size: int = 1,
+		max_size: int = 10,
+		acquire_timeout: float = 5.0,
+		idle_timeout: float = 300.0,
+		health_check: Optional[Callable[[Any], Any]] = None,
+		close: Callable[[Any], None] = _close_connection,
+		registry: Optional[MetricsRegistry] = None,
+		prefix: str = "order_db_pool",
+		clock: Callable[[], float] = time.monotonic
+	):
+		"""
+		Args:
+			connect(Callable[[], Any]): Opens a new connection
+			min_size(int): Connections opened up front and never evicted for idleness
+			max_size(int): Maximum number of open connections
+			acquire_timeout(float): Seconds to wait for a connection when all are in use
+			idle_timeout(float): Seconds after which an idle connection above min_size is closed
+			health_check(Optional[Callable[[Any], Any]]): Called with an idle connection
+				before it is reused; a False result or an exception discards the connection
+			close(Callable[[Any], None]): Closes a connection
+			registry(Optional[MetricsRegistry]): Registry the pool metrics are added to.
+				Defaults to a new MetricsRegistry.
+			prefix(str): Prefix of every metric name
+			clock(Callable[[], float]): Monotonic clock in seconds
+
+		Raises:
+			DatabaseException: If one of the min_size connections cannot be opened
+		"""
+		if max_size < 1:
+			raise ValueError("max_size must be at least 1")
+		if min_size < 0 or min_size > max_size:
+			raise ValueError("min_size must be between 0 and max_size")
+		if acquire_timeout < 0 or idle_timeout < 0:
+			raise ValueError("acquire_timeout and idle_timeout cannot be negative")
+
+		self._connect = connect
+		self.min_size = min_size
+		self.max_size = max_size
+		self.acquire_timeout = acquire_timeout
+		self.idle_timeout = idle_timeout
+		self._health_check = health_check
+		self._close = close
+		self._clock = clock
+		self._condition = threading.Condition()
+		# Most recently released last, handed out first to keep few connections warm
+		self._idle: Deque[Tuple[Any, float]] = deque()
+		self._size = 0
+		self._closed = False
+
+		self.registry = registry or MetricsRegistry()
+		self.wait_time = self.registry.histogram(
+			f"{prefix}_wait_seconds",
+			"Time spent waiting for a pooled connection",
+			buckets=WAIT_TIME_BUCKETS
+		)
+		self.connections = self.registry.gauge(f"{prefix}_connections", "Open pooled connections")
+		self.in_use = self.registry.gauge(f"{prefix}_connections_in_use", "Pooled connections handed out")
+		self.exhausted = self.registry.counter(
+			f"{prefix}_exhausted_total",
+			"Acquisitions that timed out because every connection was in use"
+		)
+		self.discarded = self.registry.counter(
+			f"{prefix}_discarded_total",
+			"Connections closed by the pool, by reason",
+			("reason",)
+		)
+
+		for _ in range(min_size):
+			self._size += 1
+			connection = self._open()
+			with self._condition:
+				self._idle.append((connection, self._clock()))
+		self.connections.set(self._size)
+
+	def acquire(self) -> Any:
+		"""
+		Take a connection out of the pool, opening one when none is idle
+		Returns:
+			Any: a connection, to be handed back with release
+
+		Raises:
+			DatabaseException: If the pool is closed or exhausted, or a connection cannot be opened
+		"""
+		started_at = self._clock()
+		deadline = started_at + self.acquire_timeout
+		while True:
+			connection, must_open = self._take(deadline)
+			if must_open:
+				connection = self._open()
+			elif not self._is_healthy(connection):
+				self._discard(connection, "unhealthy")
+				continue
+
+			self.wait_time.observe(self._clock() - started_at)
+			self.in_use.inc()
+			return connection
+
+	def release(self, connection: Any, discard: bool = False) -> None:
+		"""
+		Hand a connection back to the pool
+		Args:
+			connection(Any): Connection taken with acquire
+			discard(bool): Close the connection instead, e.g. after it broke
+		"""
+		self.in_use.dec()
+		with self._condition:
+			keep = not discard and not self._closed
+			if keep:
+				self._idle.append((connection, self._clock()))
+				self._condition.notify()
+		if not keep:
+			self._discard(connection, "discarded" if discard else "closed")
+		self.evict_idle()
+
+	@contextmanager
+	def connection(self) -> Iterator[Any]:
+		connection = self.acquire()
+		try:
+			yield connection
+		finally:
+			self.release(connection)
+
+	def evict_idle(self) -> int:
+		"""
+		Close connections idle for longer than idle_timeout, keeping min_size open
+		Returns:
+			int: number of connections closed
+		"""
+		expired = []
+		with self._condition:
+			now = self._clock()
+			# The oldest idle connections are at the left end
+			while (
+				self._idle
+				and self._size - len(expired) > self.min_size
+				and now - self._idle[0][1] >= self.idle_timeout
+			):
+				expired.append(self._idle.popleft()[0])
+
+		for connection in expired:
+			self._discard(connection, "idle")
+
+		return len(expired)
+
+	def close(self) -> None:
+		"""Close every idle connection; connections in use are closed once released"""
+		with self._condition:
+			self._closed = True
+			idle = [connection for connection, _ in self._idle]
+			self._idle.clear()
+			self._condition.notify_all()
+
+		for connection in idle:
+			self._discard(connection, "closed")
+
+	def stats(self) -> Dict[str, int]:
+		with self._condition:
+			return {
+				"size": self._size,
+				"idle": len(self._idle),
+				"in_use": int(self.in_use.value()),
+				"exhausted": int(self.exhausted.value())
+			}
+
+	def _take(self, deadline: float) -> Tuple[Any, bool]:
+		# Returns an idle connection, or reserves a slot for a new one
+		with self._condition:
+			while True:
+				if self._closed:
+					raise DatabaseException("Connection pool is closed")
+				if self._idle:
+					return self._idle.pop()[0], False
+				if self._size < self.max_size:
+					self._size += 1
+					self.connections.set(self._size)
+					return None, True
+
+				remaining = deadline - self._clock()
+				if remaining <= 0:
+					self.exhausted.inc()
+					raise DatabaseException(
+						f"Connection pool exhausted: all {self.max_size} connections in use "
+						f"after waiting {self.acquire_timeout}s"
+					)
+				self._condition.wait(remaining)
+
+	def _open(self) -> Any:
+		try:
+			return self._connect()
+		except Exception as error:
+			with self._condition:
+				self._size -= 1
+				self.connections.set(self._size)
+				self._condition.notify()
+			if isinstance(error, DatabaseException):
+				raise
+			raise DatabaseException(f"Cannot open a database connection: {error}") from error
+
+	def _is_healthy(self, connection: Any) -> bool:
+		if self._health_check is None:
+			return True
+		try:
+			return self._health_check(connection) is not False
+		except Exception:
+			return False
+
+	def _discard(self, connection: Any, reason: str) -> None:
+		with self._condition:
+			self._size -= 1
+			self.connections.set(self._size)
+			self._condition.notify()
+		self.discarded.inc(1, reason)
+		try:
+			self._close(connection)
+		except Exception:
+			pass
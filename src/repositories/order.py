@@ -1,13 +1,100 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
 
 from src.entities.order import Order
+from src.utils.exceptions import DatabaseException
+from src.utils.response import BulkUpdateResult
 
 
 class OrderRepository:
 	@staticmethod
 	def get_orders_by_user(self, user_id: int) -> List[Order]:
+		"""
+		Load all orders of a user. Each order is marked clean with its stored
+		status and priority, so unchanged orders can be left out of bulk updates.
+		
+		Args:
+			user_id: ID of the user whose orders are read
+			
+		Returns:
+			List[Order]: the user's orders
+			
+		Raises:
+			DatabaseException: If database operation fails
+		"""
+		pass
+
+	def iter_orders_by_user(self, user_id: int, page_size: int) -> Iterator[Order]:
+		"""
+		Stream a user's orders, fetching them from the database one page at a time.
+		
+		Args:
+			user_id: ID of the user whose orders are read
+			page_size: Number of orders fetched per database round-trip
+			
+		Returns:
+			Iterator[Order]: the user's orders, never holding more than one page in memory,
+				each marked clean like the orders of get_orders_by_user
+			
+		Raises:
+			DatabaseException: If database operation fails
+		"""
+		pass
+
+	def get_orders_by_user_page(self, user_id: int, after_id: Optional[int], page_size: int) -> List[Order]:
+		"""
+		Load one page of a user's orders in ID order. The last order ID of the previous
+		page is the cursor of the next one (keyset pagination), so every page is a range
+		scan of the user_id index however deep into the history it starts.
+		
+		Args:
+			user_id: ID of the user whose orders are read
+			after_id: ID of the last order of the previous page, None for the first page
+			page_size: Maximum number of orders in the page
+			
+		Returns:
+			List[Order]: orders with an ID above after_id, each marked clean like the
+				orders of get_orders_by_user. Fewer than page_size on the last page.
+			
+		Raises:
+			DatabaseException: If database operation fails
+		"""
 		pass
 
+	def iter_orders_by_user_prefetched(self, user_id: int, page_size: int) -> Iterator[Order]:
+		"""
+		Stream a user's orders page by page through get_orders_by_user_page, fetching
+		the next page on a background thread while the current one is consumed.
+		At most two pages are held in memory.
+		
+		Args:
+			user_id: ID of the user whose orders are read
+			page_size: Number of orders fetched per page
+			
+		Returns:
+			Iterator[Order]: the user's orders in ID order, each marked clean
+			
+		Raises:
+			DatabaseException: If database operation fails, raised when the failed page is reached
+		"""
+		if page_size < 1:
+			raise ValueError("page_size must be at least 1")
+
+		return self._iter_prefetched_pages(user_id, page_size)
+
+	def _iter_prefetched_pages(self, user_id: int, page_size: int) -> Iterator[Order]:
+		with ThreadPoolExecutor(max_workers=1, thread_name_prefix="order-page-prefetch") as executor:
+			next_page = executor.submit(self.get_orders_by_user_page, user_id, None, page_size)
+			while next_page is not None:
+				page = next_page.result()
+				# A short page is the last one, no need to ask for an empty page after it
+				if len(page) == page_size:
+					next_page = executor.submit(self.get_orders_by_user_page, user_id, page[-1].id, page_size)
+				else:
+					next_page = None
+				yield from page
+				del page
+
 	@staticmethod
 	def update_order_status(self, order_id: int, status: str, priority: str) -> bool:
 		pass
@@ -27,3 +114,33 @@ class OrderRepository:
 			DatabaseException: If database operation fails
 		"""
 		pass
+
+	def bulk_update_orders_in_chunks(self, orders: List[Order], chunk_size: int) -> BulkUpdateResult:
+		"""
+		Update orders in chunks, committing each chunk in its own transaction
+		through bulk_update_orders. A failing chunk does not roll back the others.
+		
+		Args:
+			orders: List of Order objects to update
+			chunk_size: Maximum number of orders per transaction
+			
+		Returns:
+			BulkUpdateResult: orders that were stored and orders whose chunk failed
+		"""
+		if chunk_size < 1:
+			raise ValueError("chunk_size must be at least 1")
+
+		updated_orders = []
+		failed_orders = []
+		failed_chunks = 0
+		for start in range(0, len(orders), chunk_size):
+			chunk = orders[start:start + chunk_size]
+			try:
+				self.bulk_update_orders(chunk)
+			except DatabaseException:
+				failed_orders.extend(chunk)
+				failed_chunks += 1
+			else:
+				updated_orders.extend(chunk)
+
+		return BulkUpdateResult(updated_orders, failed_orders, failed_chunks)
@@ -0,0 +1,291 @@
+import sqlite3
+import threading
+
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Iterable, Iterator, List, Optional, Tuple
+
+from src.entities.order import Order
+from src.repositories.connection_pool import ConnectionPool
+from src.repositories.order import OrderRepository
+from src.utils.exceptions import DatabaseException
+
+SCHEMA = (
+	"""
+	CREATE TABLE IF NOT EXISTS orders (
+		id INTEGER PRIMARY KEY,
+		user_id INTEGER NOT NULL,
+		type TEXT NOT NULL,
+		amount REAL NOT NULL,
+		flag INTEGER NOT NULL,
+		status TEXT,
+		priority TEXT NOT NULL
+	)
+	""",
+	# Covers the user lookup and returns the orders in ID order without a sort
+	"CREATE INDEX IF NOT EXISTS idx_orders_user_id ON orders (user_id, id)"
+)
+
+SELECT_ORDERS_BY_USER = (
+	"SELECT id, type, amount, flag, status, priority FROM orders WHERE user_id = ? ORDER BY id"
+)
+SELECT_FIRST_ORDER_PAGE = (
+	"SELECT id, type, amount, flag, status, priority FROM orders WHERE user_id = ? ORDER BY id LIMIT ?"
+)
+SELECT_ORDER_PAGE = (
+	"SELECT id, type, amount, flag, status, priority FROM orders "
+	"WHERE user_id = ? AND id > ? ORDER BY id LIMIT ?"
+)
+INSERT_ORDER = (
+	"INSERT INTO orders (id, user_id, type, amount, flag, status, priority) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+UPDATE_ORDER = "UPDATE orders SET status = ?, priority = ? WHERE id = ?"
+
+OrderRow = Tuple[int, str, float, int, str, str]
+
+# Pooled connections are used by one thread at a time and need no lock
+_NO_LOCK = nullcontext()
+
+
+def connect_sqlite(database: str, timeout: float = 5.0) -> sqlite3.Connection:
+	"""
+	Open a connection to an order database, creating the schema when missing
+	Args:
+		database(str): Path of the database file, or ":memory:"
+		timeout(float): Seconds to wait for a lock held by another connection
+
+	Returns:
+		sqlite3.Connection: connection in autocommit mode, usable from any thread
+
+	Raises:
+		DatabaseException: If the database cannot be opened
+	"""
+	try:
+		connection = sqlite3.connect(database, timeout=timeout, check_same_thread=False, isolation_level=None)
+		connection.execute("PRAGMA journal_mode = WAL")
+		# Durable at every checkpoint; commits in WAL mode do not need a full sync
+		connection.execute("PRAGMA synchronous = NORMAL")
+		for statement in SCHEMA:
+			connection.execute(statement)
+	except sqlite3.Error as error:
+		raise DatabaseException(f"Cannot open order database {database}: {error}") from error
+
+	return connection
+
+
+def create_sqlite_connection_pool(database: str, timeout: float = 5.0, **pool_options: Any) -> ConnectionPool:
+	"""
+	Create a ConnectionPool of connections to an order database file
+	Args:
+		database(str): Path of the database file. Every ":memory:" connection
+			would be a database of its own, so it cannot be pooled.
+		timeout(float): Seconds a connection waits for a lock held by another one
+		pool_options(Any): Extra ConnectionPool arguments, e.g. min_size and max_size
+
+	Returns:
+		ConnectionPool: pool health checking its connections with SELECT 1
+	"""
+	if database == ":memory:":
+		raise ValueError("An in-memory SQLite database cannot be pooled")
+
+	return ConnectionPool(
+		lambda: connect_sqlite(database, timeout),
+		health_check=lambda connection: connection.execute("SELECT 1"),
+		**pool_options
+	)
+
+
+class SQLiteOrderRepository(OrderRepository):
+	"""
+	OrderRepository backed by SQLite, the reference implementation for local
+	end to end runs and benchmarks.
+
+	File databases use WAL mode, so readers are not blocked by a bulk update.
+	Without a connection pool one connection is shared by all threads and every
+	statement runs under a lock. With a pool every call borrows a connection of
+	its own, and a streamed read keeps its connection until it is exhausted.
+	sqlite3 errors are raised as DatabaseException.
+	"""
+
+	def __init__(
+		self,
+		database: str = ":memory:",
+		timeout: float = 5.0,
+		connection_pool: Optional[ConnectionPool] = None
+	):
+		"""
+		Args:
+			database(str): Path of the database file, or ":memory:". Unused with a connection pool.
+			timeout(float): Seconds to wait for a lock held by another connection
+			connection_pool(Optional[ConnectionPool]): Pool to borrow connections from,
+				see create_sqlite_connection_pool
+		"""
+		self.database = database
+		self.connection_pool = connection_pool
+		self._lock = threading.RLock()
+		self._connection = connect_sqlite(database, timeout) if connection_pool is None else None
+
+	def get_orders_by_user(self, user_id: int) -> List[Order]:
+		"""
+		Load all orders of a user, marked clean, in ID order
+		Args:
+			user_id(int): ID of the user whose orders are read
+
+		Returns:
+			List[Order]: the user's orders
+
+		Raises:
+			DatabaseException: If database operation fails
+		"""
+		with self._borrow() as (connection, lock), lock:
+			try:
+				cursor = connection.execute(SELECT_ORDERS_BY_USER, (user_id,))
+				return [self._to_order(row) for row in cursor]
+			except sqlite3.Error as error:
+				raise DatabaseException(f"Cannot read orders of user {user_id}: {error}") from error
+
+	def iter_orders_by_user(self, user_id: int, page_size: int) -> Iterator[Order]:
+		"""
+		Stream a user's orders in ID order, fetching page_size rows per fetch from
+		one cursor. The lock is only held while a page is fetched, so the orders
+		can be updated while they are streamed.
+		Args:
+			user_id(int): ID of the user whose orders are read
+			page_size(int): Number of rows fetched at a time
+
+		Returns:
+			Iterator[Order]: the user's orders, each marked clean
+
+		Raises:
+			DatabaseException: If database operation fails
+		"""
+		if page_size < 1:
+			raise ValueError("page_size must be at least 1")
+
+		return self._iter_orders(user_id, page_size)
+
+	def _iter_orders(self, user_id: int, page_size: int) -> Iterator[Order]:
+		try:
+			with self._borrow() as (connection, lock):
+				with lock:
+					cursor = connection.execute(SELECT_ORDERS_BY_USER, (user_id,))
+				while True:
+					with lock:
+						rows = cursor.fetchmany(page_size)
+					if not rows:
+						return
+					for row in rows:
+						yield self._to_order(row)
+		except sqlite3.Error as error:
+			raise DatabaseException(f"Cannot read orders of user {user_id}: {error}") from error
+
+	def get_orders_by_user_page(self, user_id: int, after_id: Optional[int], page_size: int) -> List[Order]:
+		"""
+		Load the orders of a user following after_id, in ID order, with a range scan
+		of the (user_id, id) index
+		Args:
+			user_id(int): ID of the user whose orders are read
+			after_id(Optional[int]): ID of the last order of the previous page, None for the first page
+			page_size(int): Maximum number of orders in the page
+
+		Returns:
+			List[Order]: the page's orders, each marked clean
+
+		Raises:
+			DatabaseException: If database operation fails
+		"""
+		if page_size < 1:
+			raise ValueError("page_size must be at least 1")
+
+		if after_id is None:
+			statement, parameters = SELECT_FIRST_ORDER_PAGE, (user_id, page_size)
+		else:
+			statement, parameters = SELECT_ORDER_PAGE, (user_id, after_id, page_size)
+
+		with self._borrow() as (connection, lock), lock:
+			try:
+				return [self._to_order(row) for row in connection.execute(statement, parameters)]
+			except sqlite3.Error as error:
+				raise DatabaseException(f"Cannot read orders of user {user_id}: {error}") from error
+
+	def update_order_status(self, order_id: int, status: str, priority: str) -> bool:
+		with self._borrow() as (connection, lock), lock:
+			try:
+				cursor = connection.execute(UPDATE_ORDER, (status, priority, order_id))
+			except sqlite3.Error as error:
+				raise DatabaseException(f"Cannot update order {order_id}: {error}") from error
+
+		return cursor.rowcount == 1
+
+	def bulk_update_orders(self, orders: List[Order]) -> bool:
+		"""
+		Update the status and priority of orders with one executemany in a single transaction
+		Args:
+			orders(List[Order]): Orders to update
+
+		Returns:
+			bool: True once every update is committed
+
+		Raises:
+			DatabaseException: If database operation fails, nothing is updated then
+		"""
+		parameters = [(order.status, order.priority, order.id) for order in orders]
+		self._execute_in_transaction(UPDATE_ORDER, parameters)
+
+		return True
+
+	def insert_orders(self, user_id: int, orders: Iterable[Order]) -> None:
+		"""
+		Store new orders of a user in a single transaction
+		Args:
+			user_id(int): ID of the user owning the orders
+			orders(Iterable[Order]): Orders to insert
+
+		Raises:
+			DatabaseException: If database operation fails, e.g. an order ID already exists
+		"""
+		parameters = [
+			(order.id, user_id, order.type, order.amount, int(order.flag), order.status, order.priority)
+			for order in orders
+		]
+		self._execute_in_transaction(INSERT_ORDER, parameters)
+
+	def close(self) -> None:
+		"""Close the shared connection; a connection pool is left to its owner"""
+		if self._connection is not None:
+			with self._lock:
+				self._connection.close()
+
+	@contextmanager
+	def _borrow(self) -> Iterator[Tuple[sqlite3.Connection, ContextManager]]:
+		# Yields a connection and the lock to hold while using it
+		if self.connection_pool is None:
+			yield self._connection, self._lock
+			return
+
+		with self.connection_pool.connection() as connection:
+			yield connection, _NO_LOCK
+
+	def _execute_in_transaction(self, statement: str, parameters: List[tuple]) -> None:
+		with self._borrow() as (connection, lock), lock:
+			try:
+				# Take the write lock up front instead of upgrading a read lock mid-transaction
+				connection.execute("BEGIN IMMEDIATE")
+				try:
+					connection.executemany(statement, parameters)
+					connection.execute("COMMIT")
+				except sqlite3.Error:
+					if connection.in_transaction:
+						connection.execute("ROLLBACK")
+					raise
+			except sqlite3.Error as error:
+				raise DatabaseException(f"Cannot write {len(parameters)} orders: {error}") from error
+
+	@staticmethod
+	def _to_order(row: OrderRow) -> Order:
+		order_id, order_type, amount, flag, status, priority = row
+		order = Order(id=order_id, type=order_type, amount=amount, flag=bool(flag))
+		order.status = status
+		order.priority = priority
+		order.mark_clean()
+
+		return order
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict, List
 
 from src.utils.response import APIResponse
 
@@ -8,3 +9,20 @@ class APIClient(ABC):
 	def call_api(self, order_id: int) -> APIResponse:
 		pass
 
+	def call_api_batch(self, order_ids: List[int]) -> Dict[int, APIResponse]:
+		"""
+		Fetch API responses for several orders in a single request.
+		Clients without a batch endpoint keep this default, and callers
+		fall back to one call_api per order.
+
+		Args:
+			order_ids: IDs of the orders to look up
+
+		Returns:
+			Dict[int, APIResponse]: responses keyed by order ID. IDs missing
+			from the mapping are treated as failed calls.
+
+		Raises:
+			NotImplementedError: If the client has no batch endpoint
+		"""
+		raise NotImplementedError
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from src.utils.response import APIResponse
+
+
+class AsyncAPIClient(ABC):
+	@abstractmethod
+	async def call_api(self, order_id: int) -> APIResponse:
+		pass
@@ -0,0 +1,149 @@
+import asyncio
+
+from typing import Dict, List, Optional, Union
+
+from src.constants import OrderType, OrderStatus, InstrumentationStages, ExportFormat, ExportSharding
+from src.services.async_api_client import AsyncAPIClient
+from src.services.checkpoint_journal import CheckpointJournal
+from src.services.instrumentation import Instrumentation
+from src.services.order_metrics import OrderMetrics
+from src.services.order_processing import OrderProcessingService
+from src.services.order_type_registry import OrderTypeHandler, OrderTypeRegistry
+from src.entities.order import Order
+from src.repositories.order import OrderRepository
+from src.utils.response import OrderProcessingResult
+
+
+class AsyncOrderProcessingService:
+	"""
+	asyncio-native counterpart of OrderProcessingService.
+
+	Type B orders are awaited concurrently, at most max_api_concurrency at a time.
+	Repository calls and the processing of the other orders, including the Type A
+	CSV writes, run in a worker thread so they never block the event loop.
+	Order statuses are computed by a wrapped OrderProcessingService, which never
+	calls the API client itself. The service wraps it instead of extending it, so
+	its synchronous entry points, which cannot await the client, are not exposed.
+	"""
+
+	def __init__(
+		self,
+		api_client: AsyncAPIClient,
+		max_api_concurrency: int = 10,
+		db_chunk_size: Optional[int] = None,
+		order_repository: Optional[OrderRepository] = None,
+		order_type_handlers: Optional[Dict[Union[OrderType, str], OrderTypeHandler]] = None,
+		instrumentation: Optional[Instrumentation] = None,
+		metrics: Optional[OrderMetrics] = None,
+		export_format: ExportFormat = ExportFormat.CSV,
+		export_queue_size: Optional[int] = None,
+		export_dir: Optional[str] = None,
+		export_sharding: ExportSharding = ExportSharding.NONE,
+		checkpoint_journal: Optional[CheckpointJournal] = None
+	):
+		self._service = OrderProcessingService(
+			api_client,
+			max_api_concurrency=max_api_concurrency,
+			db_chunk_size=db_chunk_size,
+			order_repository=order_repository,
+			order_type_handlers=order_type_handlers,
+			instrumentation=instrumentation,
+			metrics=metrics,
+			export_format=export_format,
+			export_queue_size=export_queue_size,
+			export_dir=export_dir,
+			export_sharding=export_sharding,
+			checkpoint_journal=checkpoint_journal
+		)
+		self.api_client = api_client
+		self.max_api_concurrency = max_api_concurrency
+
+	@property
+	def order_repository(self) -> OrderRepository:
+		return self._service.order_repository
+
+	@property
+	def order_type_registry(self) -> OrderTypeRegistry:
+		return self._service.order_type_registry
+
+	@property
+	def checkpoint_journal(self) -> Optional[CheckpointJournal]:
+		return self._service.checkpoint_journal
+
+	async def process_orders(self, user_id: int) -> bool:
+		return (await self.process_orders_with_result(user_id)).success
+
+	async def process_orders_with_result(self, user_id: int) -> OrderProcessingResult:
+		service = self._service
+		result = OrderProcessingResult()
+		try:
+			await asyncio.to_thread(service._open_checkpoint, user_id)
+			try:
+				result.success = await self._process_all_orders_async(user_id, result)
+			finally:
+				await asyncio.to_thread(service._close_checkpoint, user_id, result.success)
+		except Exception:
+			result.success = False
+
+		return result
+
+	async def _process_all_orders_async(self, user_id: int, result: OrderProcessingResult) -> bool:
+		service = self._service
+		with service._span(InstrumentationStages.GET_ORDERS):
+			orders = await asyncio.to_thread(service.order_repository.get_orders_by_user, user_id)
+
+		if not orders:
+			return False
+
+		if service.checkpoint_journal is not None:
+			pending_orders = service._restore_checkpointed_orders(orders, user_id)
+		else:
+			pending_orders = orders
+
+		export_session = service._create_export_session(user_id)
+		try:
+			processed_orders, deferred_type_b_orders = await asyncio.to_thread(
+				service._process_orders_deferring_api_calls,
+				pending_orders, user_id, export_session, self._should_defer_api_call
+			)
+			await self._dispatch_type_b_orders_async(deferred_type_b_orders, user_id)
+		finally:
+			with service._span(InstrumentationStages.EXPORT_FLUSH):
+				published = await asyncio.to_thread(export_session.close)
+		if service.checkpoint_journal is not None:
+			processed_orders = orders
+			if published:
+				await asyncio.to_thread(service._checkpoint_exported_orders, user_id, orders)
+
+		return await asyncio.to_thread(service._bulk_update_orders, processed_orders, result) and published
+
+	def _should_defer_api_call(self, order: Order) -> bool:
+		# Every built-in Type B call has to be awaited on the event loop
+		return (
+			self._service.order_type_registry.normalize(order.type) == OrderType.TYPE_B.value
+			and self._service._uses_builtin_handler(OrderType.TYPE_B)
+		)
+
+	async def _dispatch_type_b_orders_async(self, orders: List[Order], user_id: int) -> List[Order]:
+		semaphore = asyncio.Semaphore(self.max_api_concurrency)
+
+		return list(await asyncio.gather(*(
+			self._process_type_b_order_async(order, user_id, semaphore) for order in orders
+		)))
+
+	async def _process_type_b_order_async(self, order: Order, user_id: int, semaphore: asyncio.Semaphore) -> Order:
+		service = self._service
+		try:
+			async with semaphore:
+				with service._span(InstrumentationStages.API_CALL):
+					api_response = await self.api_client.call_api(order.id)
+			order = service._handle_api_response(order, api_response)
+		except Exception:
+			order.status = OrderStatus.API_FAILURE.value
+
+		order = service._update_order_priority(order)
+		if service.checkpoint_journal is not None:
+			# Journaled as soon as it is done, so a cancelled run keeps the finished calls
+			await asyncio.to_thread(service._checkpoint, user_id, [order])
+
+		return order
@@ -0,0 +1,119 @@
+import copy
+import queue
+import threading
+
+from typing import Callable, List, Optional, Tuple
+
+from src.constants import OrderStatus
+from src.entities.order import Order
+from src.services.csv_export import ExportSession
+
+_WRITE = "write"
+_FLUSH = "flush"
+_CLOSE = "close"
+
+
+class BackgroundExportSession(ExportSession):
+	"""
+	Hand Type A orders to a writer thread so slow disks do not stall order processing.
+
+	write_order puts a snapshot of the order on a bounded queue and returns at once;
+	it only blocks when max_queue_size orders are waiting (backpressure). The
+	writer thread writes the snapshots through the wrapped session, which should
+	be durable. An order's status changes only when flush or close confirms its
+	row: EXPORTED once the wrapped session flushed and synced it, EXPORT_FAILED
+	otherwise. flush and close wait for the writer, so statuses are final when
+	they return. Rows of an atomic wrapped session are settled again on close,
+	since they are only confirmed once its file is published.
+	"""
+
+	def __init__(self, export_session: ExportSession, max_queue_size: int = 1024):
+		"""
+		Args:
+			export_session(ExportSession): Session the writer thread writes to
+			max_queue_size(int): Maximum number of orders waiting to be written
+		"""
+		if max_queue_size < 1:
+			raise ValueError("max_queue_size must be at least 1")
+
+		self._export_session = export_session
+		self.max_queue_size = max_queue_size
+		self._queue: "queue.Queue[Tuple[str, object]]" = queue.Queue(max_queue_size)
+		self._thread: Optional[threading.Thread] = None
+		# Snapshots written by the writer thread whose orders are not settled yet
+		self._written: List[Tuple[Order, Order]] = []
+		self._published = True
+
+	@property
+	def file_name(self) -> Optional[str]:
+		return self._export_session.file_name
+
+	def write_order(self, order: Order) -> Order:
+		if self._thread is None:
+			self._thread = threading.Thread(target=self._run, name="export-writer", daemon=True)
+			self._thread.start()
+
+		# The row is taken as the order is now; processing continues on the original
+		self._queue.put((_WRITE, (copy.copy(order), order)))
+
+		return order
+
+	def flush(self) -> None:
+		self._wait_for(_FLUSH)
+
+	def close(self) -> bool:
+		if self._thread is None:
+			return True
+
+		self._wait_for(_CLOSE)
+		self._thread.join()
+		self._thread = None
+
+		return self._published
+
+	def _wait_for(self, command: str) -> None:
+		if self._thread is None:
+			return
+
+		done = threading.Event()
+		self._queue.put((command, done))
+		done.wait()
+
+	def _run(self) -> None:
+		while True:
+			command, payload = self._queue.get()
+			if command == _WRITE:
+				self._write(*payload)
+				continue
+
+			if command == _FLUSH:
+				self._settle(self._export_session.flush, getattr(self._export_session, "atomic", False))
+			else:
+				self._published = self._settle(self._export_session.close, False)
+			payload.set()
+			if command == _CLOSE:
+				return
+
+	def _write(self, snapshot: Order, order: Order) -> None:
+		try:
+			self._export_session.write_order(snapshot)
+		except Exception:
+			snapshot.status = OrderStatus.EXPORT_FAILED.value
+		self._written.append((snapshot, order))
+
+	def _settle(self, confirm: Callable[[], Optional[bool]], keep_written: bool) -> bool:
+		try:
+			# flush returns None, only a False close reports a failure
+			confirmed = confirm() is not False
+		except Exception:
+			confirmed = False
+			for snapshot, _ in self._written:
+				snapshot.status = OrderStatus.EXPORT_FAILED.value
+
+		# The wrapped session has marked every snapshot EXPORTED or EXPORT_FAILED by now
+		for snapshot, order in self._written:
+			order.status = snapshot.status
+		if not keep_written:
+			self._written = []
+
+		return confirmed
@@ -0,0 +1,102 @@
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from src.services.api_client import APIClient
+from src.services.order_processing import OrderProcessingService
+from src.repositories.order import OrderRepository
+
+
+class BatchProcessingResult:
+	def __init__(self, results: Dict[int, bool], elapsed_seconds: float):
+		self.results = results
+		self.elapsed_seconds = elapsed_seconds
+
+	@property
+	def total_users(self) -> int:
+		return len(self.results)
+
+	@property
+	def succeeded_users(self) -> int:
+		return sum(1 for success in self.results.values() if success)
+
+	@property
+	def failed_users(self) -> int:
+		return self.total_users - self.succeeded_users
+
+
+# Service owned by the current worker process, built once by _init_worker
+_worker_service: Optional[OrderProcessingService] = None
+
+
+def _build_service(
+	api_client_factory: Callable[[], APIClient],
+	order_repository_factory: Callable[[], OrderRepository],
+	service_options: Dict[str, Any]
+) -> OrderProcessingService:
+	return OrderProcessingService(
+		api_client_factory(),
+		order_repository=order_repository_factory(),
+		**service_options
+	)
+
+
+def _init_worker(
+	api_client_factory: Callable[[], APIClient],
+	order_repository_factory: Callable[[], OrderRepository],
+	service_options: Dict[str, Any]
+) -> None:
+	global _worker_service
+	_worker_service = _build_service(api_client_factory, order_repository_factory, service_options)
+
+
+def _process_user(user_id: int) -> Tuple[int, bool]:
+	return user_id, _worker_service.process_orders(user_id)
+
+
+def process_orders_for_users(
+	user_ids: Iterable[int],
+	api_client_factory: Callable[[], APIClient],
+	order_repository_factory: Callable[[], OrderRepository] = OrderRepository,
+	workers: Optional[int] = None,
+	service_options: Optional[Dict[str, Any]] = None,
+	chunksize: int = 64
+) -> BatchProcessingResult:
+	"""
+	Process the orders of many users, sharding them across a process pool.
+	Each worker process builds its own APIClient and OrderRepository from the
+	given factories, which must therefore be picklable (e.g. module level classes).
+	Args:
+		user_ids(Iterable[int]): Users to process
+		api_client_factory(Callable[[], APIClient]): Builds the API client of a worker
+		order_repository_factory(Callable[[], OrderRepository]): Builds the repository of a worker
+		workers(Optional[int]): Number of worker processes, defaults to the CPU count.
+			With 1 worker the users are processed in the calling process.
+		service_options(Optional[Dict[str, Any]]): Extra OrderProcessingService arguments
+		chunksize(int): Number of users sent to a worker at a time
+
+	Returns:
+		BatchProcessingResult: success of every user and aggregate counters
+	"""
+	if workers is None:
+		workers = os.cpu_count() or 1
+	if workers < 1:
+		raise ValueError("workers must be at least 1")
+
+	service_options = service_options or {}
+	start_time = time.perf_counter()
+
+	if workers == 1:
+		service = _build_service(api_client_factory, order_repository_factory, service_options)
+		results = {user_id: service.process_orders(user_id) for user_id in user_ids}
+	else:
+		with ProcessPoolExecutor(
+			max_workers=workers,
+			initializer=_init_worker,
+			initargs=(api_client_factory, order_repository_factory, service_options)
+		) as executor:
+			results = dict(executor.map(_process_user, user_ids, chunksize=chunksize))
+
+	return BatchProcessingResult(results, time.perf_counter() - start_time)
@@ -0,0 +1,132 @@
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.constants import APIResponseStatus
+from src.services.api_client import APIClient
+from src.utils.response import APIResponse
+
+
+class CachingAPIClient(APIClient):
+	"""
+	APIClient decorator caching responses per order ID.
+
+	Successful responses are kept for ttl seconds, error responses (non-success
+	status or no response) for the shorter negative_ttl. The cache holds at most
+	max_size entries and evicts the least recently used one when full.
+	Exceptions raised by the wrapped client are never cached.
+	"""
+
+	def __init__(
+		self,
+		api_client: APIClient,
+		max_size: int = 10000,
+		ttl: float = 300.0,
+		negative_ttl: float = 30.0,
+		clock: Callable[[], float] = time.monotonic
+	):
+		if max_size < 1:
+			raise ValueError("max_size must be at least 1")
+		if ttl < 0 or negative_ttl < 0:
+			raise ValueError("ttl and negative_ttl cannot be negative")
+
+		self.api_client = api_client
+		self.max_size = max_size
+		self.ttl = ttl
+		self.negative_ttl = negative_ttl
+		self._clock = clock
+		self._entries: "OrderedDict[int, Tuple[float, Optional[APIResponse]]]" = OrderedDict()
+		self._lock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self.expirations = 0
+
+	def call_api(self, order_id: int) -> APIResponse:
+		found, response = self._lookup(order_id)
+		with self._lock:
+			if found:
+				self.hits += 1
+			else:
+				self.misses += 1
+
+		if found:
+			return response
+
+		response = self.api_client.call_api(order_id)
+		self._store(order_id, response)
+
+		return response
+
+	def call_api_batch(self, order_ids: List[int]) -> Dict[int, APIResponse]:
+		responses = {}
+		missing_order_ids = []
+		for order_id in order_ids:
+			found, response = self._lookup(order_id)
+			if found:
+				responses[order_id] = response
+			else:
+				missing_order_ids.append(order_id)
+
+		fetched_responses = {}
+		if missing_order_ids:
+			# NotImplementedError propagates before any counter moves, so the
+			# caller's per-order fallback through call_api is counted only once
+			fetched_responses = self.api_client.call_api_batch(missing_order_ids)
+
+		with self._lock:
+			self.hits += len(responses)
+			self.misses += len(missing_order_ids)
+
+		for order_id, response in fetched_responses.items():
+			self._store(order_id, response)
+			responses[order_id] = response
+
+		return responses
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+
+	def cache_info(self) -> Dict[str, int]:
+		with self._lock:
+			return {
+				"hits": self.hits,
+				"misses": self.misses,
+				"evictions": self.evictions,
+				"expirations": self.expirations,
+				"size": len(self._entries)
+			}
+
+	def _lookup(self, order_id: int) -> Tuple[bool, Optional[APIResponse]]:
+		with self._lock:
+			entry = self._entries.get(order_id)
+			if entry is None:
+				return False, None
+
+			expires_at, response = entry
+			if expires_at <= self._clock():
+				del self._entries[order_id]
+				self.expirations += 1
+				return False, None
+
+			self._entries.move_to_end(order_id)
+			return True, response
+
+	def _store(self, order_id: int, response: Optional[APIResponse]) -> None:
+		ttl = self.ttl if self._is_success(response) else self.negative_ttl
+		if ttl <= 0:
+			return
+
+		with self._lock:
+			self._entries[order_id] = (self._clock() + ttl, response)
+			self._entries.move_to_end(order_id)
+			while len(self._entries) > self.max_size:
+				self._entries.popitem(last=False)
+				self.evictions += 1
+
+	@staticmethod
+	def _is_success(response: Optional[APIResponse]) -> bool:
+		return bool(response) and str(response.status).lower() == APIResponseStatus.SUCCESS.value
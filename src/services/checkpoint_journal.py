@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+
+from typing import Any, Dict, Iterable, Tuple
+
+from src.constants import OrderStatus
+from src.entities.order import Order
+
+# Status and priority an order was processed to
+CheckpointEntry = Tuple[str, str]
+
+# Outcomes a resumed run keeps; orders that failed are processed again
+FINAL_STATUSES = frozenset(status.value for status in (
+	OrderStatus.EXPORTED,
+	OrderStatus.PROCESSED,
+	OrderStatus.PENDING,
+	OrderStatus.COMPLETED,
+	OrderStatus.IN_PROGRESS
+))
+
+
+class CheckpointJournal:
+	"""
+	Append-only JSON lines journal of processed orders, one file per user.
+
+	Each line holds the ID, status and priority of one processed order. When a run
+	fails, the journal stays behind and the next run of that user restores those
+	orders instead of processing them again. A successful run deletes its journal.
+	Only orders with one of the FINAL_STATUSES are journaled, so failures such as
+	API_FAILURE or EXPORT_FAILED are retried. A line cut short by a crash is
+	ignored when the journal is read back.
+	"""
+
+	def __init__(self, directory: str, fsync: bool = False):
+		"""
+		Args:
+			directory(str): Directory holding the journal files, created when missing
+			fsync(bool): fsync after every append, so entries also survive an OS crash
+		"""
+		self.directory = directory
+		self.fsync = fsync
+		self._lock = threading.Lock()
+		self._completed: Dict[int, Dict[Any, CheckpointEntry]] = {}
+		self._files: Dict[int, Any] = {}
+
+	def path(self, user_id: int) -> str:
+		return os.path.join(self.directory, f"orders_{user_id}.jsonl")
+
+	def open(self, user_id: int) -> Dict[Any, CheckpointEntry]:
+		"""
+		Start a run of a user, loading the orders completed by earlier runs
+		Args:
+			user_id(int): User ID
+
+		Returns:
+			Dict[Any, CheckpointEntry]: status and priority by order ID
+		"""
+		completed = {}
+		try:
+			with open(self.path(user_id)) as journal_file:
+				for line in journal_file:
+					try:
+						entry = json.loads(line)
+						if entry["status"] in FINAL_STATUSES:
+							completed[entry["id"]] = (entry["status"], entry["priority"])
+					except (ValueError, KeyError, TypeError):
+						continue
+		except FileNotFoundError:
+			pass
+
+		with self._lock:
+			self._completed[user_id] = completed
+
+		return completed
+
+	def completed_orders(self, user_id: int) -> Dict[Any, CheckpointEntry]:
+		with self._lock:
+			return self._completed.get(user_id, {})
+
+	def record(self, user_id: int, orders: Iterable[Order]) -> None:
+		"""
+		Append processed orders to the journal of a user. Ignored unless a run of
+		the user is open.
+		Args:
+			user_id(int): User ID
+			orders(Iterable[Order]): Orders whose status and priority are final
+		"""
+		self.record_entries(user_id, ((order.id, order.status, order.priority) for order in orders))
+
+	def record_entries(self, user_id: int, entries: Iterable[Tuple[Any, str, str]]) -> None:
+		"""
+		Append (order ID, status, priority) entries to the journal of a user,
+		skipping those whose status is not one of the FINAL_STATUSES
+		Args:
+			user_id(int): User ID
+			entries(Iterable[Tuple[Any, str, str]]): Entries of processed orders
+		"""
+		lines = "".join(
+			json.dumps({"id": order_id, "status": status, "priority": priority}) + "\n"
+			for order_id, status, priority in entries
+			if status in FINAL_STATUSES
+		)
+		if not lines:
+			return
+
+		with self._lock:
+			if user_id not in self._completed:
+				return
+
+			journal_file = self._files.get(user_id)
+			if journal_file is None:
+				os.makedirs(self.directory, exist_ok=True)
+				journal_file = self._files[user_id] = open(self.path(user_id), "a")
+
+			journal_file.write(lines)
+			journal_file.flush()
+			if self.fsync:
+				os.fsync(journal_file.fileno())
+
+	def close(self, user_id: int) -> None:
+		"""Finish a failed run, keeping the journal for the next one"""
+		with self._lock:
+			self._completed.pop(user_id, None)
+			journal_file = self._files.pop(user_id, None)
+			if journal_file is not None:
+				journal_file.close()
+
+	def complete(self, user_id: int) -> None:
+		"""Finish a successful run, deleting the journal"""
+		self.close(user_id)
+		try:
+			os.remove(self.path(user_id))
+		except FileNotFoundError:
+			pass
@@ -0,0 +1,341 @@
+import gzip
+import os
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+from src.constants import OrderStatus, Thresholds, CSVHeaders, ExportFormat
+from src.entities.order import Order
+
+try:
+	import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+	zstandard = None
+
+
+def build_csv_row(order: Order) -> List[Any]:
+	"""
+	Build the CSV row written for a Type A order
+	Args:
+		order(Order): Order to export
+
+	Returns:
+		List[Any]: row values in CSVHeaders.HEADERS order
+	"""
+	return [
+		order.id,
+		order.type,
+		order.amount,
+		str(order.flag).lower(),
+		order.status,
+		order.priority
+	]
+
+
+def is_high_value_order(order: Order) -> bool:
+	return bool(order.amount and order.amount > Thresholds.HIGH_VALUE_ORDER)
+
+
+# Line terminator and special characters of csv.writer's default "excel" dialect
+_LINE_TERMINATOR = "\r\n"
+_QUOTE_TRIGGERS = frozenset(',"\r\n')
+
+
+def _format_field(value: Any) -> str:
+	"""Format one field exactly like csv.writer with QUOTE_MINIMAL"""
+	if value is None:
+		return ""
+
+	text = value if isinstance(value, str) else str(value)
+	if _QUOTE_TRIGGERS.isdisjoint(text):
+		return text
+
+	return '"' + text.replace('"', '""') + '"'
+
+
+def _format_line(values: List[Any]) -> str:
+	return ",".join(_format_field(value) for value in values) + _LINE_TERMINATOR
+
+
+class CSVBlockWriter:
+	"""
+	Write Type A order rows into an in-memory buffer and hand them to the file in
+	large blocks. The output is byte-identical to csv.writer with the default dialect.
+
+	Header, note and boolean fields are precomputed, and the formatted type, status
+	and priority strings are memoized because they come from small sets of values.
+	Type, status and priority must be hashable.
+	"""
+
+	HEADER_LINE = _format_line(CSVHeaders.HEADERS)
+	HIGH_VALUE_NOTE_LINE = _format_line(CSVHeaders.HIGH_VALUE_NOTE)
+	FLAGS = {True: "true", False: "false"}
+	MAX_MEMOIZED_FIELDS = 256
+
+	def __init__(self, csv_file: TextIO, block_size: int = 1 << 20):
+		"""
+		Args:
+			csv_file(TextIO): File opened with newline=""
+			block_size(int): Number of buffered characters that triggers a write
+		"""
+		if block_size < 1:
+			raise ValueError("block_size must be at least 1")
+
+		self._csv_file = csv_file
+		self.block_size = block_size
+		self._lines: List[str] = []
+		self._buffered = 0
+		self._fields: Dict[str, str] = {}
+
+	def write_header(self) -> None:
+		self._lines.append(self.HEADER_LINE)
+		self._buffered += len(self.HEADER_LINE)
+
+	def write_order(self, order: Order) -> None:
+		# Called once per exported order, so the common cases are inlined
+		fields = self._fields
+		order_id = order.id
+		order_type = order.type
+		amount = order.amount
+		flag = order.flag
+		status = order.status
+		priority = order.priority
+		line = (
+			f"{order_id if type(order_id) is int else _format_field(order_id)},"
+			f"{fields[order_type] if order_type in fields else self._field(order_type)},"
+			f"{amount if type(amount) is float else _format_field(amount)},"
+			f"{self.FLAGS[flag] if flag is True or flag is False else _format_field(str(flag).lower())},"
+			f"{fields[status] if status in fields else self._field(status)},"
+			f"{fields[priority] if priority in fields else self._field(priority)}{_LINE_TERMINATOR}"
+		)
+		if amount > Thresholds.HIGH_VALUE_ORDER if type(amount) is float else is_high_value_order(order):
+			line += self.HIGH_VALUE_NOTE_LINE
+
+		self._lines.append(line)
+		self._buffered += len(line)
+		if self._buffered >= self.block_size:
+			self.flush()
+
+	def flush(self) -> None:
+		"""Write the buffered rows to the file as one block"""
+		if not self._lines:
+			return
+
+		block = "".join(self._lines)
+		self._lines = []
+		self._buffered = 0
+		self._csv_file.write(block)
+
+	def _field(self, value: Any) -> str:
+		field = _format_field(value)
+		# Only str and None keys, so equal values of other types (1, True, 1.0) never share an entry
+		if (value is None or type(value) is str) and len(self._fields) < self.MAX_MEMOIZED_FIELDS:
+			self._fields[value] = field
+
+		return field
+
+
+def open_csv_export_file(file_name: str, export_format: ExportFormat = ExportFormat.CSV) -> TextIO:
+	"""
+	Open a text file for CSV export, compressing on the fly for the compressed formats
+	Args:
+		file_name(str): File to create
+		export_format(ExportFormat): CSV, CSV_GZIP or CSV_ZSTD
+
+	Returns:
+		TextIO: file opened for writing with newline=""
+	"""
+	if export_format is ExportFormat.CSV:
+		return open(file_name, "w", newline="")
+	if export_format is ExportFormat.CSV_GZIP:
+		return gzip.open(file_name, "wt", newline="")
+	if export_format is ExportFormat.CSV_ZSTD:
+		if zstandard is None:
+			raise ValueError("The csv.zst export format requires the zstandard package")
+		return zstandard.open(file_name, "w", newline="")
+
+	raise ValueError(f"{export_format.value} is not a CSV export format")
+
+
+def sync_file(file_name: str) -> None:
+	"""
+	Force the written contents of a file to disk. Works after the writing
+	file object is closed, so it also covers compressed trailers and footers.
+	Args:
+		file_name(str): File to sync
+	"""
+	file_descriptor = os.open(file_name, os.O_RDONLY)
+	try:
+		os.fsync(file_descriptor)
+	finally:
+		os.close(file_descriptor)
+
+
+def sync_directory(directory: str) -> None:
+	"""
+	Force a directory entry change, such as a rename, to disk
+	Args:
+		directory(str): Directory to sync
+	"""
+	sync_file(directory or ".")
+
+
+def temporary_file_name(file_name: str) -> str:
+	"""Hidden name in the same directory, so the final rename stays on one file system"""
+	directory, base_name = os.path.split(file_name)
+
+	return os.path.join(directory, f".{base_name}.tmp")
+
+
+class ExportSession(ABC):
+	"""
+	Export all Type A orders of one process_orders run into a single file.
+
+	Each order gets its own EXPORTED / EXPORT_FAILED status; orders written since
+	the last flush are marked EXPORT_FAILED if flushing or closing the file fails.
+	"""
+
+	# Name of the export file, None until the first order is written
+	file_name: Optional[str]
+
+	@abstractmethod
+	def write_order(self, order: Order) -> Order:
+		pass
+
+	@abstractmethod
+	def flush(self) -> None:
+		pass
+
+	@abstractmethod
+	def close(self) -> bool:
+		"""
+		Complete the export file
+		Returns:
+			bool: False if the file could not be completed and its pending orders were marked EXPORT_FAILED
+		"""
+
+
+class FileExportSession(ExportSession):
+	"""
+	Base of the export sessions writing a file themselves.
+
+	The file is opened lazily on the first write, so a run without Type A orders
+	creates no file. Durable sessions also fsync the file on every flush and close,
+	and treat a failed fsync like a failed write.
+
+	Atomic sessions write to a hidden temporary file next to file_name and rename it
+	to file_name only once it is closed, so readers never see a partial export. A
+	file that fails to close is left under its temporary name. Their orders stay
+	pending until then, so a failed close marks every order of the file EXPORT_FAILED.
+	"""
+
+	def __init__(self, file_name_factory: Callable[[], str], durable: bool = False, atomic: bool = False):
+		self._file_name_factory = file_name_factory
+		self.file_name: Optional[str] = None
+		self.durable = durable
+		self.atomic = atomic
+		self._path: Optional[str] = None
+		self._pending_orders: List[Order] = []
+
+	def _mark_pending_orders_failed(self) -> None:
+		for order in self._pending_orders:
+			order.status = OrderStatus.EXPORT_FAILED.value
+
+	def _confirm_flushed_orders(self) -> None:
+		# Rows of an atomic export are only confirmed once the file is published on close
+		if not self.atomic:
+			self._pending_orders = []
+
+	def _open_path(self) -> str:
+		# Name the export and return the path the rows are written to
+		self.file_name = self._file_name_factory()
+		directory = os.path.dirname(self.file_name)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		self._path = temporary_file_name(self.file_name) if self.atomic else self.file_name
+
+		return self._path
+
+	def _sync(self) -> None:
+		if self.durable:
+			sync_file(self._path)
+
+	def _publish(self) -> None:
+		if not self.atomic:
+			return
+
+		os.replace(self._path, self.file_name)
+		if self.durable:
+			sync_directory(os.path.dirname(self.file_name))
+
+
+class CSVExportSession(FileExportSession):
+	"""
+	Export session writing one CSV file, optionally gzip or zstd compressed while it is written.
+	"""
+
+	def __init__(
+		self,
+		file_name_factory: Callable[[], str],
+		export_format: ExportFormat = ExportFormat.CSV,
+		durable: bool = False,
+		atomic: bool = False
+	):
+		super().__init__(file_name_factory, durable, atomic)
+		self.export_format = export_format
+		self._csv_file = None
+		self._block_writer: Optional[CSVBlockWriter] = None
+
+	def write_order(self, order: Order) -> Order:
+		try:
+			if self._csv_file is None:
+				self._open()
+
+			self._block_writer.write_order(order)
+			order.status = OrderStatus.EXPORTED.value
+			self._pending_orders.append(order)
+		except IOError:
+			# A failed block write loses every row buffered since the last flush
+			self._mark_pending_orders_failed()
+			self._pending_orders = []
+			order.status = OrderStatus.EXPORT_FAILED.value
+
+		return order
+
+	def flush(self) -> None:
+		if self._csv_file is None:
+			return
+
+		try:
+			self._block_writer.flush()
+			self._csv_file.flush()
+			self._sync()
+		except IOError:
+			self._mark_pending_orders_failed()
+
+		self._confirm_flushed_orders()
+
+	def close(self) -> bool:
+		if self._csv_file is None:
+			return True
+
+		try:
+			try:
+				self._block_writer.flush()
+			finally:
+				self._csv_file.close()
+			self._sync()
+			self._publish()
+			return True
+		except IOError:
+			self._mark_pending_orders_failed()
+			return False
+		finally:
+			self._csv_file = None
+			self._block_writer = None
+			self._pending_orders = []
+
+	def _open(self) -> None:
+		self._csv_file = open_csv_export_file(self._open_path(), self.export_format)
+		self._block_writer = CSVBlockWriter(self._csv_file)
+		self._block_writer.write_header()
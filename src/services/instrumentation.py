@@ -0,0 +1,130 @@
+import math
+import random
+import threading
+import time
+
+from typing import Dict, List
+
+
+class Instrumentation:
+	"""
+	Hooks called by OrderProcessingService around each processing stage.
+	Subclasses override on_stage_start / on_stage_end; the defaults do nothing.
+	"""
+
+	def on_stage_start(self, stage: str) -> None:
+		pass
+
+	def on_stage_end(self, stage: str, elapsed: float) -> None:
+		pass
+
+	def span(self, stage: str) -> "Span":
+		return Span(self, stage)
+
+
+class CompositeInstrumentation(Instrumentation):
+	"""Forward stage hooks to several Instrumentation instances, in order"""
+
+	def __init__(self, instrumentations: List[Instrumentation]):
+		self.instrumentations = list(instrumentations)
+
+	def on_stage_start(self, stage: str) -> None:
+		for instrumentation in self.instrumentations:
+			instrumentation.on_stage_start(stage)
+
+	def on_stage_end(self, stage: str, elapsed: float) -> None:
+		for instrumentation in self.instrumentations:
+			instrumentation.on_stage_end(stage, elapsed)
+
+
+class Span:
+	"""Context manager timing one stage and reporting it to an Instrumentation"""
+
+	__slots__ = ("_instrumentation", "_stage", "_started_at")
+
+	def __init__(self, instrumentation: Instrumentation, stage: str):
+		self._instrumentation = instrumentation
+		self._stage = stage
+		self._started_at = 0.0
+
+	def __enter__(self) -> "Span":
+		self._instrumentation.on_stage_start(self._stage)
+		self._started_at = time.perf_counter()
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback) -> None:
+		self._instrumentation.on_stage_end(self._stage, time.perf_counter() - self._started_at)
+
+
+class _StageStats:
+	__slots__ = ("count", "total", "samples")
+
+	def __init__(self):
+		self.count = 0
+		self.total = 0.0
+		self.samples: List[float] = []
+
+
+class InMemoryCollector(Instrumentation):
+	"""
+	Collect stage timings in memory and report count, total time and p50/p95/p99.
+
+	Count and total are exact. Percentiles are computed from a uniform reservoir
+	sample of at most max_samples durations per stage, so memory stays bounded
+	when per-order stages run millions of times.
+	"""
+
+	def __init__(self, max_samples: int = 10000):
+		if max_samples < 1:
+			raise ValueError("max_samples must be at least 1")
+
+		self.max_samples = max_samples
+		self._stages: Dict[str, _StageStats] = {}
+		self._lock = threading.Lock()
+		self._random = random.Random()
+
+	def on_stage_end(self, stage: str, elapsed: float) -> None:
+		with self._lock:
+			stats = self._stages.get(stage)
+			if stats is None:
+				stats = self._stages[stage] = _StageStats()
+
+			stats.count += 1
+			stats.total += elapsed
+			if len(stats.samples) < self.max_samples:
+				stats.samples.append(elapsed)
+			else:
+				index = self._random.randrange(stats.count)
+				if index < self.max_samples:
+					stats.samples[index] = elapsed
+
+	def report(self) -> Dict[str, Dict[str, float]]:
+		"""
+		Summarize the collected timings
+		Returns:
+			Dict[str, Dict[str, float]]: per stage count, total, p50, p95 and p99 in seconds
+		"""
+		with self._lock:
+			report = {}
+			for stage, stats in self._stages.items():
+				samples = sorted(stats.samples)
+				report[stage] = {
+					"count": stats.count,
+					"total": stats.total,
+					"p50": self._percentile(samples, 50),
+					"p95": self._percentile(samples, 95),
+					"p99": self._percentile(samples, 99)
+				}
+
+			return report
+
+	def reset(self) -> None:
+		with self._lock:
+			self._stages.clear()
+
+	@staticmethod
+	def _percentile(sorted_samples: List[float], percentile: float) -> float:
+		# Nearest-rank percentile
+		rank = max(1, math.ceil(percentile / 100 * len(sorted_samples)))
+
+		return sorted_samples[rank - 1]
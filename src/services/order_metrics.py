@@ -0,0 +1,84 @@
+from typing import Any, Callable, Iterable, Optional
+
+from src.constants import InstrumentationStages
+from src.entities.order import Order
+from src.services.instrumentation import Instrumentation
+from src.utils.metrics import MetricsRegistry
+
+BULK_UPDATE_SIZE_BUCKETS = (1, 10, 50, 100, 500, 1000, 5000, 10000, 50000)
+
+
+class OrderMetrics(Instrumentation):
+	"""
+	Prometheus-style metrics for OrderProcessingService.
+
+	API latency and in-flight API calls are taken from the API_CALL stage hooks;
+	order outcomes and bulk update sizes are recorded by the service after each
+	bulk update.
+	"""
+
+	def __init__(self, registry: Optional[MetricsRegistry] = None, prefix: str = "orders"):
+		"""
+		Args:
+			registry(Optional[MetricsRegistry]): Registry the metrics are added to.
+				Defaults to a new MetricsRegistry.
+			prefix(str): Prefix of every metric name
+		"""
+		self.registry = registry or MetricsRegistry()
+		self.outcomes = self.registry.counter(
+			f"{prefix}_processed_total",
+			"Processed orders, by order type and final status",
+			("type", "status")
+		)
+		self.skipped_writes = self.registry.counter(
+			f"{prefix}_skipped_writes_total",
+			"Orders left out of bulk updates because their status and priority were unchanged"
+		)
+		self.api_latency = self.registry.histogram(
+			f"{prefix}_api_call_duration_seconds",
+			"Duration of API lookups for Type B orders"
+		)
+		self.api_in_flight = self.registry.gauge(
+			f"{prefix}_api_calls_in_flight",
+			"API lookups currently in flight"
+		)
+		self.bulk_update_size = self.registry.histogram(
+			f"{prefix}_bulk_update_size",
+			"Number of orders per bulk update",
+			buckets=BULK_UPDATE_SIZE_BUCKETS
+		)
+
+	def on_stage_start(self, stage: str) -> None:
+		if stage == InstrumentationStages.API_CALL:
+			self.api_in_flight.inc()
+
+	def on_stage_end(self, stage: str, elapsed: float) -> None:
+		if stage == InstrumentationStages.API_CALL:
+			self.api_in_flight.dec()
+			self.api_latency.observe(elapsed)
+
+	def record_bulk_update(
+		self,
+		orders: Iterable[Order],
+		type_label: Callable[[Any], str],
+		written_orders: Optional[int] = None
+	) -> None:
+		"""
+		Count the final status of every order of one bulk update
+		Args:
+			orders(Iterable[Order]): Orders of the bulk update, written or skipped
+			type_label(Callable[[Any], str]): Maps an order type to its label value
+			written_orders(Optional[int]): Number of orders actually written.
+				Defaults to all orders.
+		"""
+		size = 0
+		for order in orders:
+			self.outcomes.inc(1, type_label(order.type), order.status)
+			size += 1
+
+		if written_orders is None:
+			written_orders = size
+		if written_orders:
+			self.bulk_update_size.observe(written_orders)
+		if size > written_orders:
+			self.skipped_writes.inc(size - written_orders)
@@ -1,121 +1,660 @@
-import csv
+import hashlib
+import itertools
+import os
 import time
 
-from typing import Any
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from src.constants import (
 	OrderType,
 	OrderStatus,
 	OrderPriority,
 	Thresholds,
-	CSVHeaders,
-	APIResponseStatus
+	APIResponseStatus,
+	InstrumentationStages,
+	ExportFormat,
+	ExportSharding
 )
 from src.utils.exceptions import APIException, DatabaseException
-from src.utils.response import APIResponse
+from src.utils.response import APIResponse, OrderProcessingResult
 from src.services.api_client import APIClient
+from src.services.instrumentation import Instrumentation, CompositeInstrumentation
+from src.services.order_metrics import OrderMetrics
+from src.services.csv_export import ExportSession, CSVExportSession
+from src.services.parquet_export import ParquetExportSession
+from src.services.background_export import BackgroundExportSession
+from src.services.checkpoint_journal import CheckpointJournal
+from src.services.single_flight import SingleFlight
+from src.services import csv_export, parquet_export
+from src.services.order_rules import apply_priorities, apply_type_c_statuses, type_codes_of
+from src.services.order_type_registry import OrderTypeRegistry, OrderTypeHandler
 from src.entities.order import Order
+from src.entities.order_batch import OrderBatch
 from src.repositories.order import OrderRepository
 
+# Shared by every stage when no instrumentation is attached
+_NO_SPAN = nullcontext()
+
+# Shared by all services of the process, so export file names never repeat
+_EXPORT_FILE_SEQUENCE = itertools.count()
+
 class OrderProcessingService:
-	def __init__(self, api_client: APIClient):
+	def __init__(
+		self,
+		api_client: APIClient,
+		max_api_concurrency: Optional[int] = None,
+		api_batch_size: Optional[int] = None,
+		stream_page_size: Optional[int] = None,
+		prefetch_pages: bool = False,
+		bulk_update_flush_size: Optional[int] = None,
+		db_chunk_size: Optional[int] = None,
+		order_repository: Optional[OrderRepository] = None,
+		order_type_handlers: Optional[Dict[Union[OrderType, str], OrderTypeHandler]] = None,
+		instrumentation: Optional[Instrumentation] = None,
+		metrics: Optional[OrderMetrics] = None,
+		export_format: ExportFormat = ExportFormat.CSV,
+		export_queue_size: Optional[int] = None,
+		export_dir: Optional[str] = None,
+		export_sharding: ExportSharding = ExportSharding.NONE,
+		checkpoint_journal: Optional[CheckpointJournal] = None,
+		single_flight: Optional[SingleFlight] = None
+	):
+		"""
+		Args:
+			api_client(APIClient): Client used for Type B order lookups
+			max_api_concurrency(Optional[int]): Maximum number of Type B API calls in
+				flight at once. None or 1 keeps the sequential behaviour.
+			api_batch_size(Optional[int]): When set, Type B orders are looked up with
+				call_api_batch in chunks of this size
+			stream_page_size(Optional[int]): When set, orders are streamed from the
+				repository in pages of this size instead of loaded all at once
+			prefetch_pages(bool): Stream keyset-paginated pages and fetch the next page on
+				a background thread while the current one is processed. Needs stream_page_size.
+			bulk_update_flush_size(Optional[int]): Number of streamed orders written per
+				bulk_update_orders call. Defaults to stream_page_size.
+			db_chunk_size(Optional[int]): When set, bulk updates are committed in
+				transactions of this many orders and only failed chunks are marked DB_ERROR
+			order_repository(Optional[OrderRepository]): Repository to read and store
+				orders with. Defaults to a new OrderRepository.
+			order_type_handlers(Optional[Dict[Union[OrderType, str], OrderTypeHandler]]):
+				Extra or replacement handlers, registered on top of the built-in A/B/C ones
+			instrumentation(Optional[Instrumentation]): Receives timings of every stage
+			metrics(Optional[OrderMetrics]): Records order outcomes, API latency, API calls
+				in flight and bulk update sizes
+			export_format(ExportFormat): File format of the Type A export. CSV_ZSTD needs
+				the zstandard package and PARQUET needs pyarrow.
+			export_queue_size(Optional[int]): When set, Type A rows are written by a
+				background thread through a queue of this many orders, and orders are
+				marked EXPORTED only once their rows are synced to disk
+			export_dir(Optional[str]): Directory Type A exports are written to.
+				Defaults to the working directory.
+			export_sharding(ExportSharding): Subdirectories of export_dir to spread the
+				export files over, by hash of the user ID or by date
+			checkpoint_journal(Optional[CheckpointJournal]): Records every processed order,
+				so a run retried after a failure only processes the remaining orders
+			single_flight(Optional[SingleFlight]): Concurrent runs of the same user share
+				one run and its result. Use a FileLockSingleFlight to share runs between
+				the processes of a host.
+		"""
+		if max_api_concurrency is not None and max_api_concurrency < 1:
+			raise ValueError("max_api_concurrency must be at least 1")
+		if api_batch_size is not None and api_batch_size < 1:
+			raise ValueError("api_batch_size must be at least 1")
+		if stream_page_size is not None and stream_page_size < 1:
+			raise ValueError("stream_page_size must be at least 1")
+		if prefetch_pages and not stream_page_size:
+			raise ValueError("prefetch_pages requires stream_page_size")
+		if bulk_update_flush_size is not None and bulk_update_flush_size < 1:
+			raise ValueError("bulk_update_flush_size must be at least 1")
+		if db_chunk_size is not None and db_chunk_size < 1:
+			raise ValueError("db_chunk_size must be at least 1")
+		if export_queue_size is not None and export_queue_size < 1:
+			raise ValueError("export_queue_size must be at least 1")
+		if export_format is ExportFormat.CSV_ZSTD and csv_export.zstandard is None:
+			raise ValueError("The csv.zst export format requires the zstandard package")
+		if export_format is ExportFormat.PARQUET and not parquet_export.is_pyarrow_installed():
+			raise ValueError("The parquet export format requires the pyarrow package")
+
 		self.api_client = api_client
-		self.order_repository = OrderRepository()
+		self.order_repository = order_repository or OrderRepository()
+		self.max_api_concurrency = max_api_concurrency
+		self.api_batch_size = api_batch_size
+		self._api_batch_supported = True
+		self.stream_page_size = stream_page_size
+		self.prefetch_pages = prefetch_pages
+		self.bulk_update_flush_size = bulk_update_flush_size or stream_page_size
+		self.db_chunk_size = db_chunk_size
+		self.export_format = export_format
+		self.export_queue_size = export_queue_size
+		self.export_dir = export_dir
+		self.export_sharding = export_sharding
+		self.checkpoint_journal = checkpoint_journal
+		self.single_flight = single_flight
+		self.instrumentation = instrumentation
+		self.metrics = metrics
+		self._stage_hooks = self._combine_stage_hooks(instrumentation, metrics)
+		self.order_type_registry = self._create_order_type_registry()
+		for order_type, handler in (order_type_handlers or {}).items():
+			self.order_type_registry.register(order_type, handler)
+
+	def _create_order_type_registry(self) -> OrderTypeRegistry:
+		# Built-in handlers look the methods up on every call so they can be patched per instance
+		self._builtin_handlers = {
+			OrderType.TYPE_A.value: lambda order, user_id, export_session:
+				self._process_type_a_order(order, user_id, export_session),
+			OrderType.TYPE_B.value: lambda order, user_id, export_session:
+				self._process_type_b_order(order),
+			OrderType.TYPE_C.value: lambda order, user_id, export_session:
+				self._process_type_c_order(order)
+		}
+		registry = OrderTypeRegistry()
+		for order_type, handler in self._builtin_handlers.items():
+			registry.register(order_type, handler)
+
+		return registry
+
+	@staticmethod
+	def _combine_stage_hooks(*hooks: Optional[Instrumentation]) -> Optional[Instrumentation]:
+		attached = [hook for hook in hooks if hook is not None]
+		if not attached:
+			return None
+		if len(attached) == 1:
+			return attached[0]
+
+		return CompositeInstrumentation(attached)
+
+	def _span(self, stage: str):
+		if self._stage_hooks is None:
+			return _NO_SPAN
+
+		return self._stage_hooks.span(stage)
+
+	def _order_type_label(self, order_type: Any) -> str:
+		# Unregistered or malformed types share one label to keep metric cardinality bounded
+		try:
+			if order_type in self.order_type_registry:
+				return self.order_type_registry.normalize(order_type)
+		except (ValueError, AttributeError):
+			pass
+
+		return "unknown"
+
+	def _uses_builtin_handler(self, order_type: OrderType) -> bool:
+		return self.order_type_registry.get_handler(order_type.value) is self._builtin_handlers[order_type.value]
 
 	def process_orders(self, user_id: int) -> bool:
+		return self.process_orders_with_result(user_id).success
+
+	def process_orders_with_result(self, user_id: int) -> OrderProcessingResult:
+		"""
+		Process a user's orders like process_orders and report what was written.
+		Orders whose status and priority are unchanged since they were loaded are
+		left out of the bulk update.
+		Args:
+			user_id(int): User ID
+
+		Returns:
+			OrderProcessingResult: success flag and processed, written and skipped order counts
+		"""
+		if self.single_flight is None:
+			return self._run_process_orders(user_id)
+
+		try:
+			return self.single_flight.do(("process_orders", user_id), lambda: self._run_process_orders(user_id))
+		except Exception:
+			return OrderProcessingResult()
+
+	def _run_process_orders(self, user_id: int) -> OrderProcessingResult:
+		result = OrderProcessingResult()
 		try:
+			self._open_checkpoint(user_id)
+			try:
+				if self.stream_page_size:
+					result.success = self._process_order_stream(user_id, result)
+				else:
+					result.success = self._process_all_orders(user_id, result)
+			finally:
+				self._close_checkpoint(user_id, result.success)
+		except Exception:
+			result.success = False
+
+		return result
+
+	def _process_all_orders(self, user_id: int, result: OrderProcessingResult) -> bool:
+		with self._span(InstrumentationStages.GET_ORDERS):
 			orders = self.order_repository.get_orders_by_user(user_id)
 
-			if not orders:
-				return False
+		if not orders:
+			return False
 
-			processed_orders = []
-			for order in orders:
-				processed_order = self._process_single_order(order, user_id)
-				processed_orders.append(processed_order)
+		# All Type A orders of this run are exported into a single file
+		export_session = self._create_export_session(user_id)
+		try:
+			processed_orders = self._process_order_chunk(orders, user_id, export_session)
+		finally:
+			with self._span(InstrumentationStages.EXPORT_FLUSH):
+				published = export_session.close()
+		if published:
+			self._checkpoint_exported_orders(user_id, processed_orders)
 
-			# Bulk update all processed orders
+		# Bulk update all changed orders
+		return self._bulk_update_orders(processed_orders, result) and published
+
+	def process_order_batch(self, batch: OrderBatch, user_id: int) -> OrderBatch:
+		"""
+		Process a columnar batch of orders. Type C statuses and priorities are
+		computed over the whole batch at once, the other order types go through
+		the per-order handlers. Storing the results is left to the caller.
+		Args:
+			batch(OrderBatch): Orders to process
+			user_id(int): User ID
+
+		Returns:
+			OrderBatch: the same batch, holding the new statuses and priorities
+		"""
+		if self._uses_builtin_handler(OrderType.TYPE_C):
+			type_c_codes = type_codes_of(batch, OrderType.TYPE_C)
+		else:
+			type_c_codes = set()
+		indexes = [
+			index for index, type_code in enumerate(batch.type_codes)
+			if type_code not in type_c_codes
+		]
+		orders = [batch.order_at(index) for index in indexes]
+
+		export_session = self._create_export_session(user_id)
+		try:
+			self._process_order_chunk(orders, user_id, export_session)
+		finally:
+			export_session.close()
+
+		for index, order in zip(indexes, orders):
+			batch.store(index, order)
+
+		if type_c_codes:
+			apply_type_c_statuses(batch)
+		apply_priorities(batch)
+
+		return batch
+
+	def _process_order_stream(self, user_id: int, result: Optional[OrderProcessingResult] = None) -> bool:
+		"""
+		Process a user's orders page by page, flushing bulk updates every
+		bulk_update_flush_size orders so memory stays flat for large histories.
+		The Type A orders of every chunk are exported into a file of their own,
+		published before the chunk's statuses are stored. A failed flush or export
+		fails only its own chunk; later chunks are still processed.
+		Args:
+			user_id(int): User ID
+			result(Optional[OrderProcessingResult]): Receives the order counts of every flush
+
+		Returns:
+			bool: True if the user had orders and every flush succeeded
+		"""
+		if self.prefetch_pages:
+			orders = self.order_repository.iter_orders_by_user_prefetched(user_id, self.stream_page_size)
+		else:
+			orders = self.order_repository.iter_orders_by_user(user_id, self.stream_page_size)
+		has_orders = False
+		success = True
+		for chunk in self._iter_chunks(orders, self.bulk_update_flush_size):
+			has_orders = True
+			# An EXPORTED status is only stored once the file holding the row is published
+			export_session = self._create_export_session(user_id)
 			try:
-				self.order_repository.bulk_update_orders(processed_orders)
-			except DatabaseException:
-				# If bulk update fails, mark all orders as having DB error
-				for order in processed_orders:
-					order.status = OrderStatus.DB_ERROR.value
-				return False
-
-			return True
-		except Exception:
+				processed_orders = self._process_order_chunk(chunk, user_id, export_session)
+			finally:
+				with self._span(InstrumentationStages.EXPORT_FLUSH):
+					published = export_session.close()
+			if published:
+				self._checkpoint_exported_orders(user_id, processed_orders)
+			success = self._bulk_update_orders(processed_orders, result) and published and success
+
+		return has_orders and success
+
+	def _create_export_session(self, user_id: int) -> ExportSession:
+		def file_name_factory() -> str:
+			return self._create_csv_file_name(user_id, OrderType.TYPE_A.value)
+
+		durable = self.export_queue_size is not None
+		if self.export_format is ExportFormat.PARQUET:
+			export_session = ParquetExportSession(file_name_factory, durable=durable, atomic=True)
+		else:
+			export_session = CSVExportSession(file_name_factory, self.export_format, durable=durable, atomic=True)
+
+		if self.export_queue_size is None:
+			return export_session
+
+		return BackgroundExportSession(export_session, self.export_queue_size)
+
+	def _iter_chunks(self, orders: Iterable[Order], chunk_size: int) -> Iterator[List[Order]]:
+		orders = iter(orders)
+		while True:
+			# Pages are fetched lazily, so reading the next chunk is the fetch stage
+			with self._span(InstrumentationStages.GET_ORDERS):
+				chunk = list(islice(orders, chunk_size))
+			if not chunk:
+				return
+			yield chunk
+
+	def _process_order_chunk(
+		self,
+		orders: Iterable[Order],
+		user_id: int,
+		export_session: ExportSession
+	) -> List[Order]:
+		if self.checkpoint_journal is not None:
+			orders = list(orders)
+			pending_orders = self._restore_checkpointed_orders(orders, user_id)
+		else:
+			pending_orders = orders
+
+		processed_orders, deferred_type_b_orders = self._process_orders_deferring_api_calls(
+			pending_orders, user_id, export_session
+		)
+		self._dispatch_type_b_orders(deferred_type_b_orders, user_id)
+
+		return orders if self.checkpoint_journal is not None else processed_orders
+
+	def _open_checkpoint(self, user_id: int) -> None:
+		if self.checkpoint_journal is not None:
+			self.checkpoint_journal.open(user_id)
+
+	def _close_checkpoint(self, user_id: int, success: bool) -> None:
+		if self.checkpoint_journal is None:
+			return
+
+		if success:
+			self.checkpoint_journal.complete(user_id)
+		else:
+			self.checkpoint_journal.close(user_id)
+
+	def _checkpoint(self, user_id: int, orders: Iterable[Order]) -> None:
+		if self.checkpoint_journal is not None:
+			self.checkpoint_journal.record(user_id, orders)
+
+	def _restore_checkpointed_orders(self, orders: List[Order], user_id: int) -> List[Order]:
+		"""
+		Restore the status and priority of orders completed by an earlier run
+		Args:
+			orders(List[Order]): Orders of the run
+			user_id(int): User ID
+
+		Returns:
+			List[Order]: orders that still have to be processed
+		"""
+		completed_orders = self.checkpoint_journal.completed_orders(user_id)
+		if not completed_orders:
+			return orders
+
+		pending_orders = []
+		for order in orders:
+			entry = completed_orders.get(order.id)
+			if entry is None:
+				pending_orders.append(order)
+			else:
+				order.status, order.priority = entry
+
+		return pending_orders
+
+	def _is_exported_on_close(self, order: Order) -> bool:
+		# Exported rows only become visible once the export session is closed
+		return (
+			self._order_type_label(order.type) == OrderType.TYPE_A.value
+			and self._uses_builtin_handler(OrderType.TYPE_A)
+		)
+
+	def _exported_orders(self, orders: List[Order], user_id: int) -> List[Order]:
+		completed_orders = self.checkpoint_journal.completed_orders(user_id)
+		return [
+			order for order in orders
+			if order.id not in completed_orders and self._is_exported_on_close(order)
+		]
+
+	def _checkpoint_exported_orders(self, user_id: int, orders: List[Order]) -> None:
+		if self.checkpoint_journal is not None:
+			self._checkpoint(user_id, self._exported_orders(orders, user_id))
+
+	def _process_orders_deferring_api_calls(
+		self,
+		orders: Iterable[Order],
+		user_id: int,
+		export_session: ExportSession,
+		should_defer: Optional[Callable[[Order], bool]] = None
+	) -> Tuple[List[Order], List[Order]]:
+		"""
+		Process every order whose API call is not deferred
+		Args:
+			orders(Iterable[Order]): Orders to process
+			user_id(int): User ID
+			export_session(ExportSession): Export session of the run
+			should_defer(Optional[Callable[[Order], bool]]): Selects the orders whose API
+				call is deferred. Defaults to _should_defer_api_call.
+
+		Returns:
+			Tuple[List[Order], List[Order]]: all orders in their original order, and the
+			Type B orders left for _dispatch_type_b_orders
+		"""
+		should_defer = should_defer or self._should_defer_api_call
+		processed_orders = []
+		deferred_type_b_orders = []
+		for order in orders:
+			if should_defer(order):
+				# Type B orders are dispatched together once the loop is done
+				deferred_type_b_orders.append(order)
+				processed_orders.append(order)
+				continue
+
+			processed_order = self._process_single_order(order, user_id, export_session)
+			processed_orders.append(processed_order)
+
+		return processed_orders, deferred_type_b_orders
+
+	def _bulk_update_orders(self, orders: List[Order], result: Optional[OrderProcessingResult] = None) -> bool:
+		changed_orders = [order for order in orders if order.is_dirty]
+		if changed_orders:
+			with self._span(InstrumentationStages.BULK_UPDATE):
+				success = self._store_orders(changed_orders)
+		else:
+			success = True
+
+		if result is not None:
+			result.processed_orders += len(orders)
+			result.written_orders += len(changed_orders)
+			result.skipped_writes += len(orders) - len(changed_orders)
+		if self.metrics is not None:
+			self.metrics.record_bulk_update(orders, self._order_type_label, len(changed_orders))
+
+		return success
+
+	def _store_orders(self, orders: List[Order]) -> bool:
+		if self.db_chunk_size:
+			result = self.order_repository.bulk_update_orders_in_chunks(orders, self.db_chunk_size)
+			for order in result.updated_orders:
+				order.mark_clean()
+			for order in result.failed_orders:
+				order.status = OrderStatus.DB_ERROR.value
+			return result.success
+
+		try:
+			self.order_repository.bulk_update_orders(orders)
+		except DatabaseException:
+			# If bulk update fails, mark all orders as having DB error
+			for order in orders:
+				order.status = OrderStatus.DB_ERROR.value
 			return False
-		
+
+		# The stored rows now match the orders
+		for order in orders:
+			order.mark_clean()
+
+		return True
+
 	def _create_csv_file_name(self, user_id: int, order_type: str) -> str:
 		"""
-		Create a csv file name with type of order and user id
+		Create an export file name with type of order and user id, ending in the
+		extension of the export format. The nanosecond timestamp, process ID and
+		sequence number make every name unique, also within the same second.
+		The name is placed in export_dir and its shard directory when configured.
 		Args:
 			user_id(int): User ID
 			order_type(str): Type of order
 
 		Returns:
-			str: csv file name
+			str: export file name
 		"""
 		if not order_type:
 			raise ValueError("Order type cannot be empty")
 		
-		return f"orders_type_{order_type}_{user_id}_{int(time.time())}.csv"
+		timestamp_ns = time.time_ns()
+		file_name = (
+			f"orders_type_{order_type}_{user_id}_{timestamp_ns}_{os.getpid()}_"
+			f"{next(_EXPORT_FILE_SEQUENCE)}.{self.export_format.value}"
+		)
+		shard = self._export_shard(user_id, timestamp_ns)
+		if self.export_dir is None and not shard:
+			return file_name
+
+		return os.path.join(self.export_dir or "", shard, file_name)
+
+	def _export_shard(self, user_id: int, timestamp_ns: int) -> str:
+		if self.export_sharding is ExportSharding.HASH:
+			digest = hashlib.md5(str(user_id).encode(), usedforsecurity=False).hexdigest()
+			return os.path.join(digest[:2], digest[2:4])
+		if self.export_sharding is ExportSharding.DATE:
+			return time.strftime(os.path.join("%Y", "%m", "%d"), time.gmtime(timestamp_ns // 1_000_000_000))
+
+		return ""
+
+	def _should_defer_api_call(self, order: Order) -> bool:
+		if not self.api_batch_size and (not self.max_api_concurrency or self.max_api_concurrency == 1):
+			return False
+
+		return (
+			self.order_type_registry.normalize(order.type) == OrderType.TYPE_B.value
+			and self._uses_builtin_handler(OrderType.TYPE_B)
+		)
+
+	def _dispatch_type_b_orders(self, orders: List[Order], user_id: int) -> List[Order]:
+		"""
+		Process deferred Type B orders, either in API batches or on a bounded thread pool
+		Args:
+			orders(List[Order]): Type B orders to process
+			user_id(int): User ID
+
+		Returns:
+			List[Order]: processed orders, in the same order as the input
+		"""
+		if not orders:
+			return orders
+
+		if self.api_batch_size and self._api_batch_supported:
+			for start in range(0, len(orders), self.api_batch_size):
+				self._process_type_b_batch(orders[start:start + self.api_batch_size], user_id)
+			return orders
+
+		return self._call_api_per_order(orders, user_id)
+
+	def _call_api_per_order(self, orders: List[Order], user_id: int) -> List[Order]:
+		if not self.max_api_concurrency or self.max_api_concurrency == 1:
+			return [self._process_single_order(order, user_id) for order in orders]
 
-	def _process_single_order(self, order: Order, user_id: int) -> Order:
-		order = self._process_order_by_type(order, user_id)
+		max_workers = min(self.max_api_concurrency, len(orders))
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			return list(executor.map(
+				lambda order: self._process_single_order(order, user_id),
+				orders
+			))
+
+	def _process_type_b_batch(self, orders: List[Order], user_id: int) -> List[Order]:
+		if not self._api_batch_supported:
+			return self._call_api_per_order(orders, user_id)
+
+		try:
+			with self._span(InstrumentationStages.API_CALL):
+				api_responses = self.api_client.call_api_batch([order.id for order in orders])
+		except NotImplementedError:
+			# Client has no batch endpoint, remember it and use single calls from now on
+			self._api_batch_supported = False
+			return self._call_api_per_order(orders, user_id)
+		except Exception:
+			api_responses = {}
+		if not isinstance(api_responses, dict):
+			# A malformed batch result fails each of its orders, not the run
+			api_responses = {}
+
+		for order in orders:
+			if order.id not in api_responses:
+				order.status = OrderStatus.API_FAILURE.value
+			else:
+				try:
+					self._handle_api_response(order, api_responses[order.id])
+				except Exception:
+					order.status = OrderStatus.API_FAILURE.value
+
+			self._update_order_priority(order)
+
+		self._checkpoint(user_id, orders)
+
+		return orders
+
+	def _process_single_order(
+		self,
+		order: Order,
+		user_id: int,
+		export_session: Optional[ExportSession] = None
+	) -> Order:
+		order = self._process_order_by_type(order, user_id, export_session)
 		order = self._update_order_priority(order)
+		if self.checkpoint_journal is not None and (
+			export_session is None or not self._is_exported_on_close(order)
+		):
+			self._checkpoint(user_id, [order])
 		
 		return order
 
-	def _process_order_by_type(self, order: Order, user_id: int) -> Order:
-		# Normalize order type by trimming whitespace and converting to uppercase
-		order_type = order.type.strip().upper()
-		
-		if order_type == OrderType.TYPE_A.value:
-			self._process_type_a_order(order, user_id)
-		elif order_type == OrderType.TYPE_B.value:
-			self._process_type_b_order(order)
-		elif order_type == OrderType.TYPE_C.value:
-			self._process_type_c_order(order)
-		else:
+	def _process_order_by_type(
+		self,
+		order: Order,
+		user_id: int,
+		export_session: Optional[ExportSession] = None
+	) -> Order:
+		handler = self.order_type_registry.get_handler(order.type)
+
+		if handler is None:
 			order.status = OrderStatus.UNKNOWN_TYPE.value
+		elif self.instrumentation is None:
+			handler(order, user_id, export_session)
+		else:
+			stage = f"{InstrumentationStages.HANDLE_ORDER}.{self.order_type_registry.normalize(order.type)}"
+			with self.instrumentation.span(stage):
+				handler(order, user_id, export_session)
 
 		return order
 
-	def _process_type_a_order(self, order: Order, user_id: int) -> Order:
-		try:
-			# Initialize CSV file for Type A orders
-			csv_filename = self._create_csv_file_name(user_id, OrderType.TYPE_A.value)
-			with open(csv_filename, "w", newline="") as csv_file:
-				csv_writer = csv.writer(csv_file)
-
-				# Write CSV headers
-				csv_writer.writerow(CSVHeaders.HEADERS)
-
-				# Write order to CSV
-				csv_writer.writerow([
-					order.id,
-					order.type,
-					order.amount,
-					str(order.flag).lower(),
-					order.status,
-					order.priority
-				])
-
-				# Add high value note if applicable
-				if order.amount and order.amount > Thresholds.HIGH_VALUE_ORDER:
-					csv_writer.writerow(CSVHeaders.HIGH_VALUE_NOTE)
-
-			order.status = OrderStatus.EXPORTED.value
-		except IOError:
-			order.status = OrderStatus.EXPORT_FAILED.value
-		
+	def _process_type_a_order(
+		self,
+		order: Order,
+		user_id: int,
+		export_session: Optional[ExportSession] = None
+	) -> Order:
+		if export_session is not None:
+			return export_session.write_order(order)
+
+		# A single order is exported into a file of its own, published like any other export
+		export_session = self._create_export_session(user_id)
+		export_session.write_order(order)
+		export_session.close()
+
 		return order
 
 	def _process_type_b_order(self, order: Order) -> Order:
 		try:
-			api_response = self.api_client.call_api(order.id)
+			with self._span(InstrumentationStages.API_CALL):
+				api_response = self.api_client.call_api(order.id)
 			order = self._handle_api_response(order, api_response)
 		except Exception:
 			order.status = OrderStatus.API_FAILURE.value
@@ -0,0 +1,116 @@
+"""
+Batch versions of the pure order rules of OrderProcessingService.
+
+The functions give exactly the same results as _update_order_priority and
+_process_type_c_order, but evaluate a whole batch at once. OrderBatch columns
+are processed with NumPy when it is installed and with a tight pure-Python
+loop otherwise.
+"""
+from array import array
+from typing import Iterable, List, Set
+
+from src.constants import OrderType, OrderStatus, OrderPriority, Thresholds
+from src.entities.order_batch import OrderBatch
+
+try:
+	import numpy
+except ImportError:  # pragma: no cover
+	numpy = None
+
+
+def compute_priorities(amounts: Iterable[float]) -> List[str]:
+	"""
+	Compute the priority of each amount
+	Args:
+		amounts(Iterable[float]): Order amounts
+
+	Returns:
+		List[str]: OrderPriority value for every amount
+	"""
+	high, low = OrderPriority.HIGH.value, OrderPriority.LOW.value
+	threshold = Thresholds.HIGH_PRIORITY_ORDER
+
+	return [high if amount > threshold else low for amount in amounts]
+
+
+def compute_type_c_statuses(flags: Iterable[bool]) -> List[str]:
+	"""
+	Compute the Type C status of each flag
+	Args:
+		flags(Iterable[bool]): Order flags
+
+	Returns:
+		List[str]: OrderStatus value for every flag
+	"""
+	completed, in_progress = OrderStatus.COMPLETED.value, OrderStatus.IN_PROGRESS.value
+
+	return [completed if flag else in_progress for flag in flags]
+
+
+def apply_priorities(batch: OrderBatch) -> OrderBatch:
+	"""
+	Set the priority of every order in the batch from its amount
+	Args:
+		batch(OrderBatch): Orders to update
+
+	Returns:
+		OrderBatch: the same batch
+	"""
+	high = batch.priorities.encode(OrderPriority.HIGH.value)
+	low = batch.priorities.encode(OrderPriority.LOW.value)
+	threshold = Thresholds.HIGH_PRIORITY_ORDER
+
+	if numpy is not None:
+		amounts = numpy.frombuffer(batch.amounts, dtype=numpy.float64)
+		codes = numpy.where(amounts > threshold, high, low).astype(numpy.uint8)
+		batch.priority_codes = array("B", codes.tobytes())
+	else:
+		batch.priority_codes = array("B", [high if amount > threshold else low for amount in batch.amounts])
+
+	return batch
+
+
+def apply_type_c_statuses(batch: OrderBatch) -> OrderBatch:
+	"""
+	Set the status of every Type C order in the batch from its flag.
+	Orders of other types keep their status.
+	Args:
+		batch(OrderBatch): Orders to update
+
+	Returns:
+		OrderBatch: the same batch
+	"""
+	type_c_codes = type_codes_of(batch, OrderType.TYPE_C)
+	completed = batch.statuses.encode(OrderStatus.COMPLETED.value)
+	in_progress = batch.statuses.encode(OrderStatus.IN_PROGRESS.value)
+
+	if numpy is not None:
+		type_codes = numpy.frombuffer(batch.type_codes, dtype=numpy.uint8)
+		flags = numpy.frombuffer(batch.flags, dtype=numpy.int8) != 0
+		status_codes = numpy.frombuffer(batch.status_codes, dtype=numpy.uint8)
+		is_type_c = numpy.isin(type_codes, list(type_c_codes))
+		codes = numpy.where(is_type_c, numpy.where(flags, completed, in_progress), status_codes)
+		batch.status_codes = array("B", codes.astype(numpy.uint8).tobytes())
+	else:
+		batch.status_codes = array("B", [
+			(completed if flag else in_progress) if type_code in type_c_codes else status_code
+			for type_code, flag, status_code in zip(batch.type_codes, batch.flags, batch.status_codes)
+		])
+
+	return batch
+
+
+def type_codes_of(batch: OrderBatch, order_type: OrderType) -> Set[int]:
+	"""
+	Find the batch type codes whose raw type normalizes to order_type
+	Args:
+		batch(OrderBatch): Orders to inspect
+		order_type(OrderType): Type to look for
+
+	Returns:
+		Set[int]: matching type codes
+	"""
+	return {
+		code for code, raw_type in enumerate(batch.types.values)
+		if isinstance(raw_type, str) and raw_type.strip().upper() == order_type.value
+	}
@@ -0,0 +1,70 @@
+import sys
+
+from typing import Any, Callable, Dict, Optional, Union
+
+from src.constants import OrderType
+from src.entities.order import Order
+
+# Handlers update the order in place: handler(order, user_id, export_session)
+OrderTypeHandler = Callable[[Order, int, Optional[Any]], Any]
+
+
+class OrderTypeRegistry:
+	"""
+	Map order types to the handlers that process them.
+
+	Raw order types are normalized (whitespace trimmed, upper-cased) and interned
+	once, then served from a cache, so dispatching an order costs one dict lookup
+	for the normalization and one for the handler.
+	"""
+
+	MAX_CACHED_TYPES = 1024
+
+	def __init__(self):
+		self._handlers: Dict[str, OrderTypeHandler] = {}
+		self._normalized_types: Dict[str, str] = {}
+
+	def register(self, order_type: Union[OrderType, str], handler: OrderTypeHandler) -> None:
+		"""
+		Register the handler of an order type, replacing any previous one
+		Args:
+			order_type(Union[OrderType, str]): Built-in type or the value of a new type, e.g. "D"
+			handler(OrderTypeHandler): Called as handler(order, user_id, export_session)
+		"""
+		self._handlers[self._to_key(order_type)] = handler
+
+	def unregister(self, order_type: Union[OrderType, str]) -> None:
+		self._handlers.pop(self._to_key(order_type), None)
+
+	def get_handler(self, raw_type: str) -> Optional[OrderTypeHandler]:
+		return self._handlers.get(self.normalize(raw_type))
+
+	def normalize(self, raw_type: str) -> str:
+		"""
+		Normalize a raw order type by trimming whitespace and converting to uppercase
+		Args:
+			raw_type(str): Order type as stored on the order
+
+		Returns:
+			str: interned normalized type
+		"""
+		normalized_type = self._normalized_types.get(raw_type)
+		if normalized_type is None:
+			normalized_type = sys.intern(raw_type.strip().upper())
+			# Bound the cache so dirty data cannot grow it without limit
+			if len(self._normalized_types) < self.MAX_CACHED_TYPES:
+				self._normalized_types[raw_type] = normalized_type
+
+		return normalized_type
+
+	def __contains__(self, order_type: Union[OrderType, str]) -> bool:
+		return self._to_key(order_type) in self._handlers
+
+	def _to_key(self, order_type: Union[OrderType, str]) -> str:
+		if isinstance(order_type, OrderType):
+			return order_type.value
+
+		if not order_type or not order_type.strip():
+			raise ValueError("Order type cannot be empty")
+
+		return self.normalize(order_type)
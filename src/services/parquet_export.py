@@ -0,0 +1,140 @@
+"""
+Columnar Parquet export of Type A orders. Requires pyarrow, which is optional and
+only imported once a ParquetExportSession is created, so CSV runs never load it.
+"""
+import importlib
+import importlib.util
+
+from types import ModuleType
+from typing import Any, Callable, Dict, List
+
+from src.constants import CSVHeaders, OrderStatus
+from src.entities.order import Order
+from src.services.csv_export import FileExportSession, is_high_value_order
+
+HIGH_VALUE_NOTE = CSVHeaders.HIGH_VALUE_NOTE[-1]
+COLUMNS = CSVHeaders.HEADERS + [CSVHeaders.NOTE_COLUMN]
+
+
+def is_pyarrow_installed() -> bool:
+	return importlib.util.find_spec("pyarrow") is not None
+
+
+def _schema(pyarrow: ModuleType):
+	return pyarrow.schema([
+		("ID", pyarrow.int64()),
+		("Type", pyarrow.string()),
+		("Amount", pyarrow.float64()),
+		("Flag", pyarrow.bool_()),
+		("Status", pyarrow.string()),
+		("Priority", pyarrow.string()),
+		(CSVHeaders.NOTE_COLUMN, pyarrow.string())
+	])
+
+
+class ParquetExportSession(FileExportSession):
+	"""
+	Export session writing Type A orders to a Parquet file.
+
+	Rows are buffered column by column and written as one row group per flush,
+	or earlier once row_group_size rows are buffered. The high value note is the
+	Note column, null for other orders. The file only becomes readable once the
+	footer is written on close.
+	"""
+
+	def __init__(
+		self,
+		file_name_factory: Callable[[], str],
+		row_group_size: int = 65536,
+		durable: bool = False,
+		atomic: bool = False
+	):
+		"""
+		Args:
+			file_name_factory(Callable[[], str]): Called once, on the first write
+			row_group_size(int): Maximum number of rows per row group
+			durable(bool): fsync the file on every flush and close
+			atomic(bool): Write to a temporary file renamed to the final name on close
+		"""
+		if not is_pyarrow_installed():
+			raise ValueError("The parquet export format requires the pyarrow package")
+		if row_group_size < 1:
+			raise ValueError("row_group_size must be at least 1")
+
+		super().__init__(file_name_factory, durable, atomic)
+		self.row_group_size = row_group_size
+		self._pyarrow = importlib.import_module("pyarrow")
+		self._parquet = importlib.import_module("pyarrow.parquet")
+		self._schema = _schema(self._pyarrow)
+		self._writer = None
+		self._columns: Dict[str, List[Any]] = {column: [] for column in COLUMNS}
+
+	def write_order(self, order: Order) -> Order:
+		try:
+			if self._writer is None:
+				self._open()
+
+			self._append_row(order)
+			order.status = OrderStatus.EXPORTED.value
+			self._pending_orders.append(order)
+
+			if len(self._columns["ID"]) >= self.row_group_size:
+				self._write_row_group()
+		except (IOError, self._pyarrow.ArrowException):
+			self._mark_pending_orders_failed()
+			self._pending_orders = []
+			order.status = OrderStatus.EXPORT_FAILED.value
+
+		return order
+
+	def flush(self) -> None:
+		if self._writer is None:
+			return
+
+		try:
+			self._write_row_group()
+			self._sync()
+		except (IOError, self._pyarrow.ArrowException):
+			self._mark_pending_orders_failed()
+
+		self._confirm_flushed_orders()
+
+	def close(self) -> bool:
+		if self._writer is None:
+			return True
+
+		try:
+			try:
+				self._write_row_group()
+			finally:
+				self._writer.close()
+			self._sync()
+			self._publish()
+			return True
+		except (IOError, self._pyarrow.ArrowException):
+			self._mark_pending_orders_failed()
+			return False
+		finally:
+			self._writer = None
+			self._pending_orders = []
+
+	def _open(self) -> None:
+		self._writer = self._parquet.ParquetWriter(self._open_path(), self._schema)
+
+	def _append_row(self, order: Order) -> None:
+		columns = self._columns
+		columns["ID"].append(order.id)
+		columns["Type"].append(order.type)
+		columns["Amount"].append(order.amount)
+		columns["Flag"].append(None if order.flag is None else bool(order.flag))
+		columns["Status"].append(order.status)
+		columns["Priority"].append(order.priority)
+		columns[CSVHeaders.NOTE_COLUMN].append(HIGH_VALUE_NOTE if is_high_value_order(order) else None)
+
+	def _write_row_group(self) -> None:
+		if not self._columns["ID"]:
+			return
+
+		columns = self._columns
+		self._columns = {column: [] for column in COLUMNS}
+		self._writer.write_table(self._pyarrow.table(columns, schema=self._schema))
@@ -0,0 +1,190 @@
+import random
+import threading
+import time
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from src.services.api_client import APIClient
+from src.utils.exceptions import CircuitOpenException
+from src.utils.response import APIResponse
+
+
+class CircuitBreaker:
+	"""
+	Stop calling a failing upstream for a while.
+
+	After failure_threshold consecutive failures the breaker opens and rejects
+	calls. Once reset_timeout has passed it lets a single trial call through
+	(half-open); a success closes it again, a failure re-opens it.
+	"""
+
+	CLOSED = "closed"
+	OPEN = "open"
+	HALF_OPEN = "half_open"
+
+	def __init__(
+		self,
+		failure_threshold: int = 5,
+		reset_timeout: float = 30.0,
+		clock: Callable[[], float] = time.monotonic
+	):
+		if failure_threshold < 1:
+			raise ValueError("failure_threshold must be at least 1")
+
+		self.failure_threshold = failure_threshold
+		self.reset_timeout = reset_timeout
+		self._clock = clock
+		self._lock = threading.Lock()
+		self._state = self.CLOSED
+		self._consecutive_failures = 0
+		self._opened_at = 0.0
+		self._trial_in_flight = False
+		self.times_opened = 0
+
+	@property
+	def state(self) -> str:
+		with self._lock:
+			if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+				return self.HALF_OPEN
+			return self._state
+
+	def allow_request(self) -> bool:
+		with self._lock:
+			if self._state == self.CLOSED:
+				return True
+
+			if self._state == self.OPEN:
+				if self._clock() - self._opened_at < self.reset_timeout:
+					return False
+				self._state = self.HALF_OPEN
+
+			# Half-open: only one trial call at a time
+			if self._trial_in_flight:
+				return False
+			self._trial_in_flight = True
+			return True
+
+	def record_success(self) -> None:
+		with self._lock:
+			self._state = self.CLOSED
+			self._consecutive_failures = 0
+			self._trial_in_flight = False
+
+	def cancel_request(self) -> None:
+		"""Release an allowed request that never reached the upstream"""
+		with self._lock:
+			self._trial_in_flight = False
+
+	def record_failure(self) -> None:
+		with self._lock:
+			self._consecutive_failures += 1
+			self._trial_in_flight = False
+			if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+				if self._state != self.OPEN:
+					self.times_opened += 1
+				self._state = self.OPEN
+				self._opened_at = self._clock()
+
+
+class ResilientAPIClient(APIClient):
+	"""
+	APIClient decorator adding retries with exponential backoff and jitter,
+	guarded by a circuit breaker. While the breaker is open, calls fail at once
+	with CircuitOpenException instead of waiting for the upstream to time out.
+	"""
+
+	def __init__(
+		self,
+		api_client: APIClient,
+		max_retries: int = 3,
+		base_delay: float = 0.1,
+		max_delay: float = 5.0,
+		jitter: float = 1.0,
+		retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+		circuit_breaker: Optional[CircuitBreaker] = None,
+		sleep: Callable[[float], Any] = time.sleep,
+		random_fn: Callable[[], float] = random.random
+	):
+		"""
+		Args:
+			api_client(APIClient): Client to wrap
+			max_retries(int): Retries after the first attempt
+			base_delay(float): Delay before the first retry, doubled on every retry
+			max_delay(float): Upper bound of a single delay
+			jitter(float): Fraction of each delay that is randomized, between 0 and 1
+			retry_on(Tuple[Type[BaseException], ...]): Exceptions worth retrying
+			circuit_breaker(Optional[CircuitBreaker]): Breaker to use, a default one when None
+			sleep(Callable[[float], Any]): Sleep function, replaceable in tests
+			random_fn(Callable[[], float]): Random source in [0, 1), replaceable in tests
+		"""
+		if max_retries < 0:
+			raise ValueError("max_retries cannot be negative")
+		if not 0 <= jitter <= 1:
+			raise ValueError("jitter must be between 0 and 1")
+
+		self.api_client = api_client
+		self.max_retries = max_retries
+		self.base_delay = base_delay
+		self.max_delay = max_delay
+		self.jitter = jitter
+		self.retry_on = retry_on
+		self.circuit_breaker = circuit_breaker or CircuitBreaker()
+		self._sleep = sleep
+		self._random = random_fn
+		self._lock = threading.Lock()
+		self.calls = 0
+		self.retries = 0
+		self.failures = 0
+		self.short_circuits = 0
+
+	def call_api(self, order_id: int) -> APIResponse:
+		return self._call(lambda: self.api_client.call_api(order_id))
+
+	def call_api_batch(self, order_ids: List[int]) -> Dict[int, APIResponse]:
+		return self._call(lambda: self.api_client.call_api_batch(order_ids))
+
+	def metrics(self) -> Dict[str, Any]:
+		with self._lock:
+			return {
+				"calls": self.calls,
+				"retries": self.retries,
+				"failures": self.failures,
+				"short_circuits": self.short_circuits,
+				"circuit_state": self.circuit_breaker.state,
+				"circuit_opened": self.circuit_breaker.times_opened
+			}
+
+	def _call(self, request: Callable[[], Any]) -> Any:
+		self._increment("calls")
+		attempt = 0
+		while True:
+			if not self.circuit_breaker.allow_request():
+				self._increment("short_circuits")
+				raise CircuitOpenException("Circuit breaker is open")
+
+			try:
+				result = request()
+			except NotImplementedError:
+				# Missing batch support is not an upstream failure
+				self.circuit_breaker.cancel_request()
+				raise
+			except Exception as error:
+				self.circuit_breaker.record_failure()
+				self._increment("failures")
+				if not isinstance(error, self.retry_on) or attempt >= self.max_retries:
+					raise
+				self._increment("retries")
+				self._sleep(self._backoff_delay(attempt))
+				attempt += 1
+			else:
+				self.circuit_breaker.record_success()
+				return result
+
+	def _backoff_delay(self, attempt: int) -> float:
+		delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+
+		return delay * (1 - self.jitter + self.jitter * self._random())
+
+	def _increment(self, counter: str) -> None:
+		with self._lock:
+			setattr(self, counter, getattr(self, counter) + 1)
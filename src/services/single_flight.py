@@ -0,0 +1,207 @@
+"""
+Deduplication of concurrent calls sharing a key. The file lock variant needs
+fcntl and therefore a POSIX host.
+"""
+import hashlib
+import os
+import pickle
+import threading
+
+from typing import Any, BinaryIO, Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.services.api_client import APIClient
+from src.utils.response import APIResponse
+
+try:
+	import fcntl
+except ImportError:  # pragma: no cover - fcntl is POSIX only
+	fcntl = None
+
+
+class _Call:
+	def __init__(self):
+		self.done = threading.Event()
+		self.result: Any = None
+		self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+	"""
+	Share one in-flight call between concurrent callers of the same key.
+
+	The first caller of a key runs the function; callers arriving while it runs
+	wait for it and get the same result, or the same exception raised again.
+	Nothing is cached, a call made after the flight landed runs the function again.
+	"""
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._calls: Dict[Hashable, _Call] = {}
+		self.executions = 0
+		self.shared_calls = 0
+
+	def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+		"""
+		Run function, unless a call of the same key is in flight
+		Args:
+			key(Hashable): Key of the call
+			function(Callable[[], Any]): Computes the result of the call
+
+		Returns:
+			Any: result of the flight the caller ran or joined
+		"""
+		with self._lock:
+			call = self._calls.get(key)
+			is_leader = call is None
+			if is_leader:
+				call = self._calls[key] = _Call()
+				self.executions += 1
+			else:
+				self.shared_calls += 1
+
+		if not is_leader:
+			call.done.wait()
+			if call.error is not None:
+				raise call.error
+			return call.result
+
+		try:
+			call.result = self._execute(key, function)
+		except BaseException as error:
+			call.error = error
+			raise
+		finally:
+			with self._lock:
+				del self._calls[key]
+			call.done.set()
+
+		return call.result
+
+	def __getstate__(self) -> Dict[str, Any]:
+		# Only the configuration is sent to worker processes, not the flights of this one
+		state = self.__dict__.copy()
+		del state["_lock"]
+		state["_calls"] = {}
+		return state
+
+	def __setstate__(self, state: Dict[str, Any]) -> None:
+		self.__dict__.update(state)
+		self._lock = threading.Lock()
+
+	def in_flight(self) -> int:
+		with self._lock:
+			return len(self._calls)
+
+	def _execute(self, key: Hashable, function: Callable[[], Any]) -> Any:
+		return function()
+
+
+class FileLockSingleFlight(SingleFlight):
+	"""
+	SingleFlight shared by the processes of one host through lock files.
+
+	Within a process callers are deduplicated as by SingleFlight. Across processes
+	the leader holds an exclusive flock on the lock file of the key while it runs,
+	writes the pickled outcome into that file and unlinks it before unlocking.
+	Processes waiting for the lock read the outcome through the file they opened,
+	and the file is gone once the last of them closed it, so lock_dir only holds
+	the lock files of flights in progress. A caller arriving after the unlink
+	starts a new flight. If the leader died without leaving an outcome, or it could
+	not be pickled, the waiting process runs the function itself. Results therefore
+	have to be picklable, and lock_dir must only be writable by trusted processes,
+	since outcomes are unpickled from it.
+	"""
+
+	def __init__(self, lock_dir: str):
+		"""
+		Args:
+			lock_dir(str): Directory holding the lock files, created when missing
+		"""
+		if fcntl is None:
+			raise ValueError("FileLockSingleFlight requires fcntl, which is only available on POSIX")
+
+		super().__init__()
+		self.lock_dir = lock_dir
+
+	def _execute(self, key: Hashable, function: Callable[[], Any]) -> Any:
+		path = self._path(key)
+		os.makedirs(self.lock_dir, exist_ok=True)
+		while True:
+			with open(path, "a+b") as lock_file:
+				try:
+					fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+				except BlockingIOError:
+					# Another process is running this call, wait for it to land
+					fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+					outcome = self._read_outcome(lock_file)
+					if outcome is not None:
+						with self._lock:
+							self.shared_calls += 1
+						succeeded, value = outcome
+						if not succeeded:
+							raise value
+						return value
+
+				if os.fstat(lock_file.fileno()).st_nlink == 0:
+					# The flight of this file landed before the lock was taken, start a new one
+					continue
+
+				try:
+					return self._run_and_publish(path, lock_file, function)
+				finally:
+					fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+	def _path(self, key: Hashable) -> str:
+		digest = hashlib.md5(repr(key).encode(), usedforsecurity=False).hexdigest()
+		return os.path.join(self.lock_dir, f"{digest}.lock")
+
+	def _run_and_publish(self, path: str, lock_file: BinaryIO, function: Callable[[], Any]) -> Any:
+		# An outcome left by a leader that died before unlinking must never be taken for this flight
+		lock_file.truncate(0)
+		try:
+			result = function()
+		except Exception as error:
+			self._publish(path, lock_file, (False, error))
+			raise
+
+		self._publish(path, lock_file, (True, result))
+
+		return result
+
+	@staticmethod
+	def _read_outcome(lock_file: BinaryIO) -> Optional[Tuple[bool, Any]]:
+		try:
+			lock_file.seek(0)
+			return pickle.load(lock_file)
+		except (OSError, EOFError, pickle.UnpicklingError):
+			return None
+
+	@staticmethod
+	def _publish(path: str, lock_file: BinaryIO, outcome: Tuple[bool, Any]) -> None:
+		try:
+			lock_file.write(pickle.dumps(outcome))
+			lock_file.flush()
+		except (pickle.PicklingError, TypeError, AttributeError):
+			# Waiting processes run the function themselves instead
+			pass
+
+		# Waiters keep the file open, callers arriving from now on start a new flight
+		os.remove(path)
+
+
+class SingleFlightAPIClient(APIClient):
+	"""
+	APIClient decorator sharing concurrent calls for the same order ID.
+
+	Batch calls are passed through unchanged.
+	"""
+
+	def __init__(self, api_client: APIClient, single_flight: Optional[SingleFlight] = None):
+		self.api_client = api_client
+		self.single_flight = single_flight if single_flight is not None else SingleFlight()
+
+	def call_api(self, order_id: int) -> APIResponse:
+		return self.single_flight.do(("call_api", order_id), lambda: self.api_client.call_api(order_id))
+
+	def call_api_batch(self, order_ids: List[int]) -> Dict[int, APIResponse]:
+		return self.api_client.call_api_batch(order_ids)
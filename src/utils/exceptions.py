@@ -5,3 +5,7 @@ class APIException(Exception):
 
 class DatabaseException(Exception):
 	pass
+
+
+class CircuitOpenException(APIException):
+	pass
@@ -0,0 +1,257 @@
+"""
+Dependency-free metrics with Prometheus text format export.
+"""
+import math
+import os
+import threading
+
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler
+from typing import Dict, Iterable, List, Sequence, Tuple, Type
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape_label_value(value: str) -> str:
+	return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+	if not label_names:
+		return ""
+
+	pairs = ",".join(
+		f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values)
+	)
+	return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+	if math.isinf(value):
+		return "+Inf" if value > 0 else "-Inf"
+	if float(value).is_integer():
+		return str(int(value))
+
+	return repr(float(value))
+
+
+class _Metric(ABC):
+	metric_type = ""
+
+	def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+		self.name = name
+		self.documentation = documentation
+		self.label_names = tuple(label_names)
+		self._lock = threading.Lock()
+
+	def _label_key(self, label_values: Sequence[str]) -> Tuple[str, ...]:
+		if len(label_values) != len(self.label_names):
+			raise ValueError(f"{self.name} expects labels {self.label_names}")
+
+		return tuple(str(value) for value in label_values)
+
+	def render(self) -> List[str]:
+		return [
+			f"# HELP {self.name} {self.documentation}",
+			f"# TYPE {self.name} {self.metric_type}"
+		] + self._render_samples()
+
+	@abstractmethod
+	def _render_samples(self) -> List[str]:
+		pass
+
+
+class Counter(_Metric):
+	metric_type = "counter"
+
+	def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+		super().__init__(name, documentation, label_names)
+		self._values: Dict[Tuple[str, ...], float] = {}
+
+	def inc(self, amount: float = 1.0, *label_values: str) -> None:
+		if amount < 0:
+			raise ValueError("Counters can only increase")
+
+		key = self._label_key(label_values)
+		with self._lock:
+			self._values[key] = self._values.get(key, 0.0) + amount
+
+	def value(self, *label_values: str) -> float:
+		with self._lock:
+			return self._values.get(self._label_key(label_values), 0.0)
+
+	def _render_samples(self) -> List[str]:
+		with self._lock:
+			return [
+				f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+				for key, value in sorted(self._values.items())
+			]
+
+
+class Gauge(_Metric):
+	metric_type = "gauge"
+
+	def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+		super().__init__(name, documentation, label_names)
+		self._values: Dict[Tuple[str, ...], float] = {}
+
+	def set(self, value: float, *label_values: str) -> None:
+		key = self._label_key(label_values)
+		with self._lock:
+			self._values[key] = value
+
+	def inc(self, amount: float = 1.0, *label_values: str) -> None:
+		key = self._label_key(label_values)
+		with self._lock:
+			self._values[key] = self._values.get(key, 0.0) + amount
+
+	def dec(self, amount: float = 1.0, *label_values: str) -> None:
+		self.inc(-amount, *label_values)
+
+	def value(self, *label_values: str) -> float:
+		with self._lock:
+			return self._values.get(self._label_key(label_values), 0.0)
+
+	def _render_samples(self) -> List[str]:
+		with self._lock:
+			return [
+				f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+				for key, value in sorted(self._values.items())
+			]
+
+
+class Histogram(_Metric):
+	metric_type = "histogram"
+
+	def __init__(
+		self,
+		name: str,
+		documentation: str,
+		label_names: Sequence[str] = (),
+		buckets: Iterable[float] = DEFAULT_BUCKETS
+	):
+		super().__init__(name, documentation, label_names)
+		self.buckets = tuple(sorted(buckets))
+		if not self.buckets:
+			raise ValueError("Histogram needs at least one bucket")
+		# Per label set: bucket counts (non-cumulative), sum, count
+		self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+	def observe(self, value: float, *label_values: str) -> None:
+		key = self._label_key(label_values)
+		with self._lock:
+			bucket_counts, totals = self._values.setdefault(key, ([0] * len(self.buckets), [0.0, 0]))
+			for index, upper_bound in enumerate(self.buckets):
+				if value <= upper_bound:
+					bucket_counts[index] += 1
+					break
+			totals[0] += value
+			totals[1] += 1
+
+	def count(self, *label_values: str) -> int:
+		with self._lock:
+			entry = self._values.get(self._label_key(label_values))
+			return entry[1][1] if entry else 0
+
+	def _render_samples(self) -> List[str]:
+		lines = []
+		with self._lock:
+			for key, (bucket_counts, (total, count)) in sorted(self._values.items()):
+				cumulative = 0
+				for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+					cumulative += bucket_count
+					labels = _format_labels(self.label_names + ("le",), key + (_format_value(upper_bound),))
+					lines.append(f"{self.name}_bucket{labels} {cumulative}")
+				labels = _format_labels(self.label_names + ("le",), key + ("+Inf",))
+				lines.append(f"{self.name}_bucket{labels} {count}")
+				lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {_format_value(total)}")
+				lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {count}")
+
+		return lines
+
+
+class MetricsRegistry:
+	def __init__(self):
+		self._metrics: Dict[str, _Metric] = {}
+		self._lock = threading.Lock()
+
+	def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+		return self._register(Counter(name, documentation, label_names))
+
+	def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+		return self._register(Gauge(name, documentation, label_names))
+
+	def histogram(
+		self,
+		name: str,
+		documentation: str,
+		label_names: Sequence[str] = (),
+		buckets: Iterable[float] = DEFAULT_BUCKETS
+	) -> Histogram:
+		return self._register(Histogram(name, documentation, label_names, buckets))
+
+	def render(self) -> str:
+		"""
+		Render every metric in the Prometheus text exposition format
+		Returns:
+			str: exposition text
+		"""
+		with self._lock:
+			metrics = list(self._metrics.values())
+
+		lines = []
+		for metric in metrics:
+			lines.extend(metric.render())
+
+		return "\n".join(lines) + "\n"
+
+	def write_to_file(self, path: str) -> None:
+		"""
+		Write the metrics to a file, e.g. for the node_exporter textfile collector.
+		The file is replaced atomically so scrapers never read a partial file.
+		Args:
+			path(str): Destination file
+		"""
+		temp_path = f"{path}.tmp"
+		with open(temp_path, "w") as metrics_file:
+			metrics_file.write(self.render())
+		os.replace(temp_path, path)
+
+	def http_handler_class(self, path: str = "/metrics") -> Type[BaseHTTPRequestHandler]:
+		"""
+		Build a request handler serving the metrics, for use with http.server.HTTPServer
+		Args:
+			path(str): URL path the metrics are served on
+
+		Returns:
+			Type[BaseHTTPRequestHandler]: handler class bound to this registry
+		"""
+		registry = self
+
+		class MetricsHandler(BaseHTTPRequestHandler):
+			def do_GET(self):
+				if self.path.split("?", 1)[0] != path:
+					self.send_error(404)
+					return
+
+				body = registry.render().encode("utf-8")
+				self.send_response(200)
+				self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+				self.send_header("Content-Length", str(len(body)))
+				self.end_headers()
+				self.wfile.write(body)
+
+			def log_message(self, format, *args):
+				pass
+
+		return MetricsHandler
+
+	def _register(self, metric: _Metric) -> _Metric:
+		with self._lock:
+			if metric.name in self._metrics:
+				raise ValueError(f"Metric {metric.name} is already registered")
+			self._metrics[metric.name] = metric
+
+		return metric
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List
 
 
 class APIResponse:
@@ -6,3 +6,23 @@ class APIResponse:
 		self.status = status
 		self.data = data
 
+
+
+class BulkUpdateResult:
+	def __init__(self, updated_orders: List[Any], failed_orders: List[Any], failed_chunks: int = 0):
+		self.updated_orders = updated_orders
+		self.failed_orders = failed_orders
+		self.failed_chunks = failed_chunks
+
+	@property
+	def success(self) -> bool:
+		return not self.failed_orders
+
+
+class OrderProcessingResult:
+	def __init__(self, success: bool = False, processed_orders: int = 0, written_orders: int = 0, skipped_writes: int = 0):
+		self.success = success
+		self.processed_orders = processed_orders
+		self.written_orders = written_orders
+		# Orders left out of the bulk update because their status and priority were unchanged
+		self.skipped_writes = skipped_writes
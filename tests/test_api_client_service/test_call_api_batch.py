@@ -0,0 +1,26 @@
+import pytest
+from src.services.api_client import APIClient
+from src.utils.response import APIResponse
+from src.constants import APIResponseStatus
+
+class SingleCallAPIClient(APIClient):
+    def call_api(self, order_id):
+        return APIResponse(status=APIResponseStatus.SUCCESS.value, data=order_id)
+
+class TestCallAPIBatch:
+    @pytest.fixture
+    def api_client(self):
+        return SingleCallAPIClient()
+
+    def test_should_raise_not_implemented_when_client_has_no_batch_endpoint(self, api_client):
+        # Act & Assert
+        with pytest.raises(NotImplementedError):
+            api_client.call_api_batch([1, 2, 3])
+
+    def test_should_still_support_single_calls_when_batch_is_not_implemented(self, api_client):
+        # Act
+        result = api_client.call_api(1)
+
+        # Assert
+        assert result.status == APIResponseStatus.SUCCESS.value
+        assert result.data == 1
@@ -0,0 +1,185 @@
+import asyncio
+
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.async_order_processing import AsyncOrderProcessingService
+from src.services.api_client import APIClient
+from src.services.async_api_client import AsyncAPIClient
+from src.constants import OrderStatus, OrderPriority, APIResponseStatus
+from src.utils.response import APIResponse
+from src.utils.exceptions import APIException, DatabaseException
+from tests.factories.order import OrderFactory
+
+def api_response_for(order_id):
+    if order_id == 2:
+        raise APIException("API Error")
+    if order_id == 3:
+        return APIResponse(status=APIResponseStatus.ERROR.value, data=None)
+    if order_id == 4:
+        return APIResponse(status=APIResponseStatus.SUCCESS.value, data=10)
+    if order_id == 5:
+        return APIResponse(status=APIResponseStatus.SUCCESS.value, data="invalid_data")
+    return APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+class SyncAPIClient(APIClient):
+    def call_api(self, order_id):
+        return api_response_for(order_id)
+
+class FakeAsyncAPIClient(AsyncAPIClient):
+    def __init__(self):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def call_api(self, order_id):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return api_response_for(order_id)
+
+class TestProcessOrdersSyncAndAsync:
+    """Every scenario runs against both services, which must agree on all statuses."""
+
+    @pytest.fixture(params=["sync", "async"])
+    def run_process_orders(self, request):
+        if request.param == "sync":
+            service = OrderProcessingService(SyncAPIClient())
+            return lambda user_id: service.process_orders(user_id)
+
+        service = AsyncOrderProcessingService(FakeAsyncAPIClient(), max_api_concurrency=2)
+        return lambda user_id: asyncio.run(service.process_orders(user_id))
+
+    @pytest.fixture(autouse=True)
+    def export_directory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_should_set_same_statuses_for_mixed_orders(self, run_process_orders, export_directory):
+        # Arrange
+        user_id = 1
+        orders = [
+            OrderFactory.create_type_b_order(id=1, amount=50.0),
+            OrderFactory.create_type_b_order(id=2),
+            OrderFactory.create_type_b_order(id=3),
+            OrderFactory.create_type_b_order(id=4),
+            OrderFactory.create_type_b_order(id=5),
+            OrderFactory.create_type_b_order(id=6, amount=150.0),
+            OrderFactory.create_type_b_order(id=7, flag=True),
+            OrderFactory.create_type_a_order(id=8, amount=500.0),
+            OrderFactory.create_type_c_order(id=9, flag=True),
+            OrderFactory.create_order(id=10, type="X")
+        ]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = run_process_orders(user_id)
+
+            # Assert
+            assert result is True
+            mock_bulk_update.assert_called_once_with(orders)
+            assert [order.status for order in orders] == [
+                OrderStatus.PROCESSED.value,
+                OrderStatus.API_FAILURE.value,
+                OrderStatus.API_ERROR.value,
+                OrderStatus.PENDING.value,
+                OrderStatus.API_FAILURE.value,
+                OrderStatus.ERROR.value,
+                OrderStatus.PENDING.value,
+                OrderStatus.EXPORTED.value,
+                OrderStatus.COMPLETED.value,
+                OrderStatus.UNKNOWN_TYPE.value
+            ]
+            assert orders[7].priority == OrderPriority.HIGH.value
+            assert len(list(export_directory.iterdir())) == 1
+
+    def test_should_return_false_when_user_has_no_orders(self, run_process_orders):
+        # Arrange
+        user_id = 1
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=[]):
+            # Act
+            result = run_process_orders(user_id)
+
+            # Assert
+            assert result is False
+
+    def test_should_mark_all_orders_as_db_error_when_bulk_update_fails(self, run_process_orders):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_b_order(id=1), OrderFactory.create_type_c_order(id=2)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=DatabaseException):
+            # Act
+            result = run_process_orders(user_id)
+
+            # Assert
+            assert result is False
+            assert all(order.status == OrderStatus.DB_ERROR.value for order in orders)
+
+    def test_should_return_false_when_any_exception_occurs(self, run_process_orders):
+        # Arrange
+        user_id = 1
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', side_effect=Exception):
+            # Act
+            result = run_process_orders(user_id)
+
+            # Assert
+            assert result is False
+
+class TestAsyncOrderProcessingService:
+    def test_should_limit_concurrent_api_calls_with_semaphore(self):
+        # Arrange
+        user_id = 1
+        api_client = FakeAsyncAPIClient()
+        service = AsyncOrderProcessingService(api_client, max_api_concurrency=3)
+        orders = [OrderFactory.create_type_b_order(id=10 + i) for i in range(12)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = asyncio.run(service.process_orders(user_id))
+
+            # Assert
+            assert result is True
+            assert api_client.peak_in_flight == 3
+            assert all(order.status == OrderStatus.PROCESSED.value for order in orders)
+
+    def test_should_not_defer_type_b_orders_when_handler_is_replaced(self):
+        # Arrange
+        handler = Mock()
+        service = AsyncOrderProcessingService(FakeAsyncAPIClient(), order_type_handlers={"B": handler})
+
+        # Act & Assert
+        assert service._should_defer_api_call(OrderFactory.create_type_b_order(id=1)) is False
+
+    def test_should_not_expose_synchronous_entry_points(self):
+        # Arrange
+        service = AsyncOrderProcessingService(FakeAsyncAPIClient())
+
+        # Act & Assert
+        assert not isinstance(service, OrderProcessingService)
+        assert asyncio.iscoroutinefunction(service.process_orders)
+        assert asyncio.iscoroutinefunction(service.process_orders_with_result)
+        for name in ("process_order_batch", "_process_order_stream", "_dispatch_type_b_orders", "_process_type_b_batch"):
+            assert not hasattr(service, name)
+
+    def test_should_await_api_calls_when_concurrency_is_one(self, tmp_path):
+        # Arrange
+        user_id = 1
+        api_client = FakeAsyncAPIClient()
+        service = AsyncOrderProcessingService(api_client, max_api_concurrency=1, export_dir=str(tmp_path))
+        orders = [OrderFactory.create_type_b_order(id=1, amount=50.0), OrderFactory.create_type_b_order(id=4)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = asyncio.run(service.process_orders(user_id))
+
+        # Assert
+        assert result is True
+        assert api_client.peak_in_flight == 1
+        assert [order.status for order in orders] == [OrderStatus.PROCESSED.value, OrderStatus.PENDING.value]
@@ -0,0 +1,94 @@
+import pytest
+from src.services.batch_processing import process_orders_for_users
+from src.services.api_client import APIClient
+from src.repositories.order import OrderRepository
+from src.constants import APIResponseStatus
+from src.utils.response import APIResponse
+from tests.factories.order import OrderFactory
+
+class StubAPIClient(APIClient):
+    def call_api(self, order_id):
+        return APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+class InMemoryOrderRepository(OrderRepository):
+    """Users with an even ID have two Type C orders, odd users have none."""
+
+    def get_orders_by_user(self, user_id):
+        if user_id % 2:
+            return []
+        return [OrderFactory.create_type_c_order(id=user_id * 10 + i) for i in range(2)]
+
+    def bulk_update_orders(self, orders):
+        return True
+
+class TestProcessOrdersForUsers:
+    def test_should_return_success_of_every_user_when_running_in_process(self):
+        # Act
+        result = process_orders_for_users(
+            [1, 2, 3, 4],
+            StubAPIClient,
+            InMemoryOrderRepository,
+            workers=1
+        )
+
+        # Assert
+        assert result.results == {1: False, 2: True, 3: False, 4: True}
+        assert result.total_users == 4
+        assert result.succeeded_users == 2
+        assert result.failed_users == 2
+        assert result.elapsed_seconds >= 0
+
+    def test_should_shard_users_across_process_pool(self):
+        # Arrange
+        user_ids = list(range(20))
+
+        # Act
+        result = process_orders_for_users(
+            user_ids,
+            StubAPIClient,
+            InMemoryOrderRepository,
+            workers=2,
+            chunksize=3
+        )
+
+        # Assert
+        assert list(result.results) == user_ids
+        assert result.succeeded_users == 10
+        assert all(result.results[user_id] is (user_id % 2 == 0) for user_id in user_ids)
+
+    def test_should_pass_service_options_to_each_worker(self):
+        # Act
+        result = process_orders_for_users(
+            [2, 4],
+            StubAPIClient,
+            InMemoryOrderRepository,
+            workers=2,
+            service_options={"db_chunk_size": 1}
+        )
+
+        # Assert
+        assert result.results == {2: True, 4: True}
+
+    def test_should_return_empty_result_when_no_users_are_given(self):
+        # Act
+        result = process_orders_for_users([], StubAPIClient, InMemoryOrderRepository, workers=2)
+
+        # Assert
+        assert result.results == {}
+        assert result.total_users == 0
+
+    def test_should_raise_exception_when_workers_is_zero(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            process_orders_for_users([1], StubAPIClient, InMemoryOrderRepository, workers=0)
+
+    def test_should_raise_exception_when_service_options_are_invalid(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="db_chunk_size must be at least 1"):
+            process_orders_for_users(
+                [1],
+                StubAPIClient,
+                InMemoryOrderRepository,
+                workers=1,
+                service_options={"db_chunk_size": 0}
+            )
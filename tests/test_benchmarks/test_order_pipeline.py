@@ -0,0 +1,131 @@
+import json
+
+import pytest
+from benchmarks.order_pipeline import compare, main
+
+def create_result(orders_per_sec=1000.0, peak_rss_bytes=100 * 2**20, api_calls=10, api_batch_calls=0, bulk_update_calls=1):
+    return {
+        "orders": 1000,
+        "success": True,
+        "seconds": 1000 / orders_per_sec,
+        "orders_per_sec": orders_per_sec,
+        "peak_rss_bytes": peak_rss_bytes,
+        "api_calls": api_calls,
+        "api_batch_calls": api_batch_calls,
+        "bulk_update_calls": bulk_update_calls
+    }
+
+class TestCompare:
+    def test_should_report_nothing_when_results_match_baseline(self):
+        # Arrange
+        baseline = {"1000": create_result()}
+
+        # Act
+        regressions = compare({"1000": create_result()}, baseline, 0.25)
+
+        # Assert
+        assert regressions == []
+
+    def test_should_report_throughput_regression_beyond_threshold(self):
+        # Arrange
+        baseline = {"1000": create_result(orders_per_sec=1000.0)}
+
+        # Act
+        regressions = compare({"1000": create_result(orders_per_sec=749.0)}, baseline, 0.25)
+
+        # Assert
+        assert regressions == ["1000 orders: 749 orders/sec, baseline 1000"]
+
+    def test_should_accept_throughput_drop_at_threshold(self):
+        # Arrange
+        baseline = {"1000": create_result(orders_per_sec=1000.0)}
+
+        # Act
+        regressions = compare({"1000": create_result(orders_per_sec=750.0)}, baseline, 0.25)
+
+        # Assert
+        assert regressions == []
+
+    def test_should_report_peak_rss_regression_beyond_threshold(self):
+        # Arrange
+        baseline = {"1000": create_result(peak_rss_bytes=100 * 2**20)}
+
+        # Act
+        regressions = compare({"1000": create_result(peak_rss_bytes=126 * 2**20)}, baseline, 0.25)
+
+        # Assert
+        assert regressions == ["1000 orders: peak RSS 126.0 MiB, baseline 100.0 MiB"]
+
+    def test_should_accept_peak_rss_growth_at_threshold(self):
+        # Arrange
+        baseline = {"1000": create_result(peak_rss_bytes=100 * 2**20)}
+
+        # Act
+        regressions = compare({"1000": create_result(peak_rss_bytes=125 * 2**20)}, baseline, 0.25)
+
+        # Assert
+        assert regressions == []
+
+    @pytest.mark.parametrize("counter", ["api_calls", "api_batch_calls", "bulk_update_calls"])
+    def test_should_report_any_extra_call(self, counter):
+        # Arrange
+        baseline = {"1000": create_result(**{counter: 10})}
+
+        # Act
+        regressions = compare({"1000": create_result(**{counter: 11})}, baseline, 0.25)
+
+        # Assert
+        assert regressions == [f"1000 orders: 11 {counter}, baseline 10"]
+
+    def test_should_accept_fewer_calls_than_baseline(self):
+        # Arrange
+        baseline = {"1000": create_result(api_calls=10, bulk_update_calls=2)}
+
+        # Act
+        regressions = compare({"1000": create_result(api_calls=9, bulk_update_calls=1)}, baseline, 0.25)
+
+        # Assert
+        assert regressions == []
+
+    def test_should_skip_sizes_missing_from_baseline(self):
+        # Arrange
+        baseline = {"1000": create_result()}
+
+        # Act
+        regressions = compare({"100000": create_result(orders_per_sec=1.0)}, baseline, 0.25)
+
+        # Assert
+        assert regressions == []
+
+class TestMain:
+    def write_baseline(self, tmp_path, **overrides):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"1000": create_result(**overrides)}))
+        return str(path)
+
+    def test_should_return_one_when_result_regresses(self, tmp_path):
+        # Arrange
+        baseline_path = self.write_baseline(tmp_path, orders_per_sec=1e12)
+
+        # Act
+        exit_code = main(["--sizes", "1000", "--repeat", "1", "--compare", baseline_path])
+
+        # Assert
+        assert exit_code == 1
+
+    def test_should_return_zero_when_nothing_regresses(self, tmp_path):
+        # Arrange
+        baseline_path = self.write_baseline(
+            tmp_path,
+            orders_per_sec=1.0,
+            peak_rss_bytes=2**40,
+            api_calls=10**6,
+            api_batch_calls=10**6,
+            bulk_update_calls=10**6
+        )
+
+        # Act
+        exit_code = main(["--sizes", "1000", "--repeat", "1", "--compare", baseline_path])
+
+        # Assert
+        assert exit_code == 0
@@ -0,0 +1,164 @@
+import pytest
+from unittest.mock import Mock
+from src.services.caching_api_client import CachingAPIClient
+from src.services.api_client import APIClient
+from src.constants import APIResponseStatus
+from src.utils.response import APIResponse
+from src.utils.exceptions import APIException
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestCachingAPIClient:
+    @pytest.fixture
+    def mock_api_client(self):
+        mock_api_client = Mock(spec=APIClient)
+        mock_api_client.call_api.side_effect = lambda order_id: APIResponse(
+            status=APIResponseStatus.SUCCESS.value,
+            data=order_id
+        )
+        return mock_api_client
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def caching_api_client(self, mock_api_client, clock):
+        return CachingAPIClient(mock_api_client, max_size=2, ttl=60, negative_ttl=5, clock=clock)
+
+    def test_should_return_cached_response_when_called_twice(self, caching_api_client, mock_api_client):
+        # Act
+        first = caching_api_client.call_api(1)
+        second = caching_api_client.call_api(1)
+
+        # Assert
+        assert first is second
+        mock_api_client.call_api.assert_called_once_with(1)
+        assert caching_api_client.hits == 1
+        assert caching_api_client.misses == 1
+
+    def test_should_call_api_again_when_entry_has_expired(self, caching_api_client, mock_api_client, clock):
+        # Arrange
+        caching_api_client.call_api(1)
+        clock.now = 60
+
+        # Act
+        caching_api_client.call_api(1)
+
+        # Assert
+        assert mock_api_client.call_api.call_count == 2
+        assert caching_api_client.expirations == 1
+
+    def test_should_cache_error_responses_for_negative_ttl_only(self, caching_api_client, mock_api_client, clock):
+        # Arrange
+        mock_api_client.call_api.side_effect = None
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.ERROR.value, data=None)
+
+        # Act
+        caching_api_client.call_api(1)
+        clock.now = 4
+        caching_api_client.call_api(1)
+        clock.now = 5
+        caching_api_client.call_api(1)
+
+        # Assert
+        assert mock_api_client.call_api.call_count == 2
+
+    def test_should_not_cache_error_responses_when_negative_ttl_is_zero(self, mock_api_client, clock):
+        # Arrange
+        caching_api_client = CachingAPIClient(mock_api_client, negative_ttl=0, clock=clock)
+        mock_api_client.call_api.side_effect = None
+        mock_api_client.call_api.return_value = None
+
+        # Act
+        caching_api_client.call_api(1)
+        caching_api_client.call_api(1)
+
+        # Assert
+        assert mock_api_client.call_api.call_count == 2
+
+    def test_should_not_cache_exceptions(self, caching_api_client, mock_api_client):
+        # Arrange
+        mock_api_client.call_api.side_effect = [APIException("API Error"), APIResponse(status="success", data=1)]
+
+        # Act
+        with pytest.raises(APIException):
+            caching_api_client.call_api(1)
+        result = caching_api_client.call_api(1)
+
+        # Assert
+        assert result.data == 1
+        assert mock_api_client.call_api.call_count == 2
+
+    def test_should_evict_least_recently_used_entry_when_full(self, caching_api_client, mock_api_client):
+        # Arrange
+        caching_api_client.call_api(1)
+        caching_api_client.call_api(2)
+        caching_api_client.call_api(1)
+
+        # Act
+        caching_api_client.call_api(3)
+        caching_api_client.call_api(1)
+        caching_api_client.call_api(2)
+
+        # Assert
+        assert [call.args[0] for call in mock_api_client.call_api.call_args_list] == [1, 2, 3, 2]
+        assert caching_api_client.evictions == 2
+
+    def test_should_fetch_only_uncached_ids_in_batch(self, caching_api_client, mock_api_client):
+        # Arrange
+        caching_api_client.call_api(1)
+        mock_api_client.call_api_batch.return_value = {2: APIResponse(status="success", data=2)}
+
+        # Act
+        result = caching_api_client.call_api_batch([1, 2])
+
+        # Assert
+        mock_api_client.call_api_batch.assert_called_once_with([2])
+        assert set(result) == {1, 2}
+        assert caching_api_client.cache_info() == {
+            "hits": 1, "misses": 2, "evictions": 0, "expirations": 0, "size": 2
+        }
+
+    def test_should_not_call_batch_when_every_id_is_cached(self, caching_api_client, mock_api_client):
+        # Arrange
+        caching_api_client.call_api(1)
+
+        # Act
+        result = caching_api_client.call_api_batch([1])
+
+        # Assert
+        mock_api_client.call_api_batch.assert_not_called()
+        assert result[1].data == 1
+
+    def test_should_propagate_not_implemented_without_counting(self, caching_api_client, mock_api_client):
+        # Arrange
+        mock_api_client.call_api_batch.side_effect = NotImplementedError
+
+        # Act & Assert
+        with pytest.raises(NotImplementedError):
+            caching_api_client.call_api_batch([1, 2])
+        assert caching_api_client.misses == 0
+
+    def test_should_forget_entries_when_cleared(self, caching_api_client, mock_api_client):
+        # Arrange
+        caching_api_client.call_api(1)
+
+        # Act
+        caching_api_client.clear()
+        caching_api_client.call_api(1)
+
+        # Assert
+        assert mock_api_client.call_api.call_count == 2
+
+    def test_should_raise_exception_when_configuration_is_invalid(self, mock_api_client):
+        # Act & Assert
+        with pytest.raises(ValueError, match="max_size must be at least 1"):
+            CachingAPIClient(mock_api_client, max_size=0)
+        with pytest.raises(ValueError, match="cannot be negative"):
+            CachingAPIClient(mock_api_client, ttl=-1)
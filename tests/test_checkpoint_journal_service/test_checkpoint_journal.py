@@ -0,0 +1,108 @@
+import json
+
+import pytest
+from src.services.checkpoint_journal import CheckpointJournal
+from src.constants import OrderStatus, OrderPriority
+from tests.factories.order import OrderFactory
+
+class TestCheckpointJournal:
+    @pytest.fixture
+    def journal(self, tmp_path):
+        return CheckpointJournal(str(tmp_path / "journal"))
+
+    def test_should_load_recorded_orders_on_next_open(self, journal):
+        # Arrange
+        user_id = 1
+        order = OrderFactory.create_type_c_order(id=7, status=OrderStatus.COMPLETED.value, priority=OrderPriority.HIGH.value)
+        journal.open(user_id)
+        journal.record(user_id, [order])
+        journal.close(user_id)
+
+        # Act
+        completed_orders = journal.open(user_id)
+
+        # Assert
+        assert completed_orders == {7: (OrderStatus.COMPLETED.value, OrderPriority.HIGH.value)}
+
+    def test_should_ignore_truncated_last_line(self, journal):
+        # Arrange
+        user_id = 1
+        journal.open(user_id)
+        journal.record(user_id, [OrderFactory.create_type_c_order(id=1, status=OrderStatus.COMPLETED.value)])
+        journal.close(user_id)
+        with open(journal.path(user_id), "a") as journal_file:
+            journal_file.write('{"id": 2, "status": "comp')
+
+        # Act
+        completed_orders = journal.open(user_id)
+
+        # Assert
+        assert list(completed_orders) == [1]
+
+    def test_should_delete_journal_on_complete(self, journal):
+        # Arrange
+        user_id = 1
+        journal.open(user_id)
+        journal.record(user_id, [OrderFactory.create_type_c_order(id=1)])
+
+        # Act
+        journal.complete(user_id)
+
+        # Assert
+        assert journal.open(user_id) == {}
+
+    def test_should_ignore_records_of_users_without_open_run(self, journal, tmp_path):
+        # Act
+        journal.record(1, [OrderFactory.create_type_c_order(id=1)])
+
+        # Assert
+        assert not (tmp_path / "journal").exists()
+
+    def test_should_not_journal_failed_orders(self, tmp_path):
+        # Arrange
+        user_id = 1
+        journal = CheckpointJournal(str(tmp_path))
+        orders = [
+            OrderFactory.create_type_a_order(id=1, status=OrderStatus.EXPORT_FAILED.value),
+            OrderFactory.create_type_b_order(id=2, status=OrderStatus.API_FAILURE.value),
+            OrderFactory.create_type_b_order(id=3, status=OrderStatus.PROCESSED.value)
+        ]
+        journal.open(user_id)
+
+        # Act
+        journal.record(user_id, orders)
+        journal.close(user_id)
+
+        # Assert
+        assert list(journal.open(user_id)) == [3]
+
+    def test_should_ignore_failed_entries_when_reading_journal(self, tmp_path):
+        # Arrange
+        user_id = 1
+        journal = CheckpointJournal(str(tmp_path))
+        with open(journal.path(user_id), "w") as journal_file:
+            journal_file.write(json.dumps({"id": 1, "status": OrderStatus.API_ERROR.value, "priority": "low"}) + "\n")
+            journal_file.write(json.dumps({"id": 2, "status": OrderStatus.COMPLETED.value, "priority": "low"}) + "\n")
+
+        # Act
+        completed = journal.open(user_id)
+
+        # Assert
+        assert completed == {2: (OrderStatus.COMPLETED.value, "low")}
+
+    def test_should_write_one_json_line_per_order(self, tmp_path):
+        # Arrange
+        user_id = 1
+        journal = CheckpointJournal(str(tmp_path), fsync=True)
+        orders = [OrderFactory.create_type_c_order(id=i, status=OrderStatus.COMPLETED.value) for i in range(1, 3)]
+        journal.open(user_id)
+
+        # Act
+        journal.record(user_id, orders)
+        journal.record_entries(user_id, [(3, OrderStatus.EXPORTED.value, OrderPriority.LOW.value)])
+
+        # Assert
+        with open(journal.path(user_id)) as journal_file:
+            entries = [json.loads(line) for line in journal_file]
+        assert [entry["id"] for entry in entries] == [1, 2, 3]
+        assert entries[2] == {"id": 3, "status": OrderStatus.EXPORTED.value, "priority": OrderPriority.LOW.value}
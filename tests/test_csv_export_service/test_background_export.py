@@ -0,0 +1,209 @@
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+from src.services.background_export import BackgroundExportSession
+from src.services.csv_export import CSVExportSession, ExportSession
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import OrderStatus, OrderPriority
+from tests.factories.order import OrderFactory
+
+class BlockingExportSession(ExportSession):
+    def __init__(self):
+        self.file_name = "unused.csv"
+        self.release = threading.Event()
+        self.written = []
+
+    def write_order(self, order):
+        self.release.wait()
+        order.status = OrderStatus.EXPORTED.value
+        self.written.append(order)
+        return order
+
+    def flush(self):
+        pass
+
+    def close(self):
+        return True
+
+class TestBackgroundExportSession:
+    @pytest.fixture
+    def csv_file_path(self, tmp_path):
+        return str(tmp_path / "orders_type_A_1.csv")
+
+    def test_should_mark_orders_exported_only_after_flush(self, csv_file_path):
+        # Arrange
+        export_session = BackgroundExportSession(CSVExportSession(lambda: csv_file_path, durable=True))
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 4)]
+
+        # Act
+        for order in orders:
+            export_session.write_order(order)
+        statuses_before_flush = [order.status for order in orders]
+        export_session.flush()
+
+        # Assert
+        assert statuses_before_flush == [None, None, None]
+        assert all(order.status == OrderStatus.EXPORTED.value for order in orders)
+        export_session.close()
+
+    def test_should_write_row_as_it_was_when_submitted(self, csv_file_path):
+        # Arrange
+        export_session = BackgroundExportSession(CSVExportSession(lambda: csv_file_path))
+        order = OrderFactory.create_type_a_order(id=1, amount=500.0)
+
+        # Act
+        export_session.write_order(order)
+        order.priority = OrderPriority.HIGH.value
+        export_session.close()
+
+        # Assert
+        with open(csv_file_path, newline="") as csv_file:
+            assert csv_file.read().splitlines()[1] == "1,A,500.0,false,,low"
+        assert export_session.file_name == csv_file_path
+
+    def test_should_mark_orders_failed_when_sync_fails(self, csv_file_path):
+        # Arrange
+        export_session = BackgroundExportSession(CSVExportSession(lambda: csv_file_path, durable=True))
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 3)]
+
+        with patch("src.services.csv_export.os.fsync", side_effect=OSError("I/O error")):
+            # Act
+            for order in orders:
+                export_session.write_order(order)
+            export_session.close()
+
+        # Assert
+        assert all(order.status == OrderStatus.EXPORT_FAILED.value for order in orders)
+
+    def test_should_mark_order_failed_when_wrapped_session_raises(self):
+        # Arrange
+        wrapped_session = Mock(spec=ExportSession)
+        wrapped_session.write_order.side_effect = RuntimeError("boom")
+        export_session = BackgroundExportSession(wrapped_session)
+        order = OrderFactory.create_type_a_order(id=1)
+
+        # Act
+        export_session.write_order(order)
+        export_session.close()
+
+        # Assert
+        assert order.status == OrderStatus.EXPORT_FAILED.value
+
+    def test_should_mark_orders_failed_when_wrapped_session_cannot_close(self):
+        # Arrange
+        wrapped_session = Mock(spec=ExportSession)
+        wrapped_session.close.side_effect = RuntimeError("boom")
+        export_session = BackgroundExportSession(wrapped_session)
+        order = OrderFactory.create_type_a_order(id=1)
+
+        # Act
+        export_session.write_order(order)
+        export_session.close()
+
+        # Assert
+        assert order.status == OrderStatus.EXPORT_FAILED.value
+
+    def test_should_block_writers_when_queue_is_full(self):
+        # Arrange
+        wrapped_session = BlockingExportSession()
+        export_session = BackgroundExportSession(wrapped_session, max_queue_size=1)
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 4)]
+        submitted = threading.Event()
+
+        def submit_all():
+            for order in orders:
+                export_session.write_order(order)
+            submitted.set()
+
+        # Act
+        submitter = threading.Thread(target=submit_all)
+        submitter.start()
+        blocked = not submitted.wait(0.2)
+        wrapped_session.release.set()
+        submitter.join()
+        export_session.close()
+
+        # Assert
+        assert blocked
+        assert [order.id for order in wrapped_session.written] == [1, 2, 3]
+        assert all(order.status == OrderStatus.EXPORTED.value for order in orders)
+
+    def test_should_not_start_writer_when_nothing_is_written(self):
+        # Arrange
+        wrapped_session = Mock(spec=ExportSession)
+        export_session = BackgroundExportSession(wrapped_session)
+
+        # Act
+        export_session.flush()
+        export_session.close()
+
+        # Assert
+        wrapped_session.close.assert_not_called()
+
+    def test_should_raise_exception_when_max_queue_size_is_zero(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="max_queue_size must be at least 1"):
+            BackgroundExportSession(Mock(spec=ExportSession), max_queue_size=0)
+
+    def test_should_settle_exports_before_bulk_update(self, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        service = OrderProcessingService(Mock(spec=APIClient), export_queue_size=2)
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 6)]
+        statuses_at_bulk_update = []
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders',
+                   side_effect=lambda orders: statuses_at_bulk_update.extend(order.status for order in orders)), \
+             patch("src.services.csv_export.os.fsync") as mock_fsync:
+            # Act
+            result = service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        assert statuses_at_bulk_update == [OrderStatus.EXPORTED.value] * 5
+        mock_fsync.assert_called()
+
+    def test_should_settle_each_streamed_chunk_before_its_bulk_update(self, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        service = OrderProcessingService(Mock(spec=APIClient), stream_page_size=2, export_queue_size=1)
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 6)]
+        statuses_at_bulk_update = []
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(orders)), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders',
+                   side_effect=lambda orders: statuses_at_bulk_update.append([order.status for order in orders])):
+            # Act
+            result = service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        assert statuses_at_bulk_update == [
+            [OrderStatus.EXPORTED.value] * 2,
+            [OrderStatus.EXPORTED.value] * 2,
+            [OrderStatus.EXPORTED.value]
+        ]
+        assert len(list(tmp_path.glob("*.csv"))) == 3
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_should_raise_exception_when_export_queue_size_is_zero(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="export_queue_size must be at least 1"):
+            OrderProcessingService(Mock(spec=APIClient), export_queue_size=0)
+
+    def test_should_export_single_order_through_background_writer(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        service = OrderProcessingService(Mock(spec=APIClient), export_queue_size=4)
+        order = OrderFactory.create_type_a_order(id=1)
+
+        # Act
+        result = service._process_type_a_order(order, 1)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
@@ -0,0 +1,98 @@
+import csv
+import io
+
+import pytest
+from unittest.mock import Mock, patch, mock_open
+from src.services.csv_export import CSVBlockWriter, CSVExportSession, build_csv_row, is_high_value_order
+from src.constants import OrderStatus, Thresholds, CSVHeaders
+from tests.factories.order import OrderFactory
+
+def write_with_csv_writer(orders):
+    csv_file = io.StringIO(newline="")
+    csv_writer = csv.writer(csv_file)
+    csv_writer.writerow(CSVHeaders.HEADERS)
+    for order in orders:
+        csv_writer.writerow(build_csv_row(order))
+        if is_high_value_order(order):
+            csv_writer.writerow(CSVHeaders.HIGH_VALUE_NOTE)
+    return csv_file.getvalue()
+
+def write_with_block_writer(orders, block_size=1 << 20):
+    csv_file = io.StringIO(newline="")
+    block_writer = CSVBlockWriter(csv_file, block_size=block_size)
+    block_writer.write_header()
+    for order in orders:
+        block_writer.write_order(order)
+    block_writer.flush()
+    return csv_file.getvalue()
+
+class TestCSVBlockWriter:
+    def test_should_match_csv_writer_output_for_regular_orders(self):
+        # Arrange
+        orders = [
+            OrderFactory.create_type_a_order(id=1, amount=12.5, flag=True),
+            OrderFactory.create_type_a_order(id=2, amount=Thresholds.HIGH_VALUE_ORDER + 0.01),
+            OrderFactory.create_type_a_order(id=3, amount=0.1 + 0.2, status=OrderStatus.PENDING.value)
+        ]
+
+        # Act & Assert
+        assert write_with_block_writer(orders) == write_with_csv_writer(orders)
+
+    def test_should_match_csv_writer_output_for_unusual_values(self):
+        # Arrange
+        orders = [
+            OrderFactory.create_order(id="7,8", type='A "quoted"', amount=None, flag=None),
+            OrderFactory.create_order(id=9, type="line\nbreak", amount=1e20, flag=1, status="a\rb"),
+            OrderFactory.create_order(id=10, type="A", amount=-5, flag="Yes", priority="x,y"),
+            OrderFactory.create_order(id=11, type="A", amount=True, flag=False, priority=None)
+        ]
+
+        # Act & Assert
+        assert write_with_block_writer(orders) == write_with_csv_writer(orders)
+
+    def test_should_write_large_blocks_instead_of_rows(self):
+        # Arrange
+        csv_file = Mock()
+        block_writer = CSVBlockWriter(csv_file, block_size=100)
+
+        # Act
+        for i in range(10):
+            block_writer.write_order(OrderFactory.create_type_a_order(id=i, amount=10.0))
+
+        # Assert
+        assert 0 < csv_file.write.call_count < 10
+        assert all(len(call.args[0]) >= 100 for call in csv_file.write.call_args_list)
+
+    def test_should_not_write_when_buffer_is_empty(self):
+        # Arrange
+        csv_file = Mock()
+        block_writer = CSVBlockWriter(csv_file)
+
+        # Act
+        block_writer.flush()
+
+        # Assert
+        csv_file.write.assert_not_called()
+
+    def test_should_raise_exception_when_block_size_is_zero(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="block_size must be at least 1"):
+            CSVBlockWriter(io.StringIO(), block_size=0)
+
+    def test_should_mark_buffered_orders_failed_when_block_write_fails(self):
+        # Arrange
+        export_session = CSVExportSession(lambda: "orders_type_A_1.csv")
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 4)]
+        mock_file = mock_open()
+        mock_file.return_value.write.side_effect = IOError("Disk full")
+
+        with patch("builtins.open", mock_file):
+            export_session.write_order(orders[0])
+            export_session.write_order(orders[1])
+            export_session._block_writer.block_size = 1
+
+            # Act
+            export_session.write_order(orders[2])
+
+        # Assert
+        assert all(order.status == OrderStatus.EXPORT_FAILED.value for order in orders)
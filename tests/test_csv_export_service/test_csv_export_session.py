@@ -0,0 +1,129 @@
+import pytest
+from unittest.mock import Mock, patch, mock_open
+from src.services.csv_export import CSVExportSession
+from src.constants import OrderStatus, Thresholds
+from tests.factories.order import OrderFactory
+
+class TestCSVExportSession:
+    @pytest.fixture
+    def csv_file_path(self, tmp_path):
+        return str(tmp_path / "orders_type_A_1.csv")
+
+    @pytest.fixture
+    def export_session(self, csv_file_path):
+        return CSVExportSession(lambda: csv_file_path)
+
+    def test_should_write_single_header_for_multiple_orders(self, export_session, csv_file_path):
+        # Arrange
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 4)]
+
+        # Act
+        for order in orders:
+            export_session.write_order(order)
+        export_session.close()
+
+        # Assert
+        with open(csv_file_path, newline="") as csv_file:
+            lines = csv_file.read().splitlines()
+        assert lines == [
+            "ID,Type,Amount,Flag,Status,Priority",
+            "1,A,100.0,false,,low",
+            "2,A,100.0,false,,low",
+            "3,A,100.0,false,,low"
+        ]
+        assert all(order.status == OrderStatus.EXPORTED.value for order in orders)
+
+    def test_should_write_high_value_note_after_high_value_order(self, export_session, csv_file_path):
+        # Arrange
+        orders = [
+            OrderFactory.create_type_a_order(id=1, amount=Thresholds.HIGH_VALUE_ORDER + 1),
+            OrderFactory.create_type_a_order(id=2, amount=Thresholds.HIGH_VALUE_ORDER)
+        ]
+
+        # Act
+        for order in orders:
+            export_session.write_order(order)
+        export_session.close()
+
+        # Assert
+        with open(csv_file_path, newline="") as csv_file:
+            lines = csv_file.read().splitlines()
+        assert lines[1].startswith("1,")
+        assert lines[2] == ",,,,Note,High value order"
+        assert lines[3].startswith("2,")
+        assert len(lines) == 4
+
+    def test_should_not_create_file_when_no_order_is_written(self, csv_file_path):
+        # Arrange
+        file_name_factory = Mock(return_value=csv_file_path)
+        export_session = CSVExportSession(file_name_factory)
+
+        # Act
+        export_session.flush()
+        export_session.close()
+
+        # Assert
+        file_name_factory.assert_not_called()
+        assert export_session.file_name is None
+
+    def test_should_open_file_only_once_for_multiple_orders(self, export_session):
+        # Arrange
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 4)]
+        mock_file = mock_open()
+
+        with patch("builtins.open", mock_file):
+            # Act
+            for order in orders:
+                export_session.write_order(order)
+            export_session.close()
+
+            # Assert
+            mock_file.assert_called_once()
+            mock_file.return_value.close.assert_called_once()
+
+    def test_should_set_export_failed_status_when_file_cannot_be_opened(self, export_session):
+        # Arrange
+        order = OrderFactory.create_type_a_order(id=1)
+        mock_file = mock_open()
+        mock_file.side_effect = IOError("File system error")
+
+        with patch("builtins.open", mock_file):
+            # Act
+            result = export_session.write_order(order)
+
+            # Assert
+            assert result.status == OrderStatus.EXPORT_FAILED.value
+
+    def test_should_set_export_failed_status_for_pending_orders_when_close_fails(self, export_session):
+        # Arrange
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 3)]
+        mock_file = mock_open()
+        mock_file.return_value.close.side_effect = IOError("Disk full")
+
+        with patch("builtins.open", mock_file):
+            # Act
+            for order in orders:
+                export_session.write_order(order)
+            export_session.close()
+
+            # Assert
+            assert all(order.status == OrderStatus.EXPORT_FAILED.value for order in orders)
+
+    def test_should_keep_exported_status_of_flushed_orders_when_later_flush_fails(self, export_session):
+        # Arrange
+        first_order = OrderFactory.create_type_a_order(id=1)
+        second_order = OrderFactory.create_type_a_order(id=2)
+        mock_file = mock_open()
+
+        with patch("builtins.open", mock_file):
+            export_session.write_order(first_order)
+            export_session.flush()
+            export_session.write_order(second_order)
+            mock_file.return_value.flush.side_effect = IOError("Disk full")
+
+            # Act
+            export_session.flush()
+
+            # Assert
+            assert first_order.status == OrderStatus.EXPORTED.value
+            assert second_order.status == OrderStatus.EXPORT_FAILED.value
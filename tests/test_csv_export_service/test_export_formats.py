@@ -0,0 +1,204 @@
+import gzip
+import zlib
+
+import pytest
+from unittest.mock import Mock, patch
+from src.services.csv_export import CSVExportSession, open_csv_export_file
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import ExportFormat, OrderStatus, Thresholds
+from tests.factories.order import OrderFactory
+
+def create_orders():
+    return [
+        OrderFactory.create_type_a_order(id=1, amount=Thresholds.HIGH_VALUE_ORDER + 1),
+        OrderFactory.create_type_a_order(id=2, amount=10.0, flag=True)
+    ]
+
+def write_orders(export_session, orders):
+    for order in orders:
+        export_session.write_order(order)
+    export_session.close()
+
+class TestExportFormats:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def orders(self):
+        return create_orders()
+
+    def test_should_write_same_csv_content_when_gzip_compressed(self, tmp_path, orders):
+        # Arrange
+        plain_path = str(tmp_path / "orders.csv")
+        gzip_path = str(tmp_path / "orders.csv.gz")
+
+        # Act
+        write_orders(CSVExportSession(lambda: plain_path), create_orders())
+        write_orders(CSVExportSession(lambda: gzip_path, ExportFormat.CSV_GZIP), orders)
+
+        # Assert
+        with open(plain_path, "rb") as plain_file, gzip.open(gzip_path, "rb") as gzip_file:
+            assert gzip_file.read() == plain_file.read()
+        assert all(order.status == OrderStatus.EXPORTED.value for order in orders)
+
+    def test_should_keep_gzip_file_readable_after_each_flush(self, tmp_path):
+        # Arrange
+        gzip_path = str(tmp_path / "orders.csv.gz")
+        export_session = CSVExportSession(lambda: gzip_path, ExportFormat.CSV_GZIP)
+
+        # Act
+        export_session.write_order(OrderFactory.create_type_a_order(id=1))
+        export_session.flush()
+
+        # Assert
+        with open(gzip_path, "rb") as gzip_file:
+            flushed = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(gzip_file.read())
+        assert flushed.splitlines()[1] == b"1,A,100.0,false,,low"
+        export_session.close()
+
+    def test_should_write_same_csv_content_when_zstd_compressed(self, tmp_path, orders):
+        # Arrange
+        zstandard = pytest.importorskip("zstandard")
+        plain_path = str(tmp_path / "orders.csv")
+        zstd_path = str(tmp_path / "orders.csv.zst")
+
+        # Act
+        write_orders(CSVExportSession(lambda: plain_path), create_orders())
+        write_orders(CSVExportSession(lambda: zstd_path, ExportFormat.CSV_ZSTD), orders)
+
+        # Assert
+        with open(plain_path, "rb") as plain_file, zstandard.open(zstd_path, "rb") as zstd_file:
+            assert zstd_file.read() == plain_file.read()
+
+    def test_should_keep_high_value_note_as_column_in_parquet(self, tmp_path, orders):
+        # Arrange
+        parquet = pytest.importorskip("pyarrow.parquet")
+        from src.services.parquet_export import ParquetExportSession
+        parquet_path = str(tmp_path / "orders.parquet")
+        export_session = ParquetExportSession(lambda: parquet_path, row_group_size=1)
+
+        # Act
+        write_orders(export_session, orders)
+
+        # Assert
+        parquet_file = parquet.ParquetFile(parquet_path)
+        assert parquet_file.metadata.num_row_groups == 2
+        assert parquet_file.read().to_pydict() == {
+            "ID": [1, 2],
+            "Type": ["A", "A"],
+            "Amount": [Thresholds.HIGH_VALUE_ORDER + 1, 10.0],
+            "Flag": [False, True],
+            "Status": [None, None],
+            "Priority": ["low", "low"],
+            "Note": ["High value order", None]
+        }
+        assert all(order.status == OrderStatus.EXPORTED.value for order in orders)
+
+    def test_should_set_export_failed_status_when_parquet_row_group_cannot_be_built(self, tmp_path):
+        # Arrange
+        pytest.importorskip("pyarrow")
+        from src.services.parquet_export import ParquetExportSession
+        export_session = ParquetExportSession(lambda: str(tmp_path / "orders.parquet"))
+        valid_order = OrderFactory.create_type_a_order(id=1)
+        invalid_order = OrderFactory.create_type_a_order(id=2)
+        invalid_order.id = "not a number"
+
+        # Act
+        export_session.write_order(valid_order)
+        export_session.write_order(invalid_order)
+        export_session.close()
+
+        # Assert
+        assert valid_order.status == OrderStatus.EXPORT_FAILED.value
+        assert invalid_order.status == OrderStatus.EXPORT_FAILED.value
+
+    @pytest.mark.parametrize("export_format, extension", [
+        (ExportFormat.CSV, ".csv"),
+        (ExportFormat.CSV_GZIP, ".csv.gz"),
+        (ExportFormat.CSV_ZSTD, ".csv.zst"),
+        (ExportFormat.PARQUET, ".parquet")
+    ])
+    def test_should_use_extension_of_export_format_in_file_name(self, mock_api_client, export_format, extension):
+        # Arrange
+        with patch("src.services.csv_export.zstandard", Mock()), \
+             patch("src.services.parquet_export.is_pyarrow_installed", return_value=True):
+            service = OrderProcessingService(mock_api_client, export_format=export_format)
+
+        # Act
+        file_name = service._create_csv_file_name(1, "A")
+
+        # Assert
+        assert file_name.startswith("orders_type_A_1_")
+        assert file_name.endswith(extension)
+        assert not file_name[:-len(extension)].endswith(".csv")
+
+    def test_should_raise_exception_when_zstandard_is_not_installed(self, mock_api_client):
+        # Act & Assert
+        with patch("src.services.csv_export.zstandard", None):
+            with pytest.raises(ValueError, match="requires the zstandard package"):
+                OrderProcessingService(mock_api_client, export_format=ExportFormat.CSV_ZSTD)
+
+    def test_should_raise_exception_when_pyarrow_is_not_installed(self, mock_api_client):
+        # Act & Assert
+        with patch("src.services.parquet_export.is_pyarrow_installed", return_value=False):
+            with pytest.raises(ValueError, match="requires the pyarrow package"):
+                OrderProcessingService(mock_api_client, export_format=ExportFormat.PARQUET)
+
+    def test_should_raise_exception_when_opening_parquet_as_csv(self, tmp_path):
+        # Act & Assert
+        with pytest.raises(ValueError, match="parquet is not a CSV export format"):
+            open_csv_export_file(str(tmp_path / "orders.parquet"), ExportFormat.PARQUET)
+
+    def test_should_export_all_type_a_orders_of_run_to_one_gzip_file(self, mock_api_client, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        service = OrderProcessingService(mock_api_client, export_format=ExportFormat.CSV_GZIP)
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 4)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        export_files = list(tmp_path.glob("*.csv.gz"))
+        assert len(export_files) == 1
+        with gzip.open(export_files[0], "rt", newline="") as gzip_file:
+            assert len(gzip_file.read().splitlines()) == 4
+
+    def test_should_export_single_order_in_configured_format(self, mock_api_client, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        service = OrderProcessingService(mock_api_client, export_format=ExportFormat.CSV_GZIP)
+        order = OrderFactory.create_type_a_order(id=1)
+
+        # Act
+        result = service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert len(list(tmp_path.glob("*.csv.gz"))) == 1
+
+    def test_should_export_all_type_a_orders_of_run_to_one_parquet_file(self, mock_api_client, tmp_path, monkeypatch):
+        # Arrange
+        parquet = pytest.importorskip("pyarrow.parquet")
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        service = OrderProcessingService(mock_api_client, export_format=ExportFormat.PARQUET)
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 4)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        export_files = list(tmp_path.glob("*.parquet"))
+        assert len(export_files) == 1
+        assert parquet.read_table(export_files[0]).column("ID").to_pylist() == [1, 2, 3]
@@ -0,0 +1,189 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.services.instrumentation import Instrumentation, InMemoryCollector
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import InstrumentationStages, APIResponseStatus
+from src.utils.response import APIResponse
+from src.utils.exceptions import DatabaseException
+from tests.factories.order import OrderFactory
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.events = []
+
+    def on_stage_start(self, stage):
+        self.events.append(("start", stage))
+
+    def on_stage_end(self, stage, elapsed):
+        self.events.append(("end", stage))
+
+class TestInMemoryCollector:
+    @pytest.fixture
+    def collector(self):
+        return InMemoryCollector()
+
+    def test_should_report_count_total_and_percentiles_per_stage(self, collector):
+        # Arrange
+        for elapsed in range(1, 101):
+            collector.on_stage_end("api_call", elapsed / 1000)
+        collector.on_stage_end("bulk_update", 0.5)
+
+        # Act
+        report = collector.report()
+
+        # Assert
+        assert report["api_call"]["count"] == 100
+        assert report["api_call"]["total"] == pytest.approx(5.05)
+        assert report["api_call"]["p50"] == pytest.approx(0.050)
+        assert report["api_call"]["p95"] == pytest.approx(0.095)
+        assert report["api_call"]["p99"] == pytest.approx(0.099)
+        assert report["bulk_update"] == {"count": 1, "total": 0.5, "p50": 0.5, "p95": 0.5, "p99": 0.5}
+
+    def test_should_bound_samples_but_keep_exact_count_and_total(self):
+        # Arrange
+        collector = InMemoryCollector(max_samples=10)
+
+        # Act
+        for _ in range(1000):
+            collector.on_stage_end("handle_order.C", 0.001)
+
+        # Assert
+        report = collector.report()
+        assert report["handle_order.C"]["count"] == 1000
+        assert report["handle_order.C"]["total"] == pytest.approx(1.0)
+        assert len(collector._stages["handle_order.C"].samples) == 10
+
+    def test_should_time_stage_with_span(self, collector):
+        # Act
+        with collector.span("export_flush"):
+            pass
+
+        # Assert
+        assert collector.report()["export_flush"]["count"] == 1
+
+    def test_should_end_span_when_stage_raises(self, collector):
+        # Act
+        with pytest.raises(ValueError):
+            with collector.span("get_orders"):
+                raise ValueError("boom")
+
+        # Assert
+        assert collector.report()["get_orders"]["count"] == 1
+
+    def test_should_forget_timings_when_reset(self, collector):
+        # Arrange
+        collector.on_stage_end("api_call", 0.1)
+
+        # Act
+        collector.reset()
+
+        # Assert
+        assert collector.report() == {}
+
+    def test_should_raise_exception_when_max_samples_is_zero(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="max_samples must be at least 1"):
+            InMemoryCollector(max_samples=0)
+
+class TestOrderProcessingInstrumentation:
+    @pytest.fixture
+    def mock_api_client(self):
+        mock_api_client = Mock(spec=APIClient)
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        return mock_api_client
+
+    def test_should_report_every_stage_of_process_orders(self, mock_api_client, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        instrumentation = RecordingInstrumentation()
+        service = OrderProcessingService(mock_api_client, instrumentation=instrumentation)
+        orders = [
+            OrderFactory.create_type_a_order(id=1),
+            OrderFactory.create_type_b_order(id=2),
+            OrderFactory.create_type_c_order(id=3)
+        ]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            assert instrumentation.events == [
+                ("start", InstrumentationStages.GET_ORDERS),
+                ("end", InstrumentationStages.GET_ORDERS),
+                ("start", "handle_order.A"),
+                ("end", "handle_order.A"),
+                ("start", "handle_order.B"),
+                ("start", InstrumentationStages.API_CALL),
+                ("end", InstrumentationStages.API_CALL),
+                ("end", "handle_order.B"),
+                ("start", "handle_order.C"),
+                ("end", "handle_order.C"),
+                ("start", InstrumentationStages.EXPORT_FLUSH),
+                ("end", InstrumentationStages.EXPORT_FLUSH),
+                ("start", InstrumentationStages.BULK_UPDATE),
+                ("end", InstrumentationStages.BULK_UPDATE)
+            ]
+
+    def test_should_time_failed_bulk_update(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        collector = InMemoryCollector()
+        service = OrderProcessingService(mock_api_client, instrumentation=collector)
+        orders = [OrderFactory.create_type_c_order(id=1)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=DatabaseException):
+            # Act
+            result = service.process_orders(user_id)
+
+            # Assert
+            assert result is False
+            assert collector.report()[InstrumentationStages.BULK_UPDATE]["count"] == 1
+
+    def test_should_time_each_page_fetch_when_streaming(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        collector = InMemoryCollector()
+        service = OrderProcessingService(mock_api_client, stream_page_size=2, instrumentation=collector)
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(5)]
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(orders)), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            service.process_orders(user_id)
+
+            # Assert
+            report = collector.report()
+            assert report[InstrumentationStages.GET_ORDERS]["count"] == 4
+            assert report[InstrumentationStages.BULK_UPDATE]["count"] == 3
+            assert report["handle_order.C"]["count"] == 5
+
+    def test_should_time_batch_api_calls(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        collector = InMemoryCollector()
+        service = OrderProcessingService(mock_api_client, api_batch_size=10, instrumentation=collector)
+        mock_api_client.call_api_batch.return_value = {}
+
+        # Act
+        service._dispatch_type_b_orders([OrderFactory.create_type_b_order(id=1)], user_id)
+
+        # Assert
+        assert collector.report()[InstrumentationStages.API_CALL]["count"] == 1
+
+    def test_should_not_create_spans_when_no_instrumentation_is_attached(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client)
+
+        with patch('src.services.instrumentation.Span') as mock_span:
+            # Act
+            service._process_order_by_type(OrderFactory.create_type_c_order(id=1), user_id)
+
+            # Assert
+            mock_span.assert_not_called()
@@ -0,0 +1,128 @@
+import threading
+import urllib.request
+
+import pytest
+from http.server import HTTPServer
+from src.utils.metrics import MetricsRegistry
+
+class TestMetricsRegistry:
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+
+    def test_should_render_counter_with_labels(self, registry):
+        # Arrange
+        counter = registry.counter("orders_total", "Orders", ("type", "status"))
+        counter.inc(1, "A", "exported")
+        counter.inc(2, "B", "processed")
+
+        # Act
+        text = registry.render()
+
+        # Assert
+        assert text == (
+            "# HELP orders_total Orders\n"
+            "# TYPE orders_total counter\n"
+            'orders_total{type="A",status="exported"} 1\n'
+            'orders_total{type="B",status="processed"} 2\n'
+        )
+
+    def test_should_render_cumulative_histogram_buckets(self, registry):
+        # Arrange
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value)
+
+        # Act
+        text = registry.render()
+
+        # Assert
+        assert 'latency_seconds_bucket{le="0.1"} 1\n' in text
+        assert 'latency_seconds_bucket{le="1"} 3\n' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4\n' in text
+        assert "latency_seconds_sum 4.05\n" in text
+        assert "latency_seconds_count 4\n" in text
+
+    def test_should_track_gauge_increments_and_decrements(self, registry):
+        # Arrange
+        gauge = registry.gauge("in_flight", "In flight")
+
+        # Act
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        # Assert
+        assert gauge.value() == 1
+        assert "in_flight 1\n" in registry.render()
+
+    def test_should_escape_label_values(self, registry):
+        # Arrange
+        counter = registry.counter("orders_total", "Orders", ("type",))
+
+        # Act
+        counter.inc(1, 'a"b\\c\nd')
+
+        # Assert
+        assert 'orders_total{type="a\\"b\\\\c\\nd"} 1' in registry.render()
+
+    def test_should_raise_exception_when_label_count_does_not_match(self, registry):
+        # Arrange
+        counter = registry.counter("orders_total", "Orders", ("type", "status"))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc(1, "A")
+
+    def test_should_raise_exception_when_counter_decreases(self, registry):
+        # Arrange
+        counter = registry.counter("orders_total", "Orders")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Counters can only increase"):
+            counter.inc(-1)
+
+    def test_should_raise_exception_when_metric_is_registered_twice(self, registry):
+        # Arrange
+        registry.counter("orders_total", "Orders")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("orders_total", "Orders")
+
+    def test_should_write_metrics_to_file(self, registry, tmp_path):
+        # Arrange
+        registry.counter("orders_total", "Orders").inc()
+        path = tmp_path / "orders.prom"
+
+        # Act
+        registry.write_to_file(str(path))
+
+        # Assert
+        assert path.read_text() == registry.render()
+        assert not (tmp_path / "orders.prom.tmp").exists()
+
+    def test_should_serve_metrics_over_http(self, registry):
+        # Arrange
+        registry.counter("orders_total", "Orders").inc(3)
+        server = HTTPServer(("127.0.0.1", 0), registry.http_handler_class())
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        try:
+            # Act
+            with urllib.request.urlopen(f"{base_url}/metrics") as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(f"{base_url}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # Assert
+        assert body == registry.render()
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert error.value.code == 404
@@ -0,0 +1,87 @@
+import pytest
+from src.entities.order import Order
+from src.entities.order_batch import OrderBatch
+from src.constants import OrderType, OrderStatus, OrderPriority
+from tests.factories.order import OrderFactory
+
+class TestOrderBatch:
+    @pytest.fixture
+    def orders(self):
+        return [
+            OrderFactory.create_type_a_order(id=1, amount=10.5, flag=True),
+            OrderFactory.create_type_b_order(id=2, status=OrderStatus.PENDING.value, priority=OrderPriority.HIGH.value),
+            OrderFactory.create_order(id=3, type=" c ", amount=-1.0)
+        ]
+
+    def test_should_not_have_instance_dict_on_order(self):
+        # Arrange
+        order = OrderFactory.create_type_a_order(id=1)
+
+        # Act & Assert
+        assert not hasattr(order, "__dict__")
+        with pytest.raises(AttributeError):
+            order.unknown_field = "value"
+
+    def test_should_round_trip_orders_through_columns(self, orders):
+        # Act
+        batch = OrderBatch.from_orders(orders)
+
+        # Assert
+        assert len(batch) == 3
+        for original, restored in zip(orders, batch):
+            assert isinstance(restored, Order)
+            assert (restored.id, restored.type, restored.amount, restored.flag, restored.status, restored.priority) == \
+                (original.id, original.type, original.amount, original.flag, original.status, original.priority)
+
+    def test_should_store_repeated_strings_as_small_codes(self, orders):
+        # Act
+        batch = OrderBatch.from_orders(orders)
+
+        # Assert
+        assert batch.type_codes.itemsize == 1
+        assert batch.status_codes.itemsize == 1
+        assert batch.types.decode(batch.type_codes[0]) == OrderType.TYPE_A.value
+        assert batch.statuses.decode(batch.status_codes[0]) is None
+        assert batch.types.decode(batch.type_codes[2]) == " c "
+
+    def test_should_write_processed_values_back_with_store(self, orders):
+        # Arrange
+        batch = OrderBatch.from_orders(orders)
+        order = batch.order_at(0)
+        order.status = OrderStatus.EXPORTED.value
+        order.priority = OrderPriority.HIGH.value
+
+        # Act
+        batch.store(0, order)
+
+        # Assert
+        stored = batch.order_at(0)
+        assert stored.status == OrderStatus.EXPORTED.value
+        assert stored.priority == OrderPriority.HIGH.value
+
+    def test_should_not_change_batch_when_view_is_not_stored(self, orders):
+        # Arrange
+        batch = OrderBatch.from_orders(orders)
+
+        # Act
+        batch.order_at(1).status = OrderStatus.ERROR.value
+
+        # Assert
+        assert batch.order_at(1).status == OrderStatus.PENDING.value
+
+    def test_should_raise_exception_when_amount_is_not_a_number(self):
+        # Arrange
+        order = OrderFactory.create_type_a_order(id=1)
+        order.amount = None
+
+        # Act & Assert
+        with pytest.raises(TypeError):
+            OrderBatch.from_orders([order])
+
+    def test_should_raise_exception_when_too_many_distinct_types_are_stored(self):
+        # Arrange
+        orders = [OrderFactory.create_order(id=i, type=f"T{i}") for i in range(300)]
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Too many distinct values"):
+            OrderBatch.from_orders(orders)
@@ -0,0 +1,59 @@
+import copy
+
+from src.constants import OrderStatus, OrderPriority
+from tests.factories.order import OrderFactory
+
+class TestOrderDirtyTracking:
+    def test_should_be_dirty_until_marked_clean(self):
+        # Arrange
+        order = OrderFactory.create_type_a_order(id=1)
+
+        # Act & Assert
+        assert order.is_dirty is True
+        order.mark_clean()
+        assert order.is_dirty is False
+
+    def test_should_be_dirty_when_status_changes(self):
+        # Arrange
+        order = OrderFactory.create_type_c_order(id=1, status=OrderStatus.IN_PROGRESS.value)
+        order.mark_clean()
+
+        # Act
+        order.status = OrderStatus.COMPLETED.value
+
+        # Assert
+        assert order.is_dirty is True
+
+    def test_should_be_dirty_when_priority_changes(self):
+        # Arrange
+        order = OrderFactory.create_type_c_order(id=1)
+        order.mark_clean()
+
+        # Act
+        order.priority = OrderPriority.HIGH.value
+
+        # Assert
+        assert order.is_dirty is True
+
+    def test_should_be_clean_when_value_is_set_back_to_stored_one(self):
+        # Arrange
+        order = OrderFactory.create_type_c_order(id=1, status=OrderStatus.COMPLETED.value)
+        order.mark_clean()
+
+        # Act
+        order.status = OrderStatus.PENDING.value
+        order.status = OrderStatus.COMPLETED.value
+
+        # Assert
+        assert order.is_dirty is False
+
+    def test_should_keep_stored_values_when_copied(self):
+        # Arrange
+        order = OrderFactory.create_type_c_order(id=1)
+        order.mark_clean()
+
+        # Act
+        order_copy = copy.copy(order)
+
+        # Assert
+        assert order_copy.is_dirty is False
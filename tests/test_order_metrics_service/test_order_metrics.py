@@ -0,0 +1,117 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_metrics import OrderMetrics
+from src.services.instrumentation import InMemoryCollector
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import InstrumentationStages, OrderStatus, APIResponseStatus
+from src.utils.response import APIResponse
+from src.utils.exceptions import DatabaseException
+from tests.factories.order import OrderFactory
+
+class TestOrderMetrics:
+    @pytest.fixture
+    def mock_api_client(self):
+        mock_api_client = Mock(spec=APIClient)
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        return mock_api_client
+
+    @pytest.fixture
+    def metrics(self):
+        return OrderMetrics()
+
+    def test_should_count_outcomes_by_type_and_status(self, mock_api_client, metrics, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        service = OrderProcessingService(mock_api_client, metrics=metrics)
+        orders = [
+            OrderFactory.create_type_a_order(id=1),
+            OrderFactory.create_type_b_order(id=2),
+            OrderFactory.create_type_c_order(id=3),
+            OrderFactory.create_type_c_order(id=4),
+            OrderFactory.create_order(id=5, type="X")
+        ]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        assert metrics.outcomes.value("A", OrderStatus.EXPORTED.value) == 1
+        assert metrics.outcomes.value("B", OrderStatus.PROCESSED.value) == 1
+        assert metrics.outcomes.value("C", OrderStatus.IN_PROGRESS.value) == 2
+        assert metrics.outcomes.value("unknown", OrderStatus.UNKNOWN_TYPE.value) == 1
+        assert metrics.bulk_update_size.count() == 1
+
+    def test_should_count_db_errors_when_bulk_update_fails(self, mock_api_client, metrics):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client, metrics=metrics)
+        orders = [OrderFactory.create_type_c_order(id=1)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=DatabaseException):
+            # Act
+            result = service.process_orders(user_id)
+
+        # Assert
+        assert result is False
+        assert metrics.outcomes.value("C", OrderStatus.DB_ERROR.value) == 1
+
+    def test_should_observe_api_latency_and_track_calls_in_flight(self, mock_api_client, metrics):
+        # Arrange
+        observed_in_flight = []
+
+        def mock_call_api(order_id):
+            observed_in_flight.append(metrics.api_in_flight.value())
+            return APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+        mock_api_client.call_api.side_effect = mock_call_api
+        service = OrderProcessingService(mock_api_client, metrics=metrics)
+
+        # Act
+        service._process_type_b_order(OrderFactory.create_type_b_order(id=1))
+        service._process_type_b_order(OrderFactory.create_type_b_order(id=2))
+
+        # Assert
+        assert observed_in_flight == [1, 1]
+        assert metrics.api_in_flight.value() == 0
+        assert metrics.api_latency.count() == 2
+
+    def test_should_record_one_bulk_update_per_streamed_flush(self, mock_api_client, metrics):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client, stream_page_size=2, metrics=metrics)
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(5)]
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(orders)), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            service.process_orders(user_id)
+
+        # Assert
+        assert metrics.bulk_update_size.count() == 3
+        assert 'orders_bulk_update_size_bucket{le="1"} 1' in metrics.registry.render()
+
+    def test_should_report_stages_to_both_instrumentation_and_metrics(self, mock_api_client, metrics):
+        # Arrange
+        collector = InMemoryCollector()
+        service = OrderProcessingService(mock_api_client, instrumentation=collector, metrics=metrics)
+
+        # Act
+        service._process_type_b_order(OrderFactory.create_type_b_order(id=1))
+
+        # Assert
+        assert collector.report()[InstrumentationStages.API_CALL]["count"] == 1
+        assert metrics.api_latency.count() == 1
+
+    def test_should_label_malformed_order_types_as_unknown(self, mock_api_client, metrics):
+        # Arrange
+        service = OrderProcessingService(mock_api_client, metrics=metrics)
+
+        # Act & Assert
+        assert service._order_type_label("") == "unknown"
+        assert service._order_type_label(None) == "unknown"
@@ -0,0 +1,68 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import OrderStatus
+from src.utils.exceptions import DatabaseException
+from tests.factories.order import OrderFactory
+
+class TestBulkUpdateOrders:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def order_processing_service(self, mock_api_client):
+        return OrderProcessingService(mock_api_client, db_chunk_size=2)
+
+    def test_should_raise_exception_when_db_chunk_size_is_zero(self, mock_api_client):
+        # Act & Assert
+        with pytest.raises(ValueError, match="db_chunk_size must be at least 1"):
+            OrderProcessingService(mock_api_client, db_chunk_size=0)
+
+    def test_should_mark_only_orders_of_failed_chunk_as_db_error(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_c_order(id=i, flag=True) for i in range(1, 5)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=[None, DatabaseException]):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is False
+            assert [order.status for order in orders] == [
+                OrderStatus.COMPLETED.value,
+                OrderStatus.COMPLETED.value,
+                OrderStatus.DB_ERROR.value,
+                OrderStatus.DB_ERROR.value
+            ]
+
+    def test_should_return_true_when_every_chunk_is_stored(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(1, 4)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            assert mock_bulk_update.call_count == 2
+            assert all(order.status == OrderStatus.IN_PROGRESS.value for order in orders)
+
+    def test_should_mark_all_orders_as_db_error_without_chunking(self, mock_api_client):
+        # Arrange
+        service = OrderProcessingService(mock_api_client)
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(1, 4)]
+
+        with patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=DatabaseException):
+            # Act
+            result = service._bulk_update_orders(orders)
+
+            # Assert
+            assert result is False
+            assert all(order.status == OrderStatus.DB_ERROR.value for order in orders)
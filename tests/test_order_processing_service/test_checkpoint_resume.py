@@ -0,0 +1,212 @@
+import asyncio
+import os
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.async_order_processing import AsyncOrderProcessingService
+from src.services.async_api_client import AsyncAPIClient
+from src.services.checkpoint_journal import CheckpointJournal
+from src.services.api_client import APIClient
+from src.constants import OrderStatus, APIResponseStatus
+from src.utils.response import APIResponse
+from src.utils.exceptions import APIException, DatabaseException
+from tests.factories.order import OrderFactory
+
+def create_orders():
+    return [
+        OrderFactory.create_type_a_order(id=1, amount=50.0),
+        OrderFactory.create_type_b_order(id=2, amount=50.0),
+        OrderFactory.create_type_c_order(id=3, flag=True)
+    ]
+
+class TestCheckpointResume:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def journal(self, tmp_path):
+        return CheckpointJournal(str(tmp_path / "journal"))
+
+    @pytest.fixture
+    def order_processing_service(self, mock_api_client, journal, tmp_path):
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        return OrderProcessingService(mock_api_client, checkpoint_journal=journal, export_dir=str(tmp_path / "exports"))
+
+    def test_should_keep_journal_when_bulk_update_fails(self, order_processing_service, journal):
+        # Arrange
+        user_id = 1
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=create_orders()), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=DatabaseException):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+        # Assert
+        assert result is False
+        assert journal.open(user_id) == {
+            1: (OrderStatus.EXPORTED.value, "low"),
+            2: (OrderStatus.PROCESSED.value, "low"),
+            3: (OrderStatus.COMPLETED.value, "low")
+        }
+
+    def test_should_resume_without_processing_journaled_orders_again(self, order_processing_service, mock_api_client, journal, tmp_path):
+        # Arrange
+        user_id = 1
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=create_orders()), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=DatabaseException):
+            order_processing_service.process_orders(user_id)
+        mock_api_client.call_api.reset_mock()
+        orders = create_orders()
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            mock_api_client.call_api.assert_not_called()
+            mock_bulk_update.assert_called_once_with(orders)
+            assert [order.status for order in orders] == [
+                OrderStatus.EXPORTED.value,
+                OrderStatus.PROCESSED.value,
+                OrderStatus.COMPLETED.value
+            ]
+            assert len(os.listdir(tmp_path / "exports")) == 1
+            assert not os.path.exists(journal.path(user_id))
+
+    def test_should_retry_transient_failure_on_resume(self, order_processing_service, mock_api_client, journal):
+        # Arrange
+        user_id = 1
+        mock_api_client.call_api.side_effect = APIException("Service unavailable")
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=create_orders()), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=DatabaseException):
+            order_processing_service.process_orders(user_id)
+        mock_api_client.call_api.side_effect = None
+        mock_api_client.call_api.reset_mock()
+        orders = create_orders()
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        mock_api_client.call_api.assert_called_once_with(2)
+        assert orders[1].status == OrderStatus.PROCESSED.value
+
+    def test_should_process_orders_missing_from_journal(self, order_processing_service, mock_api_client, journal):
+        # Arrange
+        user_id = 1
+        journal.open(user_id)
+        journal.record(user_id, [OrderFactory.create_type_b_order(id=2, status=OrderStatus.PENDING.value)])
+        journal.close(user_id)
+        orders = create_orders()
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        mock_api_client.call_api.assert_not_called()
+        assert orders[1].status == OrderStatus.PENDING.value
+        assert orders[0].status == OrderStatus.EXPORTED.value
+        assert orders[2].status == OrderStatus.COMPLETED.value
+
+    def test_should_not_journal_exported_orders_when_export_fails(self, order_processing_service, journal):
+        # Arrange
+        user_id = 1
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=create_orders()), \
+             patch('src.services.csv_export.CSVExportSession.close', side_effect=OSError):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+        # Assert
+        assert result is False
+        assert 1 not in journal.open(user_id)
+
+    def test_should_resume_streamed_run(self, mock_api_client, journal, tmp_path):
+        # Arrange
+        user_id = 1
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        service = OrderProcessingService(
+            mock_api_client, stream_page_size=2, checkpoint_journal=journal, export_dir=str(tmp_path)
+        )
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(create_orders())), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=[None, DatabaseException]):
+            service.process_orders(user_id)
+        mock_api_client.call_api.reset_mock()
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(create_orders())), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        mock_api_client.call_api.assert_not_called()
+
+    def test_should_resume_async_run(self, journal, tmp_path):
+        # Arrange
+        user_id = 1
+        api_client = Mock(spec=AsyncAPIClient)
+        api_client.call_api = AsyncMock(return_value=APIResponse(status=APIResponseStatus.SUCCESS.value, data=100))
+        service = AsyncOrderProcessingService(api_client, checkpoint_journal=journal, export_dir=str(tmp_path))
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=create_orders()), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=DatabaseException):
+            asyncio.run(service.process_orders(user_id))
+        api_client.call_api.reset_mock()
+        orders = create_orders()
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = asyncio.run(service.process_orders(user_id))
+
+        # Assert
+        assert result is True
+        api_client.call_api.assert_not_called()
+        assert orders[1].status == OrderStatus.PROCESSED.value
+        assert not os.path.exists(journal.path(user_id))
+
+    def test_should_keep_finished_api_calls_of_cancelled_async_run(self, journal, tmp_path):
+        # Arrange
+        user_id = 1
+        released = asyncio.Event()
+
+        async def call_api(order_id):
+            if order_id == 3:
+                await released.wait()
+            return APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+        api_client = Mock(spec=AsyncAPIClient)
+        api_client.call_api = AsyncMock(side_effect=call_api)
+        service = AsyncOrderProcessingService(api_client, checkpoint_journal=journal, export_dir=str(tmp_path))
+        orders = [OrderFactory.create_type_b_order(id=order_id, amount=50.0) for order_id in (1, 2, 3)]
+
+        async def run_with_timeout():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(service.process_orders(user_id), timeout=0.2)
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            asyncio.run(run_with_timeout())
+        api_client.call_api.reset_mock()
+        released.set()
+        orders = [OrderFactory.create_type_b_order(id=order_id, amount=50.0) for order_id in (1, 2, 3)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = asyncio.run(service.process_orders(user_id))
+
+        # Assert
+        assert result is True
+        api_client.call_api.assert_called_once_with(3)
+        assert all(order.status == OrderStatus.PROCESSED.value for order in orders)
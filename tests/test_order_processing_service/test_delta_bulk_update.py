@@ -0,0 +1,165 @@
+import asyncio
+
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.async_order_processing import AsyncOrderProcessingService
+from src.services.async_api_client import AsyncAPIClient
+from src.services.order_metrics import OrderMetrics
+from src.services.api_client import APIClient
+from src.constants import OrderStatus, OrderPriority
+from src.utils.exceptions import DatabaseException
+from tests.factories.order import OrderFactory
+
+def create_stored_order(id, status, priority=OrderPriority.LOW.value, flag=True):
+    order = OrderFactory.create_type_c_order(id=id, amount=100.0, flag=flag, status=status, priority=priority)
+    order.mark_clean()
+    return order
+
+class TestDeltaBulkUpdate:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def order_processing_service(self, mock_api_client):
+        return OrderProcessingService(mock_api_client)
+
+    def test_should_write_only_changed_orders(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        unchanged_order = create_stored_order(1, OrderStatus.COMPLETED.value)
+        changed_status_order = create_stored_order(2, OrderStatus.IN_PROGRESS.value)
+        changed_priority_order = create_stored_order(3, OrderStatus.COMPLETED.value, priority=OrderPriority.HIGH.value)
+        orders = [unchanged_order, changed_status_order, changed_priority_order]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders_with_result(user_id)
+
+            # Assert
+            mock_bulk_update.assert_called_once_with([changed_status_order, changed_priority_order])
+            assert result.success is True
+            assert result.processed_orders == 3
+            assert result.written_orders == 2
+            assert result.skipped_writes == 1
+
+    def test_should_skip_bulk_update_when_no_order_changed(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        orders = [create_stored_order(i, OrderStatus.COMPLETED.value) for i in range(1, 4)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            mock_bulk_update.assert_not_called()
+
+    def test_should_write_orders_that_were_never_marked_clean(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_c_order(id=1, flag=True, status=OrderStatus.COMPLETED.value)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders_with_result(user_id)
+
+            # Assert
+            mock_bulk_update.assert_called_once_with(orders)
+            assert result.skipped_writes == 0
+
+    def test_should_mark_orders_clean_after_successful_write(self, order_processing_service):
+        # Arrange
+        orders = [create_stored_order(1, OrderStatus.IN_PROGRESS.value)]
+        orders[0].status = OrderStatus.COMPLETED.value
+
+        with patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            order_processing_service._bulk_update_orders(orders)
+            order_processing_service._bulk_update_orders(orders)
+
+            # Assert
+            mock_bulk_update.assert_called_once()
+            assert orders[0].is_dirty is False
+
+    def test_should_keep_orders_of_failed_chunk_dirty(self, mock_api_client):
+        # Arrange
+        service = OrderProcessingService(mock_api_client, db_chunk_size=1)
+        orders = [create_stored_order(i, OrderStatus.IN_PROGRESS.value) for i in range(1, 3)]
+        for order in orders:
+            order.status = OrderStatus.COMPLETED.value
+
+        with patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=[None, DatabaseException]):
+            # Act
+            result = service._bulk_update_orders(orders)
+
+        # Assert
+        assert result is False
+        assert orders[0].is_dirty is False
+        assert orders[1].is_dirty is True
+        assert orders[1].status == OrderStatus.DB_ERROR.value
+
+    def test_should_count_skipped_writes_of_every_streamed_flush(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client, stream_page_size=2)
+        orders = [create_stored_order(i, OrderStatus.COMPLETED.value, flag=i % 2 == 0) for i in range(1, 6)]
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(orders)), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = service.process_orders_with_result(user_id)
+
+            # Assert
+            assert result.success is True
+            assert result.processed_orders == 5
+            assert result.written_orders == 3
+            assert result.skipped_writes == 2
+            assert mock_bulk_update.call_count == 3
+
+    def test_should_report_failure_when_no_orders_are_found(self, order_processing_service):
+        # Arrange
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=[]):
+            # Act
+            result = order_processing_service.process_orders_with_result(1)
+
+        # Assert
+        assert result.success is False
+        assert result.processed_orders == 0
+
+    def test_should_count_skipped_writes_in_metrics(self, mock_api_client):
+        # Arrange
+        metrics = OrderMetrics()
+        service = OrderProcessingService(mock_api_client, metrics=metrics)
+        orders = [create_stored_order(1, OrderStatus.COMPLETED.value), create_stored_order(2, OrderStatus.IN_PROGRESS.value)]
+        orders[1].status = OrderStatus.COMPLETED.value
+
+        with patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            service._bulk_update_orders(orders)
+
+        # Assert
+        assert metrics.skipped_writes.value() == 1
+        assert metrics.bulk_update_size.count() == 1
+        assert metrics.outcomes.value("C", OrderStatus.COMPLETED.value) == 2
+
+    def test_should_report_skipped_writes_from_async_service(self):
+        # Arrange
+        user_id = 1
+        service = AsyncOrderProcessingService(Mock(spec=AsyncAPIClient))
+        orders = [create_stored_order(1, OrderStatus.COMPLETED.value), create_stored_order(2, OrderStatus.IN_PROGRESS.value)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = asyncio.run(service.process_orders_with_result(user_id))
+
+            # Assert
+            assert result.success is True
+            assert result.skipped_writes == 1
+            mock_bulk_update.assert_called_once_with([orders[1]])
@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import OrderStatus, OrderPriority, APIResponseStatus
+from src.utils.response import APIResponse
+from src.utils.exceptions import APIException
+from tests.factories.order import OrderFactory
+
+class TestDispatchTypeBOrders:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def order_processing_service(self, mock_api_client):
+        return OrderProcessingService(mock_api_client, max_api_concurrency=4)
+
+    def test_should_raise_exception_when_max_api_concurrency_is_zero(self, mock_api_client):
+        # Act & Assert
+        with pytest.raises(ValueError, match="max_api_concurrency must be at least 1"):
+            OrderProcessingService(mock_api_client, max_api_concurrency=0)
+
+    def test_should_keep_statuses_when_dispatching_concurrently(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        orders = [
+            OrderFactory.create_type_b_order(id=1, amount=50.0),
+            OrderFactory.create_type_b_order(id=2, amount=50.0, flag=True),
+            OrderFactory.create_type_b_order(id=3, amount=150.0),
+            OrderFactory.create_type_b_order(id=4),
+            OrderFactory.create_type_b_order(id=5),
+            OrderFactory.create_type_b_order(id=6, amount=50.0)
+        ]
+
+        def mock_call_api(order_id):
+            if order_id == 4:
+                raise APIException("API Error")
+            if order_id == 5:
+                return APIResponse(status=APIResponseStatus.ERROR.value, data=None)
+            if order_id == 6:
+                return APIResponse(status=APIResponseStatus.SUCCESS.value, data=10)
+            return APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+        mock_api_client.call_api.side_effect = mock_call_api
+
+        # Act
+        result = order_processing_service._dispatch_type_b_orders(orders, user_id)
+
+        # Assert
+        assert result == orders
+        assert [order.status for order in orders] == [
+            OrderStatus.PROCESSED.value,
+            OrderStatus.PENDING.value,
+            OrderStatus.ERROR.value,
+            OrderStatus.API_FAILURE.value,
+            OrderStatus.API_ERROR.value,
+            OrderStatus.PENDING.value
+        ]
+
+    def test_should_not_exceed_max_api_concurrency(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client, max_api_concurrency=2)
+        orders = [OrderFactory.create_type_b_order(id=i) for i in range(10)]
+        lock = threading.Lock()
+        in_flight = {"current": 0, "peak": 0}
+
+        def mock_call_api(order_id):
+            with lock:
+                in_flight["current"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            time.sleep(0.01)
+            with lock:
+                in_flight["current"] -= 1
+            return APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+        mock_api_client.call_api.side_effect = mock_call_api
+
+        # Act
+        service._dispatch_type_b_orders(orders, user_id)
+
+        # Assert
+        assert mock_api_client.call_api.call_count == 10
+        assert 1 < in_flight["peak"] <= 2
+
+    def test_should_update_priority_of_dispatched_orders(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        order = OrderFactory.create_type_b_order(id=1, amount=500.0)
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+        # Act
+        order_processing_service._dispatch_type_b_orders([order], user_id)
+
+        # Assert
+        assert order.priority == OrderPriority.HIGH.value
+
+    def test_should_return_empty_list_when_no_orders_are_given(self, order_processing_service, mock_api_client):
+        # Act
+        result = order_processing_service._dispatch_type_b_orders([], 1)
+
+        # Assert
+        assert result == []
+        mock_api_client.call_api.assert_not_called()
+
+    def test_should_pass_orders_to_bulk_update_in_original_sequence(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        orders = [
+            OrderFactory.create_type_b_order(id=1),
+            OrderFactory.create_type_c_order(id=2),
+            OrderFactory.create_type_b_order(id=3),
+            OrderFactory.create_type_c_order(id=4, flag=True)
+        ]
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            mock_bulk_update.assert_called_once_with(orders)
+            assert orders[0].status == OrderStatus.PROCESSED.value
+            assert orders[1].status == OrderStatus.IN_PROGRESS.value
+            assert orders[2].status == OrderStatus.PROCESSED.value
+            assert orders[3].status == OrderStatus.COMPLETED.value
+
+    def test_should_call_api_sequentially_when_concurrency_is_not_configured(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client)
+        orders = [OrderFactory.create_type_b_order(id=1), OrderFactory.create_type_b_order(id=2)]
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'), \
+             patch.object(service, '_dispatch_type_b_orders', wraps=service._dispatch_type_b_orders) as mock_dispatch:
+            # Act
+            result = service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            mock_dispatch.assert_called_once_with([], user_id)
+            assert all(order.status == OrderStatus.PROCESSED.value for order in orders)
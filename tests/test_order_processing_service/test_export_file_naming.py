@@ -0,0 +1,183 @@
+import os
+
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.csv_export import CSVExportSession, temporary_file_name
+from src.services.api_client import APIClient
+from src.constants import ExportSharding, OrderStatus
+from tests.factories.order import OrderFactory
+
+class TestExportFileNaming:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    def test_should_create_unique_names_within_same_nanosecond(self, mock_api_client):
+        # Arrange
+        service = OrderProcessingService(mock_api_client)
+
+        with patch("src.services.order_processing.time.time_ns", return_value=1_700_000_000_000_000_000):
+            # Act
+            file_names = [service._create_csv_file_name(1, "A") for _ in range(100)]
+
+        # Assert
+        assert len(set(file_names)) == 100
+
+    def test_should_include_nanosecond_timestamp_and_process_id(self, mock_api_client):
+        # Arrange
+        service = OrderProcessingService(mock_api_client)
+
+        with patch("src.services.order_processing.time.time_ns", return_value=1_700_000_000_123_456_789):
+            # Act
+            file_name = service._create_csv_file_name(1, "A")
+
+        # Assert
+        assert file_name.startswith(f"orders_type_A_1_1700000000123456789_{os.getpid()}_")
+        assert file_name.endswith(".csv")
+
+    def test_should_place_files_in_export_dir(self, mock_api_client, tmp_path):
+        # Arrange
+        service = OrderProcessingService(mock_api_client, export_dir=str(tmp_path))
+
+        # Act
+        file_name = service._create_csv_file_name(1, "A")
+
+        # Assert
+        assert os.path.dirname(file_name) == str(tmp_path)
+        assert os.path.basename(file_name).startswith("orders_type_A_1_")
+
+    def test_should_shard_by_hash_of_user_id(self, mock_api_client, tmp_path):
+        # Arrange
+        service = OrderProcessingService(mock_api_client, export_dir=str(tmp_path), export_sharding=ExportSharding.HASH)
+
+        # Act
+        first = service._create_csv_file_name(1, "A")
+        second = service._create_csv_file_name(1, "A")
+        other_user = service._create_csv_file_name(2, "A")
+
+        # Assert
+        shard = os.path.relpath(os.path.dirname(first), tmp_path)
+        assert len(shard.split(os.sep)) == 2
+        assert all(len(part) == 2 for part in shard.split(os.sep))
+        assert os.path.dirname(second) == os.path.dirname(first)
+        assert os.path.dirname(other_user) != os.path.dirname(first)
+
+    def test_should_shard_by_utc_date(self, mock_api_client, tmp_path):
+        # Arrange
+        service = OrderProcessingService(mock_api_client, export_dir=str(tmp_path), export_sharding=ExportSharding.DATE)
+
+        with patch("src.services.order_processing.time.time_ns", return_value=1_715_904_000_000_000_000):
+            # Act
+            file_name = service._create_csv_file_name(1, "A")
+
+        # Assert
+        assert os.path.dirname(file_name) == os.path.join(str(tmp_path), "2024", "05", "17")
+
+    def test_should_export_to_sharded_directory_without_leaving_temporary_files(self, mock_api_client, tmp_path):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client, export_dir=str(tmp_path), export_sharding=ExportSharding.HASH)
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 4)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        files = [path for path in tmp_path.rglob("*") if path.is_file()]
+        assert len(files) == 1
+        assert files[0].name.startswith("orders_type_A_1_")
+        assert files[0].name.endswith(".csv")
+        assert all(order.status == OrderStatus.EXPORTED.value for order in orders)
+
+    def test_should_export_single_order_to_export_dir(self, mock_api_client, tmp_path):
+        # Arrange
+        service = OrderProcessingService(mock_api_client, export_dir=str(tmp_path))
+        order = OrderFactory.create_type_a_order(id=1)
+
+        # Act
+        result = service._process_type_a_order(order, 1)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert len(list(tmp_path.glob("orders_type_A_1_*.csv"))) == 1
+
+class TestAtomicExportSession:
+    @pytest.fixture
+    def csv_file_path(self, tmp_path):
+        return str(tmp_path / "orders_type_A_1.csv")
+
+    def test_should_hide_export_until_it_is_closed(self, csv_file_path):
+        # Arrange
+        export_session = CSVExportSession(lambda: csv_file_path, atomic=True)
+
+        # Act
+        export_session.write_order(OrderFactory.create_type_a_order(id=1))
+        export_session.flush()
+        visible_before_close = os.path.exists(csv_file_path)
+        export_session.close()
+
+        # Assert
+        assert visible_before_close is False
+        assert os.path.exists(csv_file_path)
+        assert not os.path.exists(temporary_file_name(csv_file_path))
+
+    def test_should_leave_temporary_file_when_close_fails(self, csv_file_path):
+        # Arrange
+        export_session = CSVExportSession(lambda: csv_file_path, atomic=True)
+        order = OrderFactory.create_type_a_order(id=1)
+        export_session.write_order(order)
+
+        with patch("src.services.csv_export.os.replace", side_effect=OSError("Rename failed")):
+            # Act
+            export_session.close()
+
+        # Assert
+        assert order.status == OrderStatus.EXPORT_FAILED.value
+        assert not os.path.exists(csv_file_path)
+        assert os.path.exists(temporary_file_name(csv_file_path))
+
+    def test_should_mark_flushed_orders_export_failed_when_publish_fails(self, csv_file_path):
+        # Arrange
+        export_session = CSVExportSession(lambda: csv_file_path, atomic=True)
+        order = OrderFactory.create_type_a_order(id=1)
+        export_session.write_order(order)
+        export_session.flush()
+
+        with patch("src.services.csv_export.os.replace", side_effect=OSError("Rename failed")):
+            # Act
+            published = export_session.close()
+
+        # Assert
+        assert published is False
+        assert order.status == OrderStatus.EXPORT_FAILED.value
+
+    def test_should_sync_file_and_directory_when_durable(self, csv_file_path):
+        # Arrange
+        export_session = CSVExportSession(lambda: csv_file_path, durable=True, atomic=True)
+        export_session.write_order(OrderFactory.create_type_a_order(id=1))
+
+        with patch("src.services.csv_export.sync_file") as mock_sync_file:
+            # Act
+            export_session.close()
+
+        # Assert
+        assert [call.args[0] for call in mock_sync_file.call_args_list] == [
+            temporary_file_name(csv_file_path),
+            os.path.dirname(csv_file_path)
+        ]
+
+    def test_should_create_missing_export_directory(self, tmp_path):
+        # Arrange
+        file_name = str(tmp_path / "3f" / "a2" / "orders_type_A_1.csv")
+        export_session = CSVExportSession(lambda: file_name, atomic=True)
+
+        # Act
+        export_session.write_order(OrderFactory.create_type_a_order(id=1))
+        export_session.close()
+
+        # Assert
+        assert os.path.exists(file_name)
@@ -0,0 +1,71 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.entities.order_batch import OrderBatch
+from src.constants import OrderStatus, OrderPriority, APIResponseStatus
+from src.utils.response import APIResponse
+from tests.factories.order import OrderFactory
+
+class TestProcessOrderBatch:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def order_processing_service(self, mock_api_client):
+        return OrderProcessingService(mock_api_client)
+
+    def build_orders(self):
+        return [
+            OrderFactory.create_type_a_order(id=1, amount=300.0),
+            OrderFactory.create_type_b_order(id=2, amount=50.0),
+            OrderFactory.create_type_c_order(id=3, amount=500.0, flag=True),
+            OrderFactory.create_type_c_order(id=4, amount=10.0),
+            OrderFactory.create_order(id=5, type="X", amount=250.0)
+        ]
+
+    def test_should_match_scalar_results_for_mixed_batch(self, order_processing_service, mock_api_client, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        scalar_orders = self.build_orders()
+        batch = OrderBatch.from_orders(self.build_orders())
+
+        # Act
+        for order in scalar_orders:
+            order_processing_service._process_single_order(order, user_id)
+        result = order_processing_service.process_order_batch(batch, user_id)
+
+        # Assert
+        assert result is batch
+        assert [(order.status, order.priority) for order in batch] == \
+            [(order.status, order.priority) for order in scalar_orders]
+
+    def test_should_not_call_handlers_for_type_c_orders(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        batch = OrderBatch.from_orders([OrderFactory.create_type_c_order(id=i, flag=True) for i in range(3)])
+
+        with patch.object(order_processing_service, '_process_single_order') as mock_process:
+            # Act
+            order_processing_service.process_order_batch(batch, user_id)
+
+            # Assert
+            mock_process.assert_not_called()
+            assert all(order.status == OrderStatus.COMPLETED.value for order in batch)
+
+    def test_should_export_type_a_orders_of_batch_into_single_file(self, order_processing_service, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        batch = OrderBatch.from_orders([OrderFactory.create_type_a_order(id=i) for i in range(3)])
+
+        # Act
+        order_processing_service.process_order_batch(batch, user_id)
+
+        # Assert
+        assert len(list(tmp_path.iterdir())) == 1
+        assert all(order.status == OrderStatus.EXPORTED.value for order in batch)
+        assert all(order.priority == OrderPriority.LOW.value for order in batch)
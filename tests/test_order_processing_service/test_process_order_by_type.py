@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.entities.order_batch import OrderBatch
+from src.constants import OrderType, OrderStatus, APIResponseStatus
+from src.utils.response import APIResponse
+from tests.factories.order import OrderFactory
+
+def process_type_d_order(order, user_id, export_session):
+    order.status = OrderStatus.PROCESSED.value
+
+class TestProcessOrderByType:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def order_processing_service(self, mock_api_client):
+        return OrderProcessingService(mock_api_client, order_type_handlers={"D": process_type_d_order})
+
+    def test_should_dispatch_registered_new_order_type(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        order = OrderFactory.create_order(id=1, type=" d ")
+
+        # Act
+        result = order_processing_service._process_order_by_type(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.PROCESSED.value
+
+    def test_should_register_order_type_after_service_creation(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client)
+        handler = Mock()
+        order = OrderFactory.create_order(id=1, type="E")
+        service.order_type_registry.register("E", handler)
+
+        # Act
+        service._process_order_by_type(order, user_id)
+
+        # Assert
+        handler.assert_called_once_with(order, user_id, None)
+
+    def test_should_pass_export_session_to_handler(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        handler = Mock()
+        export_session = Mock()
+        service = OrderProcessingService(mock_api_client, order_type_handlers={OrderType.TYPE_A: handler})
+        order = OrderFactory.create_type_a_order(id=1)
+
+        # Act
+        service._process_order_by_type(order, user_id, export_session)
+
+        # Assert
+        handler.assert_called_once_with(order, user_id, export_session)
+
+    def test_should_use_patched_builtin_handler_method(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        order = OrderFactory.create_type_c_order(id=1)
+
+        with patch.object(order_processing_service, '_process_type_c_order') as mock_process:
+            # Act
+            order_processing_service._process_order_by_type(order, user_id)
+
+            # Assert
+            mock_process.assert_called_once_with(order)
+
+    def test_should_not_defer_type_b_orders_when_handler_is_replaced(self, mock_api_client):
+        # Arrange
+        handler = Mock()
+        service = OrderProcessingService(
+            mock_api_client,
+            max_api_concurrency=4,
+            order_type_handlers={OrderType.TYPE_B: handler}
+        )
+        order = OrderFactory.create_type_b_order(id=1)
+
+        # Act & Assert
+        assert service._should_defer_api_call(order) is False
+
+    def test_should_use_replaced_type_c_handler_in_batch_processing(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(
+            mock_api_client,
+            order_type_handlers={OrderType.TYPE_C: process_type_d_order}
+        )
+        batch = OrderBatch.from_orders([OrderFactory.create_type_c_order(id=1, flag=True)])
+
+        # Act
+        service.process_order_batch(batch, user_id)
+
+        # Assert
+        assert batch.order_at(0).status == OrderStatus.PROCESSED.value
+
+    def test_should_process_new_order_type_during_process_orders(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_order(id=1, type="D"), OrderFactory.create_order(id=2, type="X")]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            mock_bulk_update.assert_called_once_with(orders)
+            assert orders[0].status == OrderStatus.PROCESSED.value
+            assert orders[1].status == OrderStatus.UNKNOWN_TYPE.value
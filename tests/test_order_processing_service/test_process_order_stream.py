@@ -0,0 +1,188 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import OrderStatus
+from src.utils.exceptions import DatabaseException
+from tests.factories.order import OrderFactory
+
+class TestProcessOrderStream:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def order_processing_service(self, mock_api_client):
+        return OrderProcessingService(mock_api_client, stream_page_size=2)
+
+    def test_should_raise_exception_when_stream_page_size_is_zero(self, mock_api_client):
+        # Act & Assert
+        with pytest.raises(ValueError, match="stream_page_size must be at least 1"):
+            OrderProcessingService(mock_api_client, stream_page_size=0)
+
+    def test_should_raise_exception_when_bulk_update_flush_size_is_zero(self, mock_api_client):
+        # Act & Assert
+        with pytest.raises(ValueError, match="bulk_update_flush_size must be at least 1"):
+            OrderProcessingService(mock_api_client, stream_page_size=2, bulk_update_flush_size=0)
+
+    def test_should_flush_bulk_updates_every_page_size_orders(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(1, 6)]
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(orders)) as mock_iter, \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            mock_iter.assert_called_once_with(user_id, 2)
+            assert [call.args[0] for call in mock_bulk_update.call_args_list] == [
+                orders[0:2], orders[2:4], orders[4:5]
+            ]
+
+    def test_should_use_bulk_update_flush_size_when_configured(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client, stream_page_size=2, bulk_update_flush_size=3)
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(1, 6)]
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(orders)), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            assert [len(call.args[0]) for call in mock_bulk_update.call_args_list] == [3, 2]
+
+    def test_should_consume_orders_lazily(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        consumed = []
+
+        def order_stream():
+            for i in range(1, 5):
+                consumed.append(i)
+                yield OrderFactory.create_type_c_order(id=i)
+
+        def mock_bulk_update(orders):
+            # The next page must not have been pulled before this chunk is flushed
+            assert len(consumed) <= orders[-1].id + 1
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=order_stream()), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=mock_bulk_update):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            assert consumed == [1, 2, 3, 4]
+
+    def test_should_return_false_when_stream_is_empty(self, order_processing_service):
+        # Arrange
+        user_id = 1
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter([])), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is False
+            mock_bulk_update.assert_not_called()
+
+    def test_should_mark_only_failed_chunk_as_db_error(self, order_processing_service):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_c_order(id=i, flag=True) for i in range(1, 5)]
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(orders)), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=[DatabaseException, None]):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is False
+            assert [order.status for order in orders] == [
+                OrderStatus.DB_ERROR.value,
+                OrderStatus.DB_ERROR.value,
+                OrderStatus.COMPLETED.value,
+                OrderStatus.COMPLETED.value
+            ]
+
+    def test_should_export_each_streamed_chunk_into_a_published_file(self, order_processing_service, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 6)]
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(orders)), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        csv_files = sorted(tmp_path.iterdir())
+        assert len(csv_files) == 3
+        assert all(csv_file.name.startswith("orders_type_A_1_") for csv_file in csv_files)
+        assert [len(csv_file.read_text().splitlines()) for csv_file in csv_files] == [3, 3, 2]
+        assert all(order.status == OrderStatus.EXPORTED.value for order in orders)
+
+    def test_should_return_false_and_mark_chunk_export_failed_when_publish_fails(self, order_processing_service, tmp_path, monkeypatch):
+        # Arrange
+        user_id = 1
+        monkeypatch.chdir(tmp_path)
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 4)]
+        statuses_at_bulk_update = []
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', return_value=iter(orders)), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders',
+                   side_effect=lambda orders: statuses_at_bulk_update.append([order.status for order in orders])), \
+             patch('src.services.csv_export.os.replace', side_effect=OSError("rename failed")):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+        # Assert
+        assert result is False
+        assert statuses_at_bulk_update == [
+            [OrderStatus.EXPORT_FAILED.value] * 2,
+            [OrderStatus.EXPORT_FAILED.value]
+        ]
+        assert not list(tmp_path.glob("*.csv"))
+
+    def test_should_return_false_when_repository_stream_fails(self, order_processing_service):
+        # Arrange
+        user_id = 1
+
+        with patch('src.repositories.order.OrderRepository.iter_orders_by_user', side_effect=DatabaseException):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is False
+
+    def test_should_stream_prefetched_pages_when_prefetch_is_enabled(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        service = OrderProcessingService(mock_api_client, stream_page_size=2, prefetch_pages=True)
+        orders = [OrderFactory.create_type_c_order(id=i, flag=True) for i in range(1, 4)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user_page',
+                   side_effect=[orders[0:2], orders[2:3]]) as mock_get_page, \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            assert [call.args[1:] for call in mock_get_page.call_args_list] == [(None, 2), (2, 2)]
+            assert [call.args[0] for call in mock_bulk_update.call_args_list] == [orders[0:2], orders[2:3]]
+            assert all(order.status == OrderStatus.COMPLETED.value for order in orders)
+
+    def test_should_raise_exception_when_prefetch_is_enabled_without_stream_page_size(self, mock_api_client):
+        # Act & Assert
+        with pytest.raises(ValueError, match="prefetch_pages requires stream_page_size"):
+            OrderProcessingService(mock_api_client, prefetch_pages=True)
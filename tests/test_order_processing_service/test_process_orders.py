@@ -15,6 +15,12 @@ class TestProcessOrders:
     def order_processing_service(self, mock_api_client):
         return OrderProcessingService(mock_api_client)
 
+    @pytest.fixture(autouse=True)
+    def export_directory(self, tmp_path, monkeypatch):
+        # Every run exports to a uniquely named file, keep them out of the working tree
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
     def test_should_process_all_orders_successfully_when_multiple_orders_exist(self, order_processing_service):
         # Arrange
         user_id = 1
@@ -230,4 +236,42 @@ class TestProcessOrders:
             result = order_processing_service.process_orders(user_id)
 
             # Assert
-            assert result is False 
\ No newline at end of file
+            assert result is False
+
+    def test_should_export_all_type_a_orders_into_single_file(self, order_processing_service, export_directory):
+        # Arrange
+        user_id = 1
+        orders = [
+            OrderFactory.create_type_a_order(id=1),
+            OrderFactory.create_type_c_order(id=2),
+            OrderFactory.create_type_a_order(id=3, amount=1000.0)
+        ]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        csv_files = list(export_directory.iterdir())
+        assert len(csv_files) == 1
+        lines = csv_files[0].read_text().splitlines()
+        assert lines[0] == "ID,Type,Amount,Flag,Status,Priority"
+        assert [line.split(",")[0] for line in lines[1:]] == ["1", "3", ""]
+        assert orders[0].status == OrderStatus.EXPORTED.value
+        assert orders[2].status == OrderStatus.EXPORTED.value
+
+    def test_should_not_create_export_file_when_no_type_a_orders_exist(self, order_processing_service, export_directory):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_c_order(id=1)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+        # Assert
+        assert result is True
+        assert list(export_directory.iterdir()) == []
@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.single_flight import SingleFlight, FileLockSingleFlight
+from src.services.api_client import APIClient
+from src.constants import APIResponseStatus
+from src.utils.response import APIResponse
+from tests.factories.order import OrderFactory
+
+class TestProcessOrdersSingleFlight:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    def test_should_share_one_run_between_concurrent_calls_for_same_user(self, mock_api_client):
+        # Arrange
+        user_id = 1
+        single_flight = SingleFlight()
+        service = OrderProcessingService(mock_api_client, single_flight=single_flight)
+        release = threading.Event()
+        mock_api_client.call_api.side_effect = lambda order_id: release.wait(5) and APIResponse(
+            status=APIResponseStatus.SUCCESS.value, data=100
+        )
+        results = []
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user',
+                   side_effect=lambda user_id: [OrderFactory.create_type_b_order(id=1)]) as mock_get_orders, \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            threads = [threading.Thread(target=lambda: results.append(service.process_orders(user_id))) for _ in range(3)]
+            # Act
+            for thread in threads:
+                thread.start()
+            while single_flight.shared_calls < 2:
+                time.sleep(0.001)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+            # Assert
+            assert results == [True, True, True]
+            mock_get_orders.assert_called_once_with(user_id)
+            mock_api_client.call_api.assert_called_once_with(1)
+            mock_bulk_update.assert_called_once()
+
+    def test_should_run_each_user_separately(self, mock_api_client):
+        # Arrange
+        service = OrderProcessingService(mock_api_client, single_flight=SingleFlight())
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user',
+                   side_effect=lambda user_id: [OrderFactory.create_type_c_order(id=user_id)]) as mock_get_orders, \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            results = [service.process_orders(1), service.process_orders(2)]
+
+            # Assert
+            assert results == [True, True]
+            assert mock_get_orders.call_count == 2
+
+    def test_should_return_failed_result_when_lock_dir_cannot_be_created(self, mock_api_client, tmp_path):
+        # Arrange
+        blocking_file = tmp_path / "file"
+        blocking_file.write_text("")
+        service = OrderProcessingService(mock_api_client, single_flight=FileLockSingleFlight(str(blocking_file / "locks")))
+
+        # Act
+        result = service.process_orders_with_result(1)
+
+        # Assert
+        assert result.success is False
@@ -16,6 +16,12 @@ class TestProcessSingleOrder:
     def order_processing_service(self, mock_api_client):
         return OrderProcessingService(mock_api_client)
 
+    @pytest.fixture(autouse=True)
+    def export_directory(self, tmp_path, monkeypatch):
+        # Every run exports to a uniquely named file, keep them out of the working tree
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
     def test_should_process_successfully_when_order_type_is_A(self, order_processing_service):
         # Arrange
         user_id = 1
@@ -1,78 +1,92 @@
 import pytest
-import os
-from unittest.mock import Mock, patch, mock_open, ANY
+from unittest.mock import Mock, patch, mock_open
 from src.services.order_processing import OrderProcessingService
 from src.services.api_client import APIClient
-from src.constants import OrderType, OrderStatus, Thresholds, CSVHeaders
+from src.constants import OrderStatus, Thresholds
 from tests.factories.order import OrderFactory
 
+def read_export_lines(export_directory):
+    export_files = list(export_directory.iterdir())
+    assert len(export_files) == 1
+    return export_files[0].read_text().splitlines()
+
 class TestProcessTypeAOrder:
     @pytest.fixture
     def mock_api_client(self):
         return Mock(spec=APIClient)
 
     @pytest.fixture
-    def order_processing_service(self, mock_api_client):
-        return OrderProcessingService(mock_api_client)
+    def export_directory(self, tmp_path):
+        return tmp_path
+
+    @pytest.fixture
+    def order_processing_service(self, mock_api_client, export_directory):
+        return OrderProcessingService(mock_api_client, export_dir=str(export_directory))
 
-    def test_should_create_csv_file_successfully_when_all_data_is_valid(self, order_processing_service):
+    def test_should_create_csv_file_successfully_when_all_data_is_valid(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1)
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
+
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        lines = read_export_lines(export_directory)
+        assert len(lines) >= 2  # At least headers and data
+        assert lines[0] == "ID,Type,Amount,Flag,Status,Priority"
+
+    def test_should_publish_export_without_leaving_temporary_file(self, order_processing_service, export_directory):
+        # Arrange
+        user_id = 1
+        order = OrderFactory.create_type_a_order(id=1)
+
+        # Act
+        order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        export_files = [export_file.name for export_file in export_directory.iterdir()]
+        assert len(export_files) == 1
+        assert export_files[0].startswith("orders_type_A_1_")
+        assert export_files[0].endswith(".csv")
+
+    def test_should_set_export_failed_status_when_export_cannot_be_published(self, order_processing_service, export_directory):
+        # Arrange
+        user_id = 1
+        order = OrderFactory.create_type_a_order(id=1)
+
+        with patch("src.services.csv_export.os.replace", side_effect=OSError("Rename failed")):
             # Act
             result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify CSV headers were written
-            handle.write.assert_any_call(ANY)
-            write_calls = handle.write.call_args_list
-            assert len(write_calls) >= 2  # At least headers and data
-            assert write_calls[0][0][0].startswith('ID,Type,Amount,Flag,Status,Priority')
-
-    def test_should_add_high_value_note_when_amount_exceeds_threshold(self, order_processing_service):
+        # Assert
+        assert result.status == OrderStatus.EXPORT_FAILED.value
+        assert not list(export_directory.glob("*.csv"))
+
+    def test_should_add_high_value_note_when_amount_exceeds_threshold(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1, amount=Thresholds.HIGH_VALUE_ORDER + 1)
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify high value note was written
-            write_calls = handle.write.call_args_list
-            assert any('Note,High value order' in call[0][0] for call in write_calls)
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert ",,,,Note,High value order" in read_export_lines(export_directory)
 
-    def test_should_not_add_high_value_note_when_amount_below_threshold(self, order_processing_service):
+    def test_should_not_add_high_value_note_when_amount_below_threshold(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1, amount=Thresholds.HIGH_VALUE_ORDER - 1)
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify high value note was not written
-            write_calls = handle.write.call_args_list
-            assert not any('Note,High value order' in call[0][0] for call in write_calls)
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert not any("Note,High value order" in line for line in read_export_lines(export_directory))
 
     def test_should_set_export_failed_status_when_file_system_error_occurs(self, order_processing_service):
         # Arrange
@@ -94,7 +108,7 @@ class TestProcessTypeAOrder:
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1, amount=1000)
         mock_file = mock_open()
-        mock_file.return_value.__enter__().write.side_effect = IOError("CSV writing error")
+        mock_file.return_value.write.side_effect = IOError("CSV writing error")
 
         with patch("builtins.open", mock_file):
             # Act
@@ -103,157 +117,105 @@ class TestProcessTypeAOrder:
             # Assert
             assert result.status == OrderStatus.EXPORT_FAILED.value
             mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            assert handle.write.called
+            assert mock_file.return_value.write.called
 
     def test_should_handle_invalid_order_data_gracefully(self, order_processing_service):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1)
         order.amount = None  # Invalid data
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
 
-    def test_should_handle_amount_exactly_at_high_value_threshold(self, order_processing_service):
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+
+    def test_should_handle_amount_exactly_at_high_value_threshold(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1, amount=Thresholds.HIGH_VALUE_ORDER)
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify high value note was NOT written
-            write_calls = handle.write.call_args_list
-            assert not any('Note,High value order' in call[0][0] for call in write_calls)
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert not any("Note,High value order" in line for line in read_export_lines(export_directory))
 
-    def test_should_handle_maximum_allowed_amount(self, order_processing_service):
+    def test_should_handle_maximum_allowed_amount(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1, amount=float('inf'))
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify high value note was written
-            write_calls = handle.write.call_args_list
-            assert any('Note,High value order' in call[0][0] for call in write_calls)
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert any("Note,High value order" in line for line in read_export_lines(export_directory))
 
-    def test_should_handle_minimum_allowed_amount(self, order_processing_service):
+    def test_should_handle_minimum_allowed_amount(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1, amount=float('-inf'))
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify high value note was not written
-            write_calls = handle.write.call_args_list
-            assert not any('Note,High value order' in call[0][0] for call in write_calls)
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
 
-    def test_should_handle_zero_amount(self, order_processing_service):
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert not any("Note,High value order" in line for line in read_export_lines(export_directory))
+
+    def test_should_handle_zero_amount(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1, amount=0)
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify high value note was not written
-            write_calls = handle.write.call_args_list
-            assert not any('Note,High value order' in call[0][0] for call in write_calls)
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert not any("Note,High value order" in line for line in read_export_lines(export_directory))
 
-    def test_should_handle_negative_amount(self, order_processing_service):
+    def test_should_handle_negative_amount(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1, amount=-100)
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify high value note was not written
-            write_calls = handle.write.call_args_list
-            assert not any('Note,High value order' in call[0][0] for call in write_calls)
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert not any("Note,High value order" in line for line in read_export_lines(export_directory))
 
-    def test_should_handle_decimal_amount_values(self, order_processing_service):
+    def test_should_handle_decimal_amount_values(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1, amount=100.50)
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify order data was written with decimal amount
-            write_calls = handle.write.call_args_list
-            assert any('100.5' in call[0][0] for call in write_calls)
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
 
-    def test_should_write_csv_headers_correctly(self, order_processing_service):
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert read_export_lines(export_directory)[1].split(",")[2] == "100.5"
+
+    def test_should_write_csv_headers_correctly(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(id=1)
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify CSV headers were written first
-            write_calls = handle.write.call_args_list
-            assert write_calls[0][0][0].startswith('ID,Type,Amount,Flag,Status,Priority')
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        assert read_export_lines(export_directory)[0] == "ID,Type,Amount,Flag,Status,Priority"
 
-    def test_should_write_order_details_to_csv_correctly(self, order_processing_service):
+    def test_should_write_order_details_to_csv_correctly(self, order_processing_service, export_directory):
         # Arrange
         user_id = 1
         order = OrderFactory.create_type_a_order(
@@ -263,19 +225,12 @@ class TestProcessTypeAOrder:
             status=OrderStatus.PENDING.value,
             priority="HIGH"
         )
-        mock_file = mock_open()
-        
-        with patch("builtins.open", mock_file):
-            # Act
-            result = order_processing_service._process_type_a_order(order, user_id)
 
-            # Assert
-            assert result.status == OrderStatus.EXPORTED.value
-            mock_file.assert_called_once()
-            handle = mock_file.return_value.__enter__()
-            
-            # Verify order details were written correctly with original status
-            write_calls = handle.write.call_args_list
-            order_data = write_calls[1][0][0].strip()  # Second write call contains order data
-            expected_data = f"{order.id},{order.type},{order.amount},{str(order.flag).lower()},{OrderStatus.PENDING.value},{order.priority}"
-            assert order_data == expected_data 
\ No newline at end of file
+        # Act
+        result = order_processing_service._process_type_a_order(order, user_id)
+
+        # Assert
+        assert result.status == OrderStatus.EXPORTED.value
+        # The row keeps the status the order had before it was exported
+        expected_data = f"{order.id},{order.type},{order.amount},{str(order.flag).lower()},{OrderStatus.PENDING.value},{order.priority}"
+        assert read_export_lines(export_directory)[1] == expected_data
@@ -0,0 +1,154 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import OrderStatus, OrderPriority, APIResponseStatus
+from src.utils.response import APIResponse
+from tests.factories.order import OrderFactory
+
+class TestProcessTypeBBatch:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def order_processing_service(self, mock_api_client):
+        return OrderProcessingService(mock_api_client, api_batch_size=2)
+
+    def test_should_raise_exception_when_api_batch_size_is_zero(self, mock_api_client):
+        # Act & Assert
+        with pytest.raises(ValueError, match="api_batch_size must be at least 1"):
+            OrderProcessingService(mock_api_client, api_batch_size=0)
+
+    def test_should_set_statuses_from_batch_responses(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        orders = [
+            OrderFactory.create_type_b_order(id=1, amount=50.0),
+            OrderFactory.create_type_b_order(id=2, amount=50.0, flag=True)
+        ]
+        mock_api_client.call_api_batch.return_value = {
+            1: APIResponse(status=APIResponseStatus.SUCCESS.value, data=100),
+            2: APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        }
+
+        # Act
+        result = order_processing_service._process_type_b_batch(orders, user_id)
+
+        # Assert
+        assert result == orders
+        assert orders[0].status == OrderStatus.PROCESSED.value
+        assert orders[1].status == OrderStatus.PENDING.value
+        mock_api_client.call_api_batch.assert_called_once_with([1, 2])
+        mock_api_client.call_api.assert_not_called()
+
+    def test_should_set_api_failure_only_for_missing_order_ids(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_b_order(id=1), OrderFactory.create_type_b_order(id=2)]
+        mock_api_client.call_api_batch.return_value = {
+            1: APIResponse(status=APIResponseStatus.ERROR.value, data=None)
+        }
+
+        # Act
+        order_processing_service._process_type_b_batch(orders, user_id)
+
+        # Assert
+        assert orders[0].status == OrderStatus.API_ERROR.value
+        assert orders[1].status == OrderStatus.API_FAILURE.value
+
+    def test_should_set_api_failure_only_for_malformed_response_data(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_b_order(id=1), OrderFactory.create_type_b_order(id=2)]
+        mock_api_client.call_api_batch.return_value = {
+            1: APIResponse(status=APIResponseStatus.SUCCESS.value, data="invalid_data"),
+            2: APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        }
+
+        # Act
+        order_processing_service._process_type_b_batch(orders, user_id)
+
+        # Assert
+        assert orders[0].status == OrderStatus.API_FAILURE.value
+        assert orders[1].status == OrderStatus.PROCESSED.value
+
+    @pytest.mark.parametrize("api_responses", [None, [], "unexpected"])
+    def test_should_set_api_failure_for_chunk_when_batch_result_is_not_a_mapping(self, order_processing_service, mock_api_client, api_responses):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_b_order(id=1), OrderFactory.create_type_b_order(id=2)]
+        mock_api_client.call_api_batch.return_value = api_responses
+
+        # Act
+        result = order_processing_service._process_type_b_batch(orders, user_id)
+
+        # Assert
+        assert result == orders
+        assert all(order.status == OrderStatus.API_FAILURE.value for order in orders)
+        assert all(order.priority == OrderPriority.LOW.value for order in orders)
+
+    def test_should_set_api_failure_for_chunk_when_batch_call_raises(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_b_order(id=1), OrderFactory.create_type_b_order(id=2)]
+        mock_api_client.call_api_batch.side_effect = TimeoutError("API request timed out")
+
+        # Act
+        order_processing_service._process_type_b_batch(orders, user_id)
+
+        # Assert
+        assert all(order.status == OrderStatus.API_FAILURE.value for order in orders)
+
+    def test_should_update_priority_of_batched_orders(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        order = OrderFactory.create_type_b_order(id=1, amount=500.0)
+        mock_api_client.call_api_batch.return_value = {}
+
+        # Act
+        order_processing_service._process_type_b_batch([order], user_id)
+
+        # Assert
+        assert order.priority == OrderPriority.HIGH.value
+
+    def test_should_fall_back_to_single_calls_when_batch_is_not_implemented(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        orders = [OrderFactory.create_type_b_order(id=i) for i in range(1, 6)]
+        mock_api_client.call_api_batch.side_effect = NotImplementedError
+        mock_api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+
+        # Act
+        order_processing_service._dispatch_type_b_orders(orders, user_id)
+
+        # Assert
+        mock_api_client.call_api_batch.assert_called_once()
+        assert mock_api_client.call_api.call_count == 5
+        assert all(order.status == OrderStatus.PROCESSED.value for order in orders)
+
+    def test_should_group_type_b_orders_into_chunks_during_process_orders(self, order_processing_service, mock_api_client):
+        # Arrange
+        user_id = 1
+        orders = [
+            OrderFactory.create_type_b_order(id=1),
+            OrderFactory.create_type_c_order(id=2),
+            OrderFactory.create_type_b_order(id=3),
+            OrderFactory.create_type_b_order(id=4)
+        ]
+        mock_api_client.call_api_batch.side_effect = lambda order_ids: {
+            order_id: APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+            for order_id in order_ids
+        }
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_processing_service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            mock_bulk_update.assert_called_once_with(orders)
+            assert [call.args[0] for call in mock_api_client.call_api_batch.call_args_list] == [[1, 3], [4]]
+            assert orders[1].status == OrderStatus.IN_PROGRESS.value
+            assert all(orders[i].status == OrderStatus.PROCESSED.value for i in (0, 2, 3))
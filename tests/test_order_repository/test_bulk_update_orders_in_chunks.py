@@ -0,0 +1,65 @@
+import pytest
+from unittest.mock import patch
+from src.repositories.order import OrderRepository
+from src.utils.exceptions import DatabaseException
+from tests.factories.order import OrderFactory
+
+class TestBulkUpdateOrdersInChunks:
+    @pytest.fixture
+    def order_repository(self):
+        return OrderRepository()
+
+    def test_should_update_each_chunk_in_its_own_call(self, order_repository):
+        # Arrange
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 6)]
+
+        with patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_repository.bulk_update_orders_in_chunks(orders, 2)
+
+            # Assert
+            assert [call.args[0] for call in mock_bulk_update.call_args_list] == [
+                orders[0:2], orders[2:4], orders[4:5]
+            ]
+            assert result.success is True
+            assert result.updated_orders == orders
+            assert result.failed_orders == []
+            assert result.failed_chunks == 0
+
+    def test_should_report_only_orders_of_failed_chunk(self, order_repository):
+        # Arrange
+        orders = [OrderFactory.create_type_a_order(id=i) for i in range(1, 6)]
+
+        with patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=[None, DatabaseException, None]):
+            # Act
+            result = order_repository.bulk_update_orders_in_chunks(orders, 2)
+
+            # Assert
+            assert result.success is False
+            assert result.updated_orders == orders[0:2] + orders[4:5]
+            assert result.failed_orders == orders[2:4]
+            assert result.failed_chunks == 1
+
+    def test_should_return_empty_result_when_no_orders_are_given(self, order_repository):
+        # Arrange
+        with patch('src.repositories.order.OrderRepository.bulk_update_orders') as mock_bulk_update:
+            # Act
+            result = order_repository.bulk_update_orders_in_chunks([], 2)
+
+            # Assert
+            assert result.success is True
+            mock_bulk_update.assert_not_called()
+
+    def test_should_raise_exception_when_chunk_size_is_zero(self, order_repository):
+        # Act & Assert
+        with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+            order_repository.bulk_update_orders_in_chunks([], 0)
+
+    def test_should_propagate_unexpected_errors(self, order_repository):
+        # Arrange
+        orders = [OrderFactory.create_type_a_order(id=1)]
+
+        with patch('src.repositories.order.OrderRepository.bulk_update_orders', side_effect=RuntimeError("boom")):
+            # Act & Assert
+            with pytest.raises(RuntimeError, match="boom"):
+                order_repository.bulk_update_orders_in_chunks(orders, 2)
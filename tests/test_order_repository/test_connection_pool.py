@@ -0,0 +1,226 @@
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+from src.repositories.connection_pool import ConnectionPool
+from src.repositories.sqlite_order import SQLiteOrderRepository, create_sqlite_connection_pool
+from src.constants import OrderStatus
+from src.utils.exceptions import DatabaseException
+from tests.factories.order import OrderFactory
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestConnectionPool:
+    @pytest.fixture
+    def connect(self):
+        return Mock(side_effect=lambda: Mock(name="connection"))
+
+    def test_should_open_min_size_connections_up_front(self, connect):
+        # Act
+        pool = ConnectionPool(connect, min_size=2, max_size=4)
+
+        # Assert
+        assert connect.call_count == 2
+        assert pool.stats() == {"size": 2, "idle": 2, "in_use": 0, "exhausted": 0}
+
+    def test_should_reuse_released_connection(self, connect):
+        # Arrange
+        pool = ConnectionPool(connect, min_size=0, max_size=2)
+
+        # Act
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        # Assert
+        assert first is second
+        assert connect.call_count == 1
+        assert pool.wait_time.count() == 2
+
+    def test_should_raise_database_exception_when_exhausted(self, connect):
+        # Arrange
+        pool = ConnectionPool(connect, min_size=0, max_size=1, acquire_timeout=0.01)
+        pool.acquire()
+
+        # Act & Assert
+        with pytest.raises(DatabaseException, match="exhausted"):
+            pool.acquire()
+        assert pool.exhausted.value() == 1
+
+    def test_should_hand_released_connection_to_waiting_caller(self, connect):
+        # Arrange
+        pool = ConnectionPool(connect, min_size=1, max_size=1, acquire_timeout=5.0)
+        connection = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=(connection,))
+
+        # Act
+        timer.start()
+        waited_for = pool.acquire()
+
+        # Assert
+        assert waited_for is connection
+        assert pool.wait_time.count() == 2
+
+    def test_should_replace_connection_failing_health_check(self, connect):
+        # Arrange
+        health_check = Mock(side_effect=[False, Exception("gone"), True])
+        pool = ConnectionPool(connect, min_size=3, max_size=3, health_check=health_check)
+        first, second, third = [connection for connection, _ in pool._idle]
+
+        # Act
+        connection = pool.acquire()
+
+        # Assert
+        assert connection is first
+        third.close.assert_called_once()
+        second.close.assert_called_once()
+        assert pool.discarded.value("unhealthy") == 2
+        assert pool.stats()["size"] == 1
+
+    def test_should_evict_idle_connections_above_min_size(self, connect):
+        # Arrange
+        clock = FakeClock()
+        pool = ConnectionPool(connect, min_size=1, max_size=3, idle_timeout=60.0, clock=clock)
+        connections = [pool.acquire() for _ in range(3)]
+        for connection in connections:
+            pool.release(connection)
+        clock.now = 61.0
+
+        # Act
+        evicted = pool.evict_idle()
+
+        # Assert
+        assert evicted == 2
+        assert pool.stats()["size"] == 1
+        assert pool.discarded.value("idle") == 2
+
+    def test_should_free_slot_when_connect_fails(self):
+        # Arrange
+        connect = Mock(side_effect=[Exception("refused"), Mock()])
+        pool = ConnectionPool(connect, min_size=0, max_size=1)
+
+        # Act & Assert
+        with pytest.raises(DatabaseException, match="refused"):
+            pool.acquire()
+        assert pool.acquire() is not None
+
+    def test_should_close_discarded_connection(self, connect):
+        # Arrange
+        pool = ConnectionPool(connect, min_size=0, max_size=1)
+        connection = pool.acquire()
+
+        # Act
+        pool.release(connection, discard=True)
+
+        # Assert
+        connection.close.assert_called_once()
+        assert pool.stats()["size"] == 0
+
+    def test_should_reject_acquire_after_close(self, connect):
+        # Arrange
+        pool = ConnectionPool(connect, min_size=1, max_size=2)
+        in_use = pool.acquire()
+        idle = pool.acquire()
+        pool.release(idle)
+
+        # Act
+        pool.close()
+        pool.release(in_use)
+
+        # Assert
+        idle.close.assert_called_once()
+        in_use.close.assert_called_once()
+        with pytest.raises(DatabaseException, match="closed"):
+            pool.acquire()
+
+    def test_should_never_open_more_than_max_size_connections(self, connect):
+        # Arrange
+        pool = ConnectionPool(connect, min_size=0, max_size=3)
+        peak = {"in_use": 0}
+        lock = threading.Lock()
+
+        def borrow():
+            for _ in range(20):
+                with pool.connection():
+                    with lock:
+                        peak["in_use"] = max(peak["in_use"], int(pool.in_use.value()))
+                    time.sleep(0.001)
+
+        threads = [threading.Thread(target=borrow) for _ in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        # Assert
+        assert connect.call_count <= 3
+        assert peak["in_use"] <= 3
+        assert pool.stats()["in_use"] == 0
+
+    def test_should_raise_value_error_when_min_size_exceeds_max_size(self, connect):
+        # Act & Assert
+        with pytest.raises(ValueError, match="min_size must be between 0 and max_size"):
+            ConnectionPool(connect, min_size=3, max_size=2)
+
+    def test_should_export_metrics_in_prometheus_format(self, connect):
+        # Arrange
+        pool = ConnectionPool(connect, min_size=1, max_size=1)
+
+        # Act
+        with pool.connection():
+            rendered = pool.registry.render()
+
+        # Assert
+        assert "order_db_pool_connections_in_use 1" in rendered
+        assert "order_db_pool_wait_seconds_count 1" in rendered
+
+class TestPooledSQLiteOrderRepository:
+    def test_should_read_and_update_through_pooled_connections(self, tmp_path):
+        # Arrange
+        pool = create_sqlite_connection_pool(str(tmp_path / "orders.db"), min_size=1, max_size=2)
+        repository = SQLiteOrderRepository(connection_pool=pool)
+        repository.insert_orders(1, [OrderFactory.create_type_c_order(id=i) for i in range(1, 5)])
+
+        # Act
+        streamed = repository.iter_orders_by_user(1, 2)
+        first_page = [next(streamed), next(streamed)]
+        for order in first_page:
+            order.status = OrderStatus.COMPLETED.value
+        repository.bulk_update_orders(first_page)
+        remaining = list(streamed)
+
+        # Assert
+        assert [order.id for order in remaining] == [3, 4]
+        assert [order.status for order in repository.get_orders_by_user(1)] == [
+            OrderStatus.COMPLETED.value, OrderStatus.COMPLETED.value, None, None
+        ]
+        assert pool.stats()["in_use"] == 0
+        assert pool.stats()["size"] == 2
+        pool.close()
+
+    def test_should_raise_database_exception_when_pool_is_exhausted(self, tmp_path):
+        # Arrange
+        pool = create_sqlite_connection_pool(str(tmp_path / "orders.db"), max_size=1, acquire_timeout=0.01)
+        repository = SQLiteOrderRepository(connection_pool=pool)
+        repository.insert_orders(1, [OrderFactory.create_type_c_order(id=i) for i in range(1, 3)])
+        streamed = repository.iter_orders_by_user(1, 1)
+        next(streamed)
+
+        # Act & Assert
+        with pytest.raises(DatabaseException, match="exhausted"):
+            repository.get_orders_by_user(1)
+        pool.close()
+
+    def test_should_reject_pool_for_in_memory_database(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="cannot be pooled"):
+            create_sqlite_connection_pool(":memory:")
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+from unittest.mock import patch
+from src.repositories.order import OrderRepository
+from src.utils.exceptions import DatabaseException
+from tests.factories.order import OrderFactory
+
+def paged(orders):
+    def get_orders_by_user_page(user_id, after_id, page_size):
+        remaining = [order for order in orders if after_id is None or order.id > after_id]
+        return remaining[:page_size]
+    return get_orders_by_user_page
+
+class TestIterOrdersByUserPrefetched:
+    @pytest.fixture
+    def order_repository(self):
+        return OrderRepository()
+
+    def test_should_stream_every_page_using_last_id_as_cursor(self, order_repository):
+        # Arrange
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(1, 6)]
+
+        with patch.object(order_repository, 'get_orders_by_user_page', side_effect=paged(orders)) as mock_get_page:
+            # Act
+            result = list(order_repository.iter_orders_by_user_prefetched(1, 2))
+
+            # Assert
+            assert result == orders
+            assert [call.args for call in mock_get_page.call_args_list] == [(1, None, 2), (1, 2, 2), (1, 4, 2)]
+
+    def test_should_not_fetch_after_short_page(self, order_repository):
+        # Arrange
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(1, 5)]
+
+        with patch.object(order_repository, 'get_orders_by_user_page', side_effect=paged(orders)) as mock_get_page:
+            # Act
+            list(order_repository.iter_orders_by_user_prefetched(1, 3))
+
+            # Assert
+            assert mock_get_page.call_count == 2
+
+    def test_should_fetch_next_page_while_current_page_is_consumed(self, order_repository):
+        # Arrange
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(1, 5)]
+        second_page_fetched = threading.Event()
+        fetch_threads = []
+
+        def get_orders_by_user_page(user_id, after_id, page_size):
+            fetch_threads.append(threading.current_thread())
+            if after_id is not None:
+                second_page_fetched.set()
+            return paged(orders)(user_id, after_id, page_size)
+
+        with patch.object(order_repository, 'get_orders_by_user_page', side_effect=get_orders_by_user_page):
+            streamed = order_repository.iter_orders_by_user_prefetched(1, 2)
+
+            # Act
+            first_order = next(streamed)
+
+            # Assert
+            assert first_order is orders[0]
+            assert second_page_fetched.wait(5)
+            assert all(thread is not threading.current_thread() for thread in fetch_threads)
+            assert list(streamed) == orders[1:]
+
+    def test_should_raise_database_exception_when_page_fails(self, order_repository):
+        # Arrange
+        orders = [OrderFactory.create_type_c_order(id=i) for i in range(1, 3)]
+        pages = [orders, DatabaseException("connection lost")]
+
+        with patch.object(order_repository, 'get_orders_by_user_page', side_effect=pages):
+            streamed = order_repository.iter_orders_by_user_prefetched(1, 2)
+
+            # Act & Assert
+            assert [next(streamed), next(streamed)] == orders
+            with pytest.raises(DatabaseException, match="connection lost"):
+                next(streamed)
+
+    def test_should_raise_value_error_when_page_size_is_zero(self, order_repository):
+        # Act & Assert
+        with pytest.raises(ValueError, match="page_size must be at least 1"):
+            order_repository.iter_orders_by_user_prefetched(1, 0)
@@ -0,0 +1,197 @@
+import pytest
+from unittest.mock import Mock
+from src.repositories.sqlite_order import SQLiteOrderRepository
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import OrderStatus, OrderPriority, APIResponseStatus
+from src.utils.response import APIResponse
+from src.utils.exceptions import DatabaseException
+from tests.factories.order import OrderFactory
+
+class TestSQLiteOrderRepository:
+    @pytest.fixture
+    def order_repository(self):
+        repository = SQLiteOrderRepository()
+        yield repository
+        repository.close()
+
+    def test_should_load_inserted_orders_of_user_in_id_order(self, order_repository):
+        # Arrange
+        order_repository.insert_orders(1, [
+            OrderFactory.create_type_b_order(id=3, amount=12.5, flag=True),
+            OrderFactory.create_type_a_order(id=1, amount=250.0)
+        ])
+        order_repository.insert_orders(2, [OrderFactory.create_type_c_order(id=2)])
+
+        # Act
+        orders = order_repository.get_orders_by_user(1)
+
+        # Assert
+        assert [(order.id, order.type, order.amount, order.flag) for order in orders] == [
+            (1, "A", 250.0, False),
+            (3, "B", 12.5, True)
+        ]
+        assert all(order.is_dirty is False for order in orders)
+
+    def test_should_use_user_id_index(self, order_repository):
+        # Act
+        plan = order_repository._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id, type, amount, flag, status, priority FROM orders WHERE user_id = ? ORDER BY id",
+            (1,)
+        ).fetchall()
+
+        # Assert
+        assert "idx_orders_user_id" in plan[0][-1]
+        assert all("TEMP B-TREE" not in row[-1] for row in plan)
+
+    def test_should_stream_orders_page_by_page(self, order_repository):
+        # Arrange
+        order_repository.insert_orders(1, [OrderFactory.create_type_c_order(id=i) for i in range(1, 6)])
+
+        # Act
+        orders = list(order_repository.iter_orders_by_user(1, 2))
+
+        # Assert
+        assert [order.id for order in orders] == [1, 2, 3, 4, 5]
+        assert all(order.is_dirty is False for order in orders)
+
+    def test_should_load_pages_after_cursor(self, order_repository):
+        # Arrange
+        order_repository.insert_orders(1, [OrderFactory.create_type_c_order(id=i) for i in (2, 4, 6, 8, 10)])
+        order_repository.insert_orders(2, [OrderFactory.create_type_c_order(id=5)])
+
+        # Act
+        pages = [
+            order_repository.get_orders_by_user_page(1, None, 2),
+            order_repository.get_orders_by_user_page(1, 4, 2),
+            order_repository.get_orders_by_user_page(1, 8, 2)
+        ]
+
+        # Assert
+        assert [[order.id for order in page] for page in pages] == [[2, 4], [6, 8], [10]]
+        assert all(order.is_dirty is False for page in pages for order in page)
+
+    def test_should_seek_pages_through_user_id_index(self, order_repository):
+        # Act
+        plan = order_repository._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id, type, amount, flag, status, priority FROM orders "
+            "WHERE user_id = ? AND id > ? ORDER BY id LIMIT ?",
+            (1, 10, 100)
+        ).fetchall()
+
+        # Assert
+        assert "idx_orders_user_id (user_id=? AND" in plan[0][-1]
+        assert all("TEMP B-TREE" not in row[-1] for row in plan)
+
+    def test_should_stream_prefetched_pages_while_updating(self, order_repository):
+        # Arrange
+        order_repository.insert_orders(1, [OrderFactory.create_type_c_order(id=i) for i in range(1, 6)])
+
+        # Act
+        orders = []
+        for order in order_repository.iter_orders_by_user_prefetched(1, 2):
+            order.status = OrderStatus.COMPLETED.value
+            order_repository.bulk_update_orders([order])
+            orders.append(order)
+
+        # Assert
+        assert [order.id for order in orders] == [1, 2, 3, 4, 5]
+        assert all(order.status == OrderStatus.COMPLETED.value for order in order_repository.get_orders_by_user(1))
+
+    def test_should_store_bulk_updates(self, order_repository):
+        # Arrange
+        order_repository.insert_orders(1, [OrderFactory.create_type_c_order(id=i) for i in range(1, 3)])
+        orders = order_repository.get_orders_by_user(1)
+        for order in orders:
+            order.status = OrderStatus.COMPLETED.value
+            order.priority = OrderPriority.HIGH.value
+
+        # Act
+        result = order_repository.bulk_update_orders(orders)
+
+        # Assert
+        assert result is True
+        assert [(order.status, order.priority) for order in order_repository.get_orders_by_user(1)] == [
+            (OrderStatus.COMPLETED.value, OrderPriority.HIGH.value)
+        ] * 2
+
+    def test_should_roll_back_whole_bulk_update_on_failure(self, order_repository):
+        # Arrange
+        order_repository.insert_orders(1, [OrderFactory.create_type_c_order(id=i) for i in range(1, 3)])
+        order_repository._connection.execute(
+            "CREATE TRIGGER fail_order_2 BEFORE UPDATE ON orders WHEN NEW.id = 2 "
+            "BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+        )
+        orders = order_repository.get_orders_by_user(1)
+        for order in orders:
+            order.status = OrderStatus.COMPLETED.value
+
+        # Act & Assert
+        with pytest.raises(DatabaseException, match="rejected"):
+            order_repository.bulk_update_orders(orders)
+        assert [order.status for order in order_repository.get_orders_by_user(1)] == [None, None]
+
+    def test_should_raise_database_exception_when_connection_is_closed(self, order_repository):
+        # Arrange
+        order_repository.close()
+
+        # Act & Assert
+        with pytest.raises(DatabaseException):
+            order_repository.get_orders_by_user(1)
+
+    def test_should_raise_database_exception_when_order_id_exists(self, order_repository):
+        # Arrange
+        order_repository.insert_orders(1, [OrderFactory.create_type_c_order(id=1)])
+
+        # Act & Assert
+        with pytest.raises(DatabaseException):
+            order_repository.insert_orders(1, [OrderFactory.create_type_c_order(id=1)])
+
+    def test_should_update_single_order_status(self, order_repository):
+        # Arrange
+        order_repository.insert_orders(1, [OrderFactory.create_type_c_order(id=1)])
+
+        # Act
+        results = [
+            order_repository.update_order_status(1, OrderStatus.COMPLETED.value, OrderPriority.LOW.value),
+            order_repository.update_order_status(99, OrderStatus.COMPLETED.value, OrderPriority.LOW.value)
+        ]
+
+        # Assert
+        assert results == [True, False]
+
+    def test_should_use_wal_mode_for_database_files(self, tmp_path):
+        # Arrange
+        repository = SQLiteOrderRepository(str(tmp_path / "orders.db"))
+
+        # Act
+        journal_mode = repository._connection.execute("PRAGMA journal_mode").fetchone()[0]
+        repository.close()
+
+        # Assert
+        assert journal_mode == "wal"
+
+    def test_should_process_orders_end_to_end_while_streaming(self, order_repository, tmp_path):
+        # Arrange
+        api_client = Mock(spec=APIClient)
+        api_client.call_api.return_value = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        order_repository.insert_orders(1, [
+            OrderFactory.create_type_b_order(id=1),
+            OrderFactory.create_type_c_order(id=2, flag=True),
+            OrderFactory.create_type_c_order(id=3)
+        ])
+        service = OrderProcessingService(
+            api_client, stream_page_size=2, order_repository=order_repository, export_dir=str(tmp_path)
+        )
+
+        # Act
+        result = service.process_orders_with_result(1)
+
+        # Assert
+        assert result.success is True
+        assert result.written_orders == 3
+        assert [order.status for order in order_repository.get_orders_by_user(1)] == [
+            OrderStatus.PROCESSED.value,
+            OrderStatus.COMPLETED.value,
+            OrderStatus.IN_PROGRESS.value
+        ]
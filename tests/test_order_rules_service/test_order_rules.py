@@ -0,0 +1,120 @@
+import pytest
+from unittest.mock import Mock
+from src.services import order_rules
+from src.services.order_rules import (
+    compute_priorities,
+    compute_type_c_statuses,
+    apply_priorities,
+    apply_type_c_statuses
+)
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.entities.order_batch import OrderBatch
+from src.constants import OrderStatus, OrderPriority, Thresholds
+from tests.factories.order import OrderFactory
+
+BOUNDARY_AMOUNTS = [
+    Thresholds.HIGH_PRIORITY_ORDER - 0.01,
+    Thresholds.HIGH_PRIORITY_ORDER,
+    Thresholds.HIGH_PRIORITY_ORDER + 0.01,
+    0.0,
+    -100.0,
+    float('inf'),
+    float('-inf'),
+    float('nan')
+]
+
+class TestOrderRules:
+    @pytest.fixture(params=["numpy", "pure_python"])
+    def backend(self, request, monkeypatch):
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(order_rules, "numpy", None)
+        return request.param
+
+    @pytest.fixture
+    def order_processing_service(self):
+        return OrderProcessingService(Mock(spec=APIClient))
+
+    def test_should_match_scalar_priority_at_boundary_values(self, order_processing_service):
+        # Arrange
+        orders = [OrderFactory.create_type_c_order(id=i, amount=amount) for i, amount in enumerate(BOUNDARY_AMOUNTS)]
+
+        # Act
+        result = compute_priorities(BOUNDARY_AMOUNTS)
+
+        # Assert
+        assert result == [order_processing_service._update_order_priority(order).priority for order in orders]
+
+    def test_should_match_scalar_type_c_status(self, order_processing_service):
+        # Arrange
+        flags = [True, False, 1, 0]
+        orders = [OrderFactory.create_type_c_order(id=i, flag=flag) for i, flag in enumerate(flags)]
+
+        # Act
+        result = compute_type_c_statuses(flags)
+
+        # Assert
+        assert result == [order_processing_service._process_type_c_order(order).status for order in orders]
+
+    def test_should_raise_exception_like_scalar_code_when_amount_is_none(self):
+        # Act & Assert
+        with pytest.raises(TypeError):
+            compute_priorities([None])
+
+    def test_should_apply_priorities_to_batch_at_boundary_values(self, backend, order_processing_service):
+        # Arrange
+        orders = [OrderFactory.create_type_a_order(id=i, amount=amount) for i, amount in enumerate(BOUNDARY_AMOUNTS)]
+        batch = OrderBatch.from_orders(orders)
+
+        # Act
+        apply_priorities(batch)
+
+        # Assert
+        expected = [order_processing_service._update_order_priority(order).priority for order in orders]
+        assert [order.priority for order in batch] == expected
+
+    def test_should_apply_status_only_to_type_c_orders_in_batch(self, backend):
+        # Arrange
+        orders = [
+            OrderFactory.create_type_c_order(id=1, flag=True),
+            OrderFactory.create_type_c_order(id=2, flag=False),
+            OrderFactory.create_type_a_order(id=3, flag=True, status=OrderStatus.EXPORTED.value),
+            OrderFactory.create_order(id=4, type=" c ", flag=True),
+            OrderFactory.create_type_b_order(id=5, flag=False)
+        ]
+        batch = OrderBatch.from_orders(orders)
+
+        # Act
+        apply_type_c_statuses(batch)
+
+        # Assert
+        assert [order.status for order in batch] == [
+            OrderStatus.COMPLETED.value,
+            OrderStatus.IN_PROGRESS.value,
+            OrderStatus.EXPORTED.value,
+            OrderStatus.COMPLETED.value,
+            None
+        ]
+
+    def test_should_leave_batch_unchanged_when_it_has_no_type_c_orders(self, backend):
+        # Arrange
+        batch = OrderBatch.from_orders([OrderFactory.create_type_a_order(id=1)])
+
+        # Act
+        apply_type_c_statuses(batch)
+
+        # Assert
+        assert batch.order_at(0).status is None
+
+    def test_should_handle_empty_batch(self, backend):
+        # Arrange
+        batch = OrderBatch()
+
+        # Act
+        apply_priorities(batch)
+        apply_type_c_statuses(batch)
+
+        # Assert
+        assert len(batch) == 0
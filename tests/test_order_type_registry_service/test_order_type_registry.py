@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import Mock
+from src.services.order_type_registry import OrderTypeRegistry
+from src.constants import OrderType
+
+class TestOrderTypeRegistry:
+    @pytest.fixture
+    def registry(self):
+        return OrderTypeRegistry()
+
+    def test_should_return_handler_registered_for_order_type(self, registry):
+        # Arrange
+        handler = Mock()
+        registry.register(OrderType.TYPE_A, handler)
+
+        # Act
+        result = registry.get_handler("A")
+
+        # Assert
+        assert result is handler
+
+    def test_should_normalize_raw_type_before_lookup(self, registry):
+        # Arrange
+        handler = Mock()
+        registry.register(OrderType.TYPE_B, handler)
+
+        # Act & Assert
+        assert registry.get_handler(" b ") is handler
+        assert registry.get_handler("B\t") is handler
+
+    def test_should_register_new_order_type_by_value(self, registry):
+        # Arrange
+        handler = Mock()
+
+        # Act
+        registry.register(" d", handler)
+
+        # Assert
+        assert "D" in registry
+        assert registry.get_handler("d") is handler
+
+    def test_should_return_none_when_order_type_is_not_registered(self, registry):
+        # Act & Assert
+        assert registry.get_handler("X") is None
+        assert registry.get_handler("") is None
+
+    def test_should_remove_handler_when_unregistered(self, registry):
+        # Arrange
+        registry.register(OrderType.TYPE_C, Mock())
+
+        # Act
+        registry.unregister("c")
+
+        # Assert
+        assert OrderType.TYPE_C not in registry
+        assert registry.get_handler("C") is None
+
+    def test_should_raise_exception_when_registering_empty_order_type(self, registry):
+        # Act & Assert
+        with pytest.raises(ValueError, match="Order type cannot be empty"):
+            registry.register("  ", Mock())
+
+    def test_should_normalize_each_raw_type_only_once(self, registry):
+        # Act
+        first = registry.normalize(" a ")
+        second = registry.normalize(" a ")
+
+        # Assert
+        assert first == "A"
+        assert first is second
+        assert registry._normalized_types == {" a ": "A"}
+
+    def test_should_bound_normalization_cache(self, registry):
+        # Arrange
+        registry.MAX_CACHED_TYPES = 2
+
+        # Act
+        results = [registry.normalize(raw_type) for raw_type in ["a", "b", "c"]]
+
+        # Assert
+        assert results == ["A", "B", "C"]
+        assert len(registry._normalized_types) == 2
+
+    def test_should_raise_exception_when_raw_type_is_not_a_string(self, registry):
+        # Act & Assert
+        with pytest.raises(AttributeError):
+            registry.normalize(None)
@@ -0,0 +1,194 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.services.resilient_api_client import ResilientAPIClient, CircuitBreaker
+from src.services.order_processing import OrderProcessingService
+from src.services.api_client import APIClient
+from src.constants import OrderStatus, APIResponseStatus
+from src.utils.response import APIResponse
+from src.utils.exceptions import APIException, CircuitOpenException
+from tests.factories.order import OrderFactory
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestResilientAPIClient:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def circuit_breaker(self, clock):
+        return CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+
+    @pytest.fixture
+    def sleep(self):
+        return Mock()
+
+    @pytest.fixture
+    def resilient_api_client(self, mock_api_client, circuit_breaker, sleep):
+        return ResilientAPIClient(
+            mock_api_client,
+            max_retries=2,
+            base_delay=0.1,
+            max_delay=0.3,
+            jitter=0.5,
+            circuit_breaker=circuit_breaker,
+            sleep=sleep,
+            random_fn=lambda: 1.0
+        )
+
+    def test_should_return_response_when_retry_succeeds(self, resilient_api_client, mock_api_client, sleep):
+        # Arrange
+        response = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        mock_api_client.call_api.side_effect = [TimeoutError("API request timed out"), response]
+
+        # Act
+        result = resilient_api_client.call_api(1)
+
+        # Assert
+        assert result is response
+        assert mock_api_client.call_api.call_count == 2
+        sleep.assert_called_once_with(0.1)
+        assert resilient_api_client.retries == 1
+
+    def test_should_back_off_exponentially_up_to_max_delay(self, mock_api_client, sleep):
+        # Arrange
+        client = ResilientAPIClient(
+            mock_api_client,
+            max_retries=3,
+            base_delay=0.1,
+            max_delay=0.3,
+            jitter=0,
+            circuit_breaker=CircuitBreaker(failure_threshold=10),
+            sleep=sleep
+        )
+        mock_api_client.call_api.side_effect = ConnectionError("Network connection failed")
+
+        # Act
+        with pytest.raises(ConnectionError):
+            client.call_api(1)
+
+        # Assert
+        assert [call.args[0] for call in sleep.call_args_list] == pytest.approx([0.1, 0.2, 0.3])
+
+    def test_should_apply_jitter_to_delay(self, resilient_api_client, mock_api_client, sleep):
+        # Arrange
+        resilient_api_client._random = lambda: 0.0
+        mock_api_client.call_api.side_effect = [TimeoutError(), APIResponse(status="success", data=1)]
+
+        # Act
+        resilient_api_client.call_api(1)
+
+        # Assert
+        sleep.assert_called_once_with(pytest.approx(0.05))
+
+    def test_should_not_retry_exceptions_outside_retry_on(self, mock_api_client, sleep):
+        # Arrange
+        client = ResilientAPIClient(mock_api_client, retry_on=(TimeoutError,), sleep=sleep)
+        mock_api_client.call_api.side_effect = ValueError("Order ID does not exist")
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            client.call_api(1)
+        mock_api_client.call_api.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_should_open_circuit_after_consecutive_failures(self, resilient_api_client, mock_api_client, circuit_breaker):
+        # Arrange
+        mock_api_client.call_api.side_effect = APIException("API Error")
+
+        # Act
+        with pytest.raises(APIException):
+            resilient_api_client.call_api(1)
+        with pytest.raises(CircuitOpenException):
+            resilient_api_client.call_api(2)
+
+        # Assert
+        assert mock_api_client.call_api.call_count == 3
+        assert circuit_breaker.state == CircuitBreaker.OPEN
+        assert resilient_api_client.metrics() == {
+            "calls": 2,
+            "retries": 2,
+            "failures": 3,
+            "short_circuits": 1,
+            "circuit_state": CircuitBreaker.OPEN,
+            "circuit_opened": 1
+        }
+
+    def test_should_close_circuit_when_half_open_trial_succeeds(self, resilient_api_client, mock_api_client, circuit_breaker, clock):
+        # Arrange
+        mock_api_client.call_api.side_effect = APIException("API Error")
+        with pytest.raises(APIException):
+            resilient_api_client.call_api(1)
+        clock.now = 10
+        mock_api_client.call_api.side_effect = None
+        mock_api_client.call_api.return_value = APIResponse(status="success", data=1)
+
+        # Act
+        assert circuit_breaker.state == CircuitBreaker.HALF_OPEN
+        result = resilient_api_client.call_api(1)
+
+        # Assert
+        assert result.data == 1
+        assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+    def test_should_reopen_circuit_when_half_open_trial_fails(self, circuit_breaker, clock):
+        # Arrange
+        for _ in range(3):
+            circuit_breaker.record_failure()
+        clock.now = 10
+
+        # Act
+        assert circuit_breaker.allow_request() is True
+        assert circuit_breaker.allow_request() is False
+        circuit_breaker.record_failure()
+
+        # Assert
+        assert circuit_breaker.state == CircuitBreaker.OPEN
+        assert circuit_breaker.allow_request() is False
+        assert circuit_breaker.times_opened == 2
+
+    def test_should_not_count_missing_batch_support_as_failure(self, resilient_api_client, mock_api_client, sleep):
+        # Arrange
+        mock_api_client.call_api_batch.side_effect = NotImplementedError
+
+        # Act & Assert
+        with pytest.raises(NotImplementedError):
+            resilient_api_client.call_api_batch([1, 2])
+        assert resilient_api_client.failures == 0
+        sleep.assert_not_called()
+
+    def test_should_short_circuit_type_b_orders_to_api_failure_when_circuit_is_open(self, resilient_api_client, mock_api_client):
+        # Arrange
+        user_id = 1
+        mock_api_client.call_api.side_effect = APIException("API Error")
+        service = OrderProcessingService(resilient_api_client)
+        orders = [OrderFactory.create_type_b_order(id=i) for i in range(1, 4)]
+
+        with patch('src.repositories.order.OrderRepository.get_orders_by_user', return_value=orders), \
+             patch('src.repositories.order.OrderRepository.bulk_update_orders'):
+            # Act
+            result = service.process_orders(user_id)
+
+            # Assert
+            assert result is True
+            assert all(order.status == OrderStatus.API_FAILURE.value for order in orders)
+            assert mock_api_client.call_api.call_count == 3
+            assert resilient_api_client.short_circuits == 2
+
+    def test_should_raise_exception_when_configuration_is_invalid(self, mock_api_client):
+        # Act & Assert
+        with pytest.raises(ValueError, match="max_retries cannot be negative"):
+            ResilientAPIClient(mock_api_client, max_retries=-1)
+        with pytest.raises(ValueError, match="jitter must be between 0 and 1"):
+            ResilientAPIClient(mock_api_client, jitter=2)
+        with pytest.raises(ValueError, match="failure_threshold must be at least 1"):
+            CircuitBreaker(failure_threshold=0)
@@ -0,0 +1,265 @@
+import os
+import pickle
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+from src.services.single_flight import SingleFlight, FileLockSingleFlight, SingleFlightAPIClient
+from src.services.api_client import APIClient
+from src.constants import APIResponseStatus
+from src.utils.response import APIResponse
+from src.utils.exceptions import APIException
+
+def run_concurrently(functions):
+    results = [None] * len(functions)
+    errors = [None] * len(functions)
+
+    def run(index):
+        try:
+            results[index] = functions[index]()
+        except Exception as error:
+            errors[index] = error
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(len(functions))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+class TestSingleFlight:
+    def test_should_share_one_call_between_concurrent_callers(self):
+        # Arrange
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        def call():
+            return single_flight.do(1, compute)
+
+        def release_when_all_joined():
+            while single_flight.shared_calls < 3:
+                time.sleep(0.001)
+            release.set()
+
+        # Act
+        results, errors = run_concurrently([call, call, call, call, release_when_all_joined])
+
+        # Assert
+        assert results[:4] == ["result"] * 4
+        assert len(calls) == 1
+        assert single_flight.executions == 1
+        assert single_flight.in_flight() == 0
+
+    def test_should_raise_leader_exception_in_every_caller(self):
+        # Arrange
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def compute():
+            release.wait(5)
+            raise APIException("API Error")
+
+        def call():
+            return single_flight.do(1, compute)
+
+        def release_when_joined():
+            while single_flight.shared_calls < 1:
+                time.sleep(0.001)
+            release.set()
+
+        # Act
+        results, errors = run_concurrently([call, call, release_when_joined])
+
+        # Assert
+        assert all(isinstance(error, APIException) for error in errors[:2])
+
+    def test_should_run_again_once_flight_landed(self):
+        # Arrange
+        single_flight = SingleFlight()
+        compute = Mock(side_effect=[1, 2])
+
+        # Act
+        results = [single_flight.do("key", compute), single_flight.do("key", compute)]
+
+        # Assert
+        assert results == [1, 2]
+        assert single_flight.executions == 2
+
+    def test_should_not_share_calls_of_different_keys(self):
+        # Arrange
+        single_flight = SingleFlight()
+
+        # Act
+        results = [single_flight.do(key, lambda key=key: key * 10) for key in (1, 2)]
+
+        # Assert
+        assert results == [10, 20]
+
+    def test_should_be_picklable_without_flights_in_progress(self, tmp_path):
+        # Arrange
+        single_flight = FileLockSingleFlight(str(tmp_path))
+
+        # Act
+        copied = pickle.loads(pickle.dumps(single_flight))
+
+        # Assert
+        assert copied.lock_dir == str(tmp_path)
+        assert copied.do(1, lambda: "result") == "result"
+
+class TestFileLockSingleFlight:
+    def test_should_share_outcome_between_lock_holders(self, tmp_path):
+        # Arrange
+        # Separate instances take the lock through separate open files, like separate processes
+        leader = FileLockSingleFlight(str(tmp_path))
+        follower = FileLockSingleFlight(str(tmp_path))
+        started = threading.Event()
+        compute = Mock(side_effect=lambda: started.set() or time.sleep(0.05) or "result")
+
+        def follow():
+            started.wait(5)
+            return follower.do(1, compute)
+
+        # Act
+        results, errors = run_concurrently([lambda: leader.do(1, compute), follow])
+
+        # Assert
+        assert results == ["result", "result"]
+        assert compute.call_count == 1
+        assert follower.shared_calls == 1
+
+    def test_should_share_exception_between_lock_holders(self, tmp_path):
+        # Arrange
+        leader = FileLockSingleFlight(str(tmp_path))
+        follower = FileLockSingleFlight(str(tmp_path))
+        started = threading.Event()
+
+        def compute():
+            started.set()
+            time.sleep(0.05)
+            raise APIException("API Error")
+
+        def follow():
+            started.wait(5)
+            return follower.do(1, compute)
+
+        # Act
+        results, errors = run_concurrently([lambda: leader.do(1, compute), follow])
+
+        # Assert
+        assert isinstance(errors[0], APIException)
+        assert isinstance(errors[1], APIException)
+
+    def test_should_run_function_when_leader_left_no_outcome(self, tmp_path):
+        # Arrange
+        leader = FileLockSingleFlight(str(tmp_path))
+        follower = FileLockSingleFlight(str(tmp_path))
+        started = threading.Event()
+
+        def compute_unpicklable():
+            started.set()
+            time.sleep(0.05)
+            return lambda: None
+
+        def follow():
+            started.wait(5)
+            return follower.do(1, lambda: "own result")
+
+        # Act
+        results, errors = run_concurrently([lambda: leader.do(1, compute_unpicklable), follow])
+
+        # Assert
+        assert results[1] == "own result"
+        assert follower.executions == 1
+
+    def test_should_not_reuse_outcome_of_earlier_flight(self, tmp_path):
+        # Arrange
+        single_flight = FileLockSingleFlight(str(tmp_path))
+        single_flight.do(1, lambda: "first")
+
+        # Act
+        result = FileLockSingleFlight(str(tmp_path)).do(1, lambda: "second")
+
+        # Assert
+        assert result == "second"
+
+    def test_should_not_leave_files_in_lock_dir_once_flights_landed(self, tmp_path):
+        # Arrange
+        single_flight = FileLockSingleFlight(str(tmp_path))
+        follower = FileLockSingleFlight(str(tmp_path))
+        started = threading.Event()
+
+        def compute():
+            started.set()
+            time.sleep(0.05)
+            return "shared"
+
+        def follow():
+            started.wait(5)
+            return follower.do(0, compute)
+
+        # Act
+        for key in range(1, 6):
+            single_flight.do(key, lambda: key)
+        with pytest.raises(APIException):
+            single_flight.do(6, Mock(side_effect=APIException("API Error")))
+        results, errors = run_concurrently([lambda: single_flight.do(0, compute), follow])
+
+        # Assert
+        assert results == ["shared", "shared"]
+        assert os.listdir(tmp_path) == []
+
+    def test_should_run_function_when_dead_leader_left_lock_file(self, tmp_path):
+        # Arrange
+        single_flight = FileLockSingleFlight(str(tmp_path))
+        with open(single_flight._path(1), "wb") as lock_file:
+            lock_file.write(pickle.dumps((True, "stale")))
+
+        # Act
+        result = single_flight.do(1, lambda: "fresh")
+
+        # Assert
+        assert result == "fresh"
+        assert os.listdir(tmp_path) == []
+
+class TestSingleFlightAPIClient:
+    @pytest.fixture
+    def mock_api_client(self):
+        return Mock(spec=APIClient)
+
+    def test_should_share_concurrent_calls_for_same_order(self, mock_api_client):
+        # Arrange
+        client = SingleFlightAPIClient(mock_api_client)
+        release = threading.Event()
+        response = APIResponse(status=APIResponseStatus.SUCCESS.value, data=100)
+        mock_api_client.call_api.side_effect = lambda order_id: release.wait(5) and response
+
+        def release_when_joined():
+            while client.single_flight.shared_calls < 1:
+                time.sleep(0.001)
+            release.set()
+
+        # Act
+        results, errors = run_concurrently([lambda: client.call_api(1), lambda: client.call_api(1), release_when_joined])
+
+        # Assert
+        assert results[:2] == [response, response]
+        mock_api_client.call_api.assert_called_once_with(1)
+
+    def test_should_pass_batch_calls_through(self, mock_api_client):
+        # Arrange
+        client = SingleFlightAPIClient(mock_api_client)
+        mock_api_client.call_api_batch.return_value = {}
+
+        # Act
+        result = client.call_api_batch([1, 2])
+
+        # Assert
+        assert result == {}
+        mock_api_client.call_api_batch.assert_called_once_with([1, 2])